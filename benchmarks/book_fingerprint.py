@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from library.adapters.database.config import DatabaseConfig
+from library.adapters.database.tables import BOOK_FINGERPRINT
+from library.adapters.database.utils import create_engine
+
+SIZE = 200_000
+BATCH = 1_000
+
+SCHEMES = {
+    "title_year_author": (
+        "",
+        "title, year, author",
+    ),
+    "fingerprint": (
+        f", fingerprint bytea GENERATED ALWAYS AS ({BOOK_FINGERPRINT}) STORED",
+        "fingerprint",
+    ),
+}
+
+
+def make_rows(size: int) -> tuple[list[str], list[int], list[str]]:
+    titles = [
+        f"The Lord of the Rings: The Fellowship of the Ring, vol. {i}"
+        for i in range(size)
+    ]
+    years = [1954 + i % 70 for i in range(size)]
+    authors = [
+        f"J. R. R. Tolkien and the Fellowship, edition {i % 997}" for i in range(size)
+    ]
+    return titles, years, authors
+
+
+async def prepare(conn: AsyncConnection, name: str) -> None:
+    column, target = SCHEMES[name]
+    await conn.execute(text(f"DROP TABLE IF EXISTS bench_{name}"))
+    await conn.execute(
+        text(
+            f"CREATE TEMP TABLE bench_{name} ("
+            "id uuid PRIMARY KEY, title varchar(255) NOT NULL, "
+            "year integer NOT NULL, author varchar(255) NOT NULL, "
+            f"deleted_at timestamptz{column})"
+        )
+    )
+    await conn.execute(
+        text(
+            f"CREATE UNIQUE INDEX ix__bench_{name} ON bench_{name} ({target}) "
+            "WHERE deleted_at IS NULL"
+        )
+    )
+
+
+async def insert(
+    conn: AsyncConnection,
+    name: str,
+    rows: tuple[list[str], list[int], list[str]],
+) -> float:
+    _, target = SCHEMES[name]
+    stmt = text(
+        f"INSERT INTO bench_{name} (id, title, year, author) "
+        "SELECT gen_random_uuid(), * FROM unnest("
+        "CAST(:titles AS varchar[]), CAST(:years AS integer[]), "
+        "CAST(:authors AS varchar[])) "
+        f"ON CONFLICT ({target}) WHERE deleted_at IS NULL DO NOTHING"
+    )
+    titles, years, authors = rows
+    started_at = time.perf_counter()
+    for i in range(0, len(titles), BATCH):
+        await conn.execute(
+            stmt,
+            {
+                "titles": titles[i : i + BATCH],
+                "years": years[i : i + BATCH],
+                "authors": authors[i : i + BATCH],
+            },
+        )
+    return len(titles) / (time.perf_counter() - started_at)
+
+
+async def index_size(conn: AsyncConnection, name: str) -> int:
+    result = await conn.execute(text(f"SELECT pg_relation_size('ix__bench_{name}')"))
+    return result.scalar_one()
+
+
+async def main() -> None:
+    config = DatabaseConfig()
+    rows = make_rows(SIZE)
+    async with create_engine(
+        dsn=config.dsn,
+        debug=False,
+        pool_size=1,
+        pool_timeout=config.pool_timeout,
+        max_overflow=0,
+    ) as engine:
+        print(  # noqa: T201
+            f"{'index':>18} {'insert rows/s':>14} "
+            f"{'conflict rows/s':>16} {'index MiB':>10}"
+        )
+        async with engine.connect() as conn:
+            for name in SCHEMES:
+                await prepare(conn, name)
+                inserted = await insert(conn, name, rows)
+                conflicted = await insert(conn, name, rows)
+                size = await index_size(conn, name) / 2**20
+                print(  # noqa: T201
+                    f"{name:>18} {inserted:>14,.0f} {conflicted:>16,.0f} {size:>10.1f}"
+                )
+            await conn.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
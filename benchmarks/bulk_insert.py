@@ -0,0 +1,74 @@
+import asyncio
+import sys
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from library.adapters.database.config import DatabaseConfig
+from library.adapters.database.storages.book import BookStorage
+from library.adapters.database.uow import SqlalchemyUow
+from library.adapters.database.utils import create_engine, create_sessionmaker
+from library.domains.entities.book import CreateBook
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def make_books(size: int) -> list[CreateBook]:
+    return [
+        CreateBook(
+            title=f"The Lord of the Rings: The Fellowship of the Ring, vol. {i}",
+            year=1954 + i % 70,
+            author="J. R. R. Tolkien",
+        )
+        for i in range(size)
+    ]
+
+
+async def prepare(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    # The pool holds a single connection, so the temp table shadows the real
+    # books table for every session the storage opens
+    async with session_factory() as session:
+        await session.execute(
+            text("CREATE TEMP TABLE books (LIKE public.books INCLUDING ALL)")
+        )
+        await session.commit()
+
+
+async def measure(
+    session_factory: async_sessionmaker[AsyncSession],
+    books: list[CreateBook],
+    copy_threshold: int,
+) -> float:
+    async with session_factory() as session:
+        await session.execute(text("TRUNCATE TABLE pg_temp.books"))
+        await session.commit()
+    uow = SqlalchemyUow(session_factory=session_factory)
+    storage = BookStorage(uow=uow, copy_threshold=copy_threshold)
+    started_at = time.perf_counter()
+    async with uow:
+        await storage.save_bulk_books(books=books)
+    return time.perf_counter() - started_at
+
+
+async def main() -> None:
+    config = DatabaseConfig()
+    async with create_engine(
+        dsn=config.dsn,
+        debug=False,
+        pool_size=1,
+        pool_timeout=config.pool_timeout,
+        max_overflow=0,
+    ) as engine:
+        session_factory = create_sessionmaker(engine)
+        await prepare(session_factory)
+        print(f"{'rows':>8} {'unnest':>12} {'copy':>12}")  # noqa: T201
+        for size in SIZES:
+            books = make_books(size)
+            unnest = await measure(session_factory, books, copy_threshold=sys.maxsize)
+            copy = await measure(session_factory, books, copy_threshold=0)
+            print(f"{size:>8} {unnest:>10.3f} s {copy:>10.3f} s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+import pickle
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from library.application.serializers import CacheCodec
+from library.domains.entities.open_library import (
+    OpenLibraryBook,
+    OpenLibrarySearchResult,
+)
+
+NUMBER = 2_000
+
+
+def make_search_result(size: int = 100) -> OpenLibrarySearchResult:
+    return OpenLibrarySearchResult(
+        books=[
+            OpenLibraryBook(
+                key=f"/works/OL{1_000_000 + i}W",
+                title=f"The Lord of the Rings: The Fellowship of the Ring, vol. {i}",
+                authors=["J. R. R. Tolkien", f"Illustrator {i}"],
+            )
+            for i in range(size)
+        ],
+        total=5_000,
+        start=0,
+        offset=0,
+    )
+
+
+def measure(
+    name: str,
+    dumps: Callable[[Any], bytes],
+    loads: Callable[[bytes], Any],
+    value: Any,
+) -> None:
+    payload = dumps(value)
+    encode = timeit.timeit(lambda: dumps(value), number=NUMBER) / NUMBER
+    decode = timeit.timeit(lambda: loads(payload), number=NUMBER) / NUMBER
+    print(  # noqa: T201
+        f"{name:<10} {len(payload):>8} B "
+        f"{encode * 1e6:>10.1f} us {decode * 1e6:>10.1f} us"
+    )
+
+
+def main() -> None:
+    value = make_search_result()
+    codec = CacheCodec(OpenLibrarySearchResult)
+    print(f"{'serializer':<10} {'size':>10} {'encode':>13} {'decode':>13}")  # noqa: T201
+    measure(
+        "pickle",
+        lambda v: pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL),
+        pickle.loads,
+        value,
+    )
+    measure("msgspec", codec.dumps, codec.loads, value)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import timeit
+from collections.abc import Sequence
+
+import msgspec
+
+from library.adapters.open_library.client import decode_search_result
+from library.domains.entities.open_library import (
+    OpenLibraryBook,
+    OpenLibrarySearchResult,
+)
+
+NUMBER = 2_000
+
+
+class LegacyDocStruct(msgspec.Struct):
+    title: str
+    key: str
+    author_name: Sequence[str] | None = None
+
+
+class LegacySearchStruct(msgspec.Struct):
+    num_found: int
+    start: int
+    offset: int
+    docs: Sequence[LegacyDocStruct]
+
+
+def make_payload(size: int = 100, editions: bool = False) -> bytes:
+    docs = []
+    for i in range(size):
+        doc: dict = {
+            "key": f"/works/OL{1_000_000 + i}W",
+            "title": f"The Lord of the Rings: The Fellowship of the Ring, vol. {i}",
+        }
+        if i % 10:
+            doc["author_name"] = ["J. R. R. Tolkien", f"Illustrator {i}"]
+        if editions:
+            doc["editions"] = {
+                "numFound": 120 + i,
+                "start": 0,
+                "numFoundExact": True,
+                "docs": [
+                    {
+                        "key": f"/books/OL{2_000_000 + i}M",
+                        "title": f"The Fellowship of the Ring ({i} edition)",
+                    }
+                ],
+            }
+        docs.append(doc)
+    return msgspec.json.encode(
+        {"num_found": 5_000, "start": 0, "offset": 0, "docs": docs}
+    )
+
+
+def legacy_decode(payload: bytes) -> OpenLibrarySearchResult:
+    result = msgspec.json.decode(payload, type=LegacySearchStruct)
+    return OpenLibrarySearchResult(
+        books=[
+            OpenLibraryBook(key=book.key, title=book.title, authors=book.author_name)
+            for book in result.docs
+            if book.author_name is not None
+        ],
+        total=result.num_found,
+        start=result.start,
+        offset=result.offset,
+    )
+
+
+def measure(name: str, decode, payload: bytes) -> None:
+    seconds = timeit.timeit(lambda: decode(payload), number=NUMBER) / NUMBER
+    print(f"{name:<10} {len(payload):>8} B {seconds * 1e6:>10.1f} us")  # noqa: T201
+
+
+def main() -> None:
+    print(f"{'decoder':<10} {'size':>10} {'decode':>13}")  # noqa: T201
+    payload = make_payload()
+    measure("editions", legacy_decode, make_payload(editions=True))
+    measure("legacy", legacy_decode, payload)
+    measure("lean", decode_search_result, payload)
+
+
+if __name__ == "__main__":
+    main()
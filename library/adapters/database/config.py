@@ -18,6 +18,11 @@ class DatabaseConfig:
     max_overflow: int = field(
         default_factory=lambda: int(environ.get("APP_DATABASE_MAX_OVERFLOW", 10))
     )
+    bulk_copy_threshold: int = field(
+        default_factory=lambda: int(
+            environ.get("APP_DATABASE_BULK_COPY_THRESHOLD", 1_000)
+        )
+    )
 
     @property
     def dsn(self) -> str:
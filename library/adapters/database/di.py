@@ -4,13 +4,16 @@ from dishka import AnyOf, Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from library.adapters.database.config import DatabaseConfig
+from library.adapters.database.loaders import create_book_loader, create_user_loader
 from library.adapters.database.storages.book import BookStorage
+from library.adapters.database.storages.upload import UploadCheckpointStorage
 from library.adapters.database.storages.user import UserStorage
 from library.adapters.database.uow import SqlalchemyUow
 from library.adapters.database.utils import create_engine, create_sessionmaker
 from library.application.config import AppConfig
-from library.domains.interfaces.storages.book import IBookStorage
-from library.domains.interfaces.storages.user import IUserStorage
+from library.domains.interfaces.storages.book import IBookLoader, IBookStorage
+from library.domains.interfaces.storages.upload import IUploadCheckpointStorage
+from library.domains.interfaces.storages.user import IUserLoader, IUserStorage
 from library.domains.uow import AbstractUow
 
 
@@ -39,9 +42,25 @@ class DatabaseProvider(Provider):
         return SqlalchemyUow(session_factory=session_factory)
 
     @provide(scope=Scope.REQUEST)
-    def book_storage(self, uow: SqlalchemyUow) -> IBookStorage:
-        return BookStorage(uow=uow)
+    def book_storage(self, uow: SqlalchemyUow, config: DatabaseConfig) -> IBookStorage:
+        return BookStorage(uow=uow, copy_threshold=config.bulk_copy_threshold)
 
     @provide(scope=Scope.REQUEST)
     def user_storage(self, uow: SqlalchemyUow) -> IUserStorage:
         return UserStorage(uow=uow)
+
+    @provide(scope=Scope.REQUEST)
+    def upload_checkpoint_storage(self, uow: SqlalchemyUow) -> IUploadCheckpointStorage:
+        return UploadCheckpointStorage(uow=uow)
+
+    @provide(scope=Scope.APP)
+    def book_loader(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> IBookLoader:
+        return create_book_loader(session_factory)
+
+    @provide(scope=Scope.APP)
+    def user_loader(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> IUserLoader:
+        return create_user_loader(session_factory)
@@ -0,0 +1,32 @@
+from collections.abc import Mapping, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from library.adapters.database.storages.book import BookStorage
+from library.adapters.database.storages.user import UserStorage
+from library.adapters.database.uow import SqlalchemyUow
+from library.application.batched import BatchLoader
+from library.domains.entities.book import Book, BookId
+from library.domains.entities.user import User, UserId
+
+
+def create_book_loader(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> BatchLoader[BookId, Book]:
+    async def load(book_ids: Sequence[BookId]) -> Mapping[BookId, Book]:
+        uow = SqlalchemyUow(session_factory=session_factory)
+        async with uow:
+            return await BookStorage(uow=uow).fetch_books_by_ids(book_ids=book_ids)
+
+    return BatchLoader(load, name="books")
+
+
+def create_user_loader(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> BatchLoader[UserId, User]:
+    async def load(user_ids: Sequence[UserId]) -> Mapping[UserId, User]:
+        uow = SqlalchemyUow(session_factory=session_factory)
+        async with uow:
+            return await UserStorage(uow=uow).fetch_users_by_ids(user_ids=user_ids)
+
+    return BatchLoader(load, name="users")
@@ -0,0 +1,68 @@
+"""Add book fingerprint
+
+Revision ID: 3d7a9c5e1f20
+Revises: 8c1f4e2a9b7d
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "3d7a9c5e1f20"
+down_revision: str | None = "8c1f4e2a9b7d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "books",
+        sa.Column(
+            "fingerprint",
+            sa.LargeBinary(),
+            sa.Computed(
+                "decode(md5(title || chr(31) || year::text || chr(31) || author), "
+                "'hex')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    # Index builds must not hold a write lock on books for their whole duration
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix__books__fingerprint"),
+            "books",
+            ["fingerprint"],
+            unique=True,
+            postgresql_where="deleted_at IS NULL",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix__books__title_year_author"),
+            table_name="books",
+            postgresql_where="deleted_at IS NULL",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix__books__title_year_author"),
+            "books",
+            ["title", "year", "author"],
+            unique=True,
+            postgresql_where="deleted_at IS NULL",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix__books__fingerprint"),
+            table_name="books",
+            postgresql_where="deleted_at IS NULL",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("books", "fingerprint")
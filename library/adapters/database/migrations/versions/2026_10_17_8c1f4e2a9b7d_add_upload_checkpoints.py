@@ -0,0 +1,40 @@
+"""Add upload checkpoints
+
+Revision ID: 8c1f4e2a9b7d
+Revises: 5ed2890da62c
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "8c1f4e2a9b7d"
+down_revision: str | None = "5ed2890da62c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "upload_checkpoints",
+        sa.Column("upload_id", sa.UUID(), nullable=False),
+        sa.Column("query", sa.Text(), nullable=False),
+        sa.Column("offset", sa.Integer(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("TIMEZONE('utc', now())"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint(
+            "upload_id", "query", name=op.f("pk__upload_checkpoints")
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("upload_checkpoints")
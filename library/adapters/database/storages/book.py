@@ -1,8 +1,23 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
-from typing import NoReturn
+from typing import Final, NoReturn, cast
 
-from sqlalchemy import exists, func, insert, select, update
+import asyncpg
+from sqlalchemy import (
+    Integer,
+    String,
+    TextClause,
+    any_,
+    bindparam,
+    exists,
+    func,
+    insert,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import DBAPIError, IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,10 +37,53 @@ from library.domains.entities.book import (
     UpdateBook,
 )
 
+BULK_COPY_THRESHOLD: Final[int] = 1_000
+
+_CREATE_STAGING: Final[TextClause] = text(
+    "CREATE TEMP TABLE IF NOT EXISTS books_staging "
+    "(title varchar(255), year integer, author varchar(255)) "
+    "ON COMMIT DELETE ROWS"
+)
+_MERGE_STAGING: Final[TextClause] = text(
+    "INSERT INTO books (id, title, year, author) "
+    "SELECT gen_random_uuid(), title, year, author FROM books_staging "
+    "ON CONFLICT (fingerprint) WHERE deleted_at IS NULL DO NOTHING"
+)
+_TRUNCATE_STAGING: Final[TextClause] = text("TRUNCATE books_staging")
+
+_unnest_books = (
+    func.unnest(
+        bindparam("titles", type_=ARRAY(String)),
+        bindparam("years", type_=ARRAY(Integer)),
+        bindparam("authors", type_=ARRAY(String)),
+    )
+    .table_valued("title", "year", "author")
+    .render_derived()
+)
+_INSERT_BOOKS: Final = (
+    pg_insert(BookTable)
+    .from_select(
+        ["id", "title", "year", "author"],
+        select(
+            func.gen_random_uuid(),
+            _unnest_books.c.title,
+            _unnest_books.c.year,
+            _unnest_books.c.author,
+        ),
+    )
+    .on_conflict_do_nothing(
+        index_elements=[BookTable.fingerprint],
+        index_where=BookTable.deleted_at.is_(None),
+    )
+)
+
 
 class BookStorage:
-    def __init__(self, *, uow: SqlalchemyUow) -> None:
+    def __init__(
+        self, *, uow: SqlalchemyUow, copy_threshold: int = BULK_COPY_THRESHOLD
+    ) -> None:
         self._uow = uow
+        self._copy_threshold = copy_threshold
 
     @property
     def _session(self) -> AsyncSession:
@@ -49,6 +107,34 @@ class BookStorage:
             updated_at=book.updated_at,
         )
 
+    async def fetch_books_by_ids(
+        self, *, book_ids: Sequence[BookId]
+    ) -> Mapping[BookId, Book]:
+        query = select(
+            BookTable.id,
+            BookTable.title,
+            BookTable.year,
+            BookTable.author,
+            BookTable.created_at,
+            BookTable.updated_at,
+        ).where(
+            BookTable.id
+            == any_(bindparam("book_ids", list(book_ids), type_=ARRAY(PGUUID))),
+            BookTable.deleted_at.is_(None),
+        )
+        result = (await self._session.execute(query)).mappings().all()
+        return {
+            book["id"]: Book(
+                id=book["id"],
+                title=book["title"],
+                year=book["year"],
+                author=book["author"],
+                created_at=book["created_at"],
+                updated_at=book["updated_at"],
+            )
+            for book in result
+        }
+
     async def exists_book_by_id(self, *, book_id: BookId) -> bool:
         stmt = select(
             exists().where(BookTable.id == book_id, BookTable.deleted_at.is_(None))
@@ -160,28 +246,38 @@ class BookStorage:
         )
 
     async def save_bulk_books(self, *, books: Sequence[CreateBook]) -> None:
-        stmt = pg_insert(BookTable).values(
-            [
-                {
-                    "title": book.title[:255],
-                    "year": book.year,
-                    "author": book.author[:255],
-                }
-                for book in books
-            ]
+        if len(books) >= self._copy_threshold:
+            await self._copy_bulk_books(books=books)
+        else:
+            await self._insert_bulk_books(books=books)
+
+    async def _insert_bulk_books(self, *, books: Sequence[CreateBook]) -> None:
+        await self._session.execute(
+            _INSERT_BOOKS,
+            {
+                "titles": [book.title[:255] for book in books],
+                "years": [book.year for book in books],
+                "authors": [book.author[:255] for book in books],
+            },
         )
-        stmt = stmt.on_conflict_do_nothing(
-            index_elements=[
-                BookTable.title,
-                BookTable.year,
-                BookTable.author,
+
+    async def _copy_bulk_books(self, *, books: Sequence[CreateBook]) -> None:
+        await self._session.execute(_CREATE_STAGING)
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = cast(asyncpg.Connection, raw_connection.driver_connection)
+        await driver_connection.copy_records_to_table(
+            "books_staging",
+            records=[
+                (book.title[:255], book.year, book.author[:255]) for book in books
             ],
-            index_where=BookTable.deleted_at.is_(None),
+            columns=["title", "year", "author"],
         )
-        await self._session.execute(stmt)
+        await self._session.execute(_MERGE_STAGING)
+        await self._session.execute(_TRUNCATE_STAGING)
 
     def _raise_error(self, e: DBAPIError) -> NoReturn:
         constraint = e.__cause__.__cause__.constraint_name  # type: ignore[union-attr]
-        if constraint == "ix__books__title_year_author":
+        if constraint == "ix__books__fingerprint":
             raise EntityAlreadyExistsException("Book already exists") from e
         raise LibraryException(message="Unknown error") from e
@@ -0,0 +1,63 @@
+from collections.abc import Mapping
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from library.adapters.database.base import now_with_tz
+from library.adapters.database.tables import UploadCheckpointTable
+from library.adapters.database.uow import SqlalchemyUow
+from library.domains.entities.book import UploadCheckpoint, UploadId
+
+
+class UploadCheckpointStorage:
+    def __init__(self, *, uow: SqlalchemyUow) -> None:
+        self._uow = uow
+
+    @property
+    def _session(self) -> AsyncSession:
+        return self._uow.session
+
+    async def fetch_upload_checkpoints(
+        self, *, upload_id: UploadId
+    ) -> Mapping[str, UploadCheckpoint]:
+        stmt = select(
+            UploadCheckpointTable.query,
+            UploadCheckpointTable.offset,
+            UploadCheckpointTable.total,
+        ).where(UploadCheckpointTable.upload_id == upload_id)
+        result = await self._session.execute(stmt)
+        return {
+            row.query: UploadCheckpoint(
+                upload_id=upload_id,
+                query=row.query,
+                offset=row.offset,
+                total=row.total,
+            )
+            for row in result
+        }
+
+    async def save_upload_checkpoint(self, *, checkpoint: UploadCheckpoint) -> None:
+        stmt = pg_insert(UploadCheckpointTable).values(
+            upload_id=checkpoint.upload_id,
+            query=checkpoint.query,
+            offset=checkpoint.offset,
+            total=checkpoint.total,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                UploadCheckpointTable.upload_id,
+                UploadCheckpointTable.query,
+            ],
+            # Redelivered events may replay older pages: never move backwards
+            set_={
+                "offset": func.greatest(
+                    UploadCheckpointTable.offset, stmt.excluded.offset
+                ),
+                "total": func.greatest(
+                    UploadCheckpointTable.total, stmt.excluded.total
+                ),
+                "updated_at": now_with_tz(),
+            },
+        )
+        await self._session.execute(stmt)
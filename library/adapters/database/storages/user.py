@@ -1,8 +1,19 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
-from typing import NoReturn
+from typing import Final, NoReturn
 
-from sqlalchemy import exists, func, insert, select, update
+from sqlalchemy import (
+    String,
+    any_,
+    bindparam,
+    exists,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.exc import DBAPIError, IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,6 +32,33 @@ from library.domains.entities.user import (
     UserPaginationParams,
 )
 
+_unnest_users = (
+    func.unnest(
+        bindparam("usernames", type_=ARRAY(String)),
+        bindparam("emails", type_=ARRAY(String)),
+    )
+    .table_valued("username", "email")
+    .render_derived()
+)
+_INSERT_USERS: Final = (
+    insert(UserTable)
+    .from_select(
+        ["id", "username", "email"],
+        select(
+            func.gen_random_uuid(),
+            _unnest_users.c.username,
+            _unnest_users.c.email,
+        ),
+    )
+    .returning(
+        UserTable.id,
+        UserTable.email,
+        UserTable.username,
+        UserTable.created_at,
+        UserTable.updated_at,
+    )
+)
+
 
 class UserStorage:
     def __init__(self, *, uow: SqlalchemyUow) -> None:
@@ -45,6 +83,32 @@ class UserStorage:
             updated_at=user.updated_at,
         )
 
+    async def fetch_users_by_ids(
+        self, *, user_ids: Sequence[UserId]
+    ) -> Mapping[UserId, User]:
+        stmt = select(
+            UserTable.id,
+            UserTable.username,
+            UserTable.email,
+            UserTable.created_at,
+            UserTable.updated_at,
+        ).where(
+            UserTable.id
+            == any_(bindparam("user_ids", list(user_ids), type_=ARRAY(PGUUID))),
+            UserTable.deleted_at.is_(None),
+        )
+        result = (await self._session.execute(stmt)).mappings().all()
+        return {
+            user["id"]: User(
+                id=user["id"],
+                username=user["username"],
+                email=user["email"],
+                created_at=user["created_at"],
+                updated_at=user["updated_at"],
+            )
+            for user in result
+        }
+
     async def exists_user_by_id(self, *, user_id: UserId) -> bool:
         stmt = select(
             exists().where(UserTable.id == user_id, UserTable.deleted_at.is_(None))
@@ -112,6 +176,28 @@ class UserStorage:
             updated_at=result["updated_at"],
         )
 
+    async def create_users(self, *, users: Sequence[CreateUser]) -> Sequence[User]:
+        try:
+            result = await self._session.execute(
+                _INSERT_USERS,
+                {
+                    "usernames": [user.username for user in users],
+                    "emails": [user.email for user in users],
+                },
+            )
+        except IntegrityError as e:
+            self._raise_error(e)
+        return [
+            User(
+                id=UserId(row.id),
+                email=row.email,
+                username=row.username,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in result
+        ]
+
     async def delete_user_by_id(self, *, user_id: UserId) -> None:
         stmt = (
             update(UserTable)
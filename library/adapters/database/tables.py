@@ -1,7 +1,29 @@
-from sqlalchemy import Index, Integer, String
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Computed,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from library.adapters.database.base import BaseTable, IdentifableMixin, TimestampedMixin
+from library.adapters.database.base import (
+    BaseTable,
+    IdentifableMixin,
+    TimestampedMixin,
+    now_with_tz,
+)
+
+BOOK_FINGERPRINT = (
+    "decode(md5(title || chr(31) || year::text || chr(31) || author), 'hex')"
+)
 
 
 class BookTable(BaseTable, TimestampedMixin, IdentifableMixin):
@@ -9,9 +31,7 @@ class BookTable(BaseTable, TimestampedMixin, IdentifableMixin):
     __table_args__ = (
         Index(
             None,
-            "title",
-            "year",
-            "author",
+            "fingerprint",
             unique=True,
             postgresql_where="deleted_at IS NULL",
         ),
@@ -20,6 +40,9 @@ class BookTable(BaseTable, TimestampedMixin, IdentifableMixin):
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     year: Mapped[int] = mapped_column(Integer, nullable=False)
     author: Mapped[str] = mapped_column(String(255), nullable=False)
+    fingerprint: Mapped[bytes] = mapped_column(
+        LargeBinary, Computed(BOOK_FINGERPRINT, persisted=True)
+    )
 
 
 class UserTable(BaseTable, TimestampedMixin, IdentifableMixin):
@@ -27,3 +50,17 @@ class UserTable(BaseTable, TimestampedMixin, IdentifableMixin):
 
     username: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+
+
+class UploadCheckpointTable(BaseTable):
+    __tablename__ = "upload_checkpoints"
+
+    upload_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    query: Mapped[str] = mapped_column(Text, primary_key=True)
+    offset: Mapped[int] = mapped_column(Integer, nullable=False)
+    total: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=text("TIMEZONE('utc', now())"),
+        onupdate=now_with_tz,
+    )
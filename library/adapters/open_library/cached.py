@@ -1,17 +1,89 @@
+import asyncio
+import unicodedata
+from typing import Final
+
 from aiocache import BaseCache
+from aiohttp import ClientError
 
-from library.application.cached import ICached, cached
+from library.application.cache_writer import CacheWriter
+from library.application.cached import ICached, ICacheTags, cached
+from library.application.exceptions import CircuitOpenException
+from library.application.local_cache import LocalCacheConfig
+from library.application.reduced import ISingleFlight
 from library.domains.entities.open_library import OpenLibrarySearchResult
 from library.domains.interfaces.clients.open_library import IOpenLibraryClient
 
+WINDOW_SIZE: Final[int] = 100
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def search_tag(query: str) -> str:
+    return f"open_library:search:{query}"
+
+
+def search_window_key(*, query: str, offset: int) -> str:
+    return f"open_library:search:v2:{WINDOW_SIZE}:{offset}:{query}"
+
 
 class CachedOpenLibraryClient(ICached):
-    def __init__(self, client: IOpenLibraryClient, cache: BaseCache):
+    def __init__(
+        self,
+        client: IOpenLibraryClient,
+        cache: BaseCache,
+        single_flight: ISingleFlight | None = None,
+        cache_writer: CacheWriter | None = None,
+        cache_tags: ICacheTags | None = None,
+    ):
         self._client = client
         self._cache = cache
+        self._single_flight = single_flight
+        self._cache_writer = cache_writer
+        self._cache_tags = cache_tags
 
-    @cached(ttl=60 * 60)
     async def search(
         self, query: str, limit: int, offset: int
     ) -> OpenLibrarySearchResult:
-        return await self._client.search(query=query, limit=limit, offset=offset)
+        query = normalize_query(query)
+        first = offset - offset % WINDOW_SIZE
+        windows = await asyncio.gather(
+            *(
+                self._search_window(query=query, offset=window_offset)
+                for window_offset in range(first, offset + limit, WINDOW_SIZE)
+            )
+        )
+        # Windows keep every upstream doc so that slicing matches the upstream
+        # offset; books without authors are dropped only from the page itself
+        books = [book for window in windows for book in window.books]
+        skip = offset - first
+        return OpenLibrarySearchResult(
+            books=[book for book in books[skip : skip + limit] if book.authors],
+            total=windows[0].total,
+            start=offset,
+            offset=offset,
+        )
+
+    @cached(
+        key_func=search_window_key,
+        tags=lambda *, query, offset: [search_tag(query)],
+        ttl=60 * 60,
+        stale_ttl=60 * 60,
+        xfetch_beta=1.0,
+        distributed=True,
+        write_behind=True,
+        empty_ttl=5 * 60,
+        is_empty=lambda result: not result.books,
+        local=LocalCacheConfig(ttl=60, max_entries=1024, max_bytes=32 * 1024 * 1024),
+        stale_if_error=6 * 60 * 60,
+        stale_if_error_exceptions=(
+            CircuitOpenException,
+            ClientError,
+            asyncio.TimeoutError,
+        ),
+    )
+    async def _search_window(
+        self, *, query: str, offset: int
+    ) -> OpenLibrarySearchResult:
+        return await self._client.search(query=query, limit=WINDOW_SIZE, offset=offset)
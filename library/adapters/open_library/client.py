@@ -1,46 +1,53 @@
 from http import HTTPStatus
 from types import MappingProxyType
 
+from aiohttp import ClientResponse
 from asyncly import BaseHttpClient, ResponseHandlersType
-from asyncly.client.handlers.msgspec import parse_struct
 
-from library.adapters.open_library.schemas.search import OpenLibrarySearchStruct
+from library.adapters.open_library.schemas.search import (
+    SEARCH_DECODER,
+    SEARCH_FIELDS,
+)
 from library.domains.entities.open_library import (
     OpenLibraryBook,
     OpenLibrarySearchResult,
 )
 
 
+def decode_search_result(payload: bytes) -> OpenLibrarySearchResult:
+    result = SEARCH_DECODER.decode(payload)
+    return OpenLibrarySearchResult(
+        books=[
+            OpenLibraryBook(key=doc.key, title=doc.title, authors=doc.authors or [])
+            for doc in result.docs
+        ],
+        total=result.total,
+        start=result.start,
+        offset=result.offset,
+    )
+
+
+async def parse_search_result(response: ClientResponse) -> OpenLibrarySearchResult:
+    return decode_search_result(await response.read())
+
+
 class OpenLibraryClient(BaseHttpClient):
     SEARCH_HANLDERS: ResponseHandlersType = MappingProxyType(
-        {HTTPStatus.OK: parse_struct(OpenLibrarySearchStruct)}
+        {HTTPStatus.OK: parse_search_result}
     )
 
     async def search(
         self, query: str, limit: int, offset: int
     ) -> OpenLibrarySearchResult:
-        result: OpenLibrarySearchStruct = await self._make_req(
+        return await self._make_req(
             method="GET",
             handlers=self.SEARCH_HANLDERS,
             url=self._url / "search.json",
+            timeout=self._session.timeout,
             params={
                 "q": query,
                 "limit": limit,
                 "offset": offset,
-                "fields": ",".join(["key", "title", "author_name", "editions"]),
+                "fields": SEARCH_FIELDS,
             },
         )
-        return OpenLibrarySearchResult(
-            books=[
-                OpenLibraryBook(
-                    key=book.key,
-                    title=book.title,
-                    authors=book.author_name,
-                )
-                for book in result.docs
-                if book.author_name is not None
-            ],
-            total=result.num_found,
-            start=result.start,
-            offset=result.offset,
-        )
@@ -1,6 +1,95 @@
 from dataclasses import dataclass, field
+from os import environ
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class OpenLibraryConfig:
     url: str = field(default_factory=lambda: "https://openlibrary.org")
+    connector_limit: int = field(
+        default_factory=lambda: int(
+            environ.get("APP_OPEN_LIBRARY_CONNECTOR_LIMIT", 100)
+        )
+    )
+    connector_limit_per_host: int = field(
+        default_factory=lambda: int(
+            environ.get("APP_OPEN_LIBRARY_CONNECTOR_LIMIT_PER_HOST", 20)
+        )
+    )
+    keepalive_timeout: float = field(
+        default_factory=lambda: float(
+            environ.get("APP_OPEN_LIBRARY_KEEPALIVE_TIMEOUT", 30)
+        )
+    )
+    dns_cache_ttl: int = field(
+        default_factory=lambda: int(environ.get("APP_OPEN_LIBRARY_DNS_CACHE_TTL", 300))
+    )
+    connect_timeout: float = field(
+        default_factory=lambda: float(
+            environ.get("APP_OPEN_LIBRARY_CONNECT_TIMEOUT", 2)
+        )
+    )
+    read_timeout: float = field(
+        default_factory=lambda: float(environ.get("APP_OPEN_LIBRARY_READ_TIMEOUT", 10))
+    )
+    total_timeout: float = field(
+        default_factory=lambda: float(environ.get("APP_OPEN_LIBRARY_TOTAL_TIMEOUT", 30))
+    )
+    prewarm_connections: int = field(
+        default_factory=lambda: int(
+            environ.get("APP_OPEN_LIBRARY_PREWARM_CONNECTIONS", 0)
+        )
+    )
+    max_concurrency: int = field(
+        default_factory=lambda: int(environ.get("APP_OPEN_LIBRARY_MAX_CONCURRENCY", 10))
+    )
+    rate_limit: float = field(
+        default_factory=lambda: float(environ.get("APP_OPEN_LIBRARY_RATE_LIMIT", 5))
+    )
+    rate_limit_burst: float = field(
+        default_factory=lambda: float(
+            environ.get("APP_OPEN_LIBRARY_RATE_LIMIT_BURST", 10)
+        )
+    )
+    rate_limit_shared: bool = field(
+        default_factory=lambda: (
+            environ.get("APP_OPEN_LIBRARY_RATE_LIMIT_SHARED", "False").lower() == "true"
+        )
+    )
+    breaker_failure_rate: float = field(
+        default_factory=lambda: float(
+            environ.get("APP_OPEN_LIBRARY_BREAKER_FAILURE_RATE", 0.5)
+        )
+    )
+    breaker_slow_call_duration: float = field(
+        default_factory=lambda: float(
+            environ.get("APP_OPEN_LIBRARY_BREAKER_SLOW_CALL_DURATION", 5)
+        )
+    )
+    breaker_open_duration: float = field(
+        default_factory=lambda: float(
+            environ.get("APP_OPEN_LIBRARY_BREAKER_OPEN_DURATION", 10)
+        )
+    )
+    max_attempts: int = field(
+        default_factory=lambda: int(environ.get("APP_OPEN_LIBRARY_MAX_ATTEMPTS", 3))
+    )
+    retry_budget_ratio: float = field(
+        default_factory=lambda: float(
+            environ.get("APP_OPEN_LIBRARY_RETRY_BUDGET_RATIO", 0.1)
+        )
+    )
+    hedge: bool = field(
+        default_factory=lambda: (
+            environ.get("APP_OPEN_LIBRARY_HEDGE", "False").lower() == "true"
+        )
+    )
+    hedge_percentile: float = field(
+        default_factory=lambda: float(
+            environ.get("APP_OPEN_LIBRARY_HEDGE_PERCENTILE", 0.95)
+        )
+    )
+    hedge_max_ratio: float = field(
+        default_factory=lambda: float(
+            environ.get("APP_OPEN_LIBRARY_HEDGE_MAX_RATIO", 0.05)
+        )
+    )
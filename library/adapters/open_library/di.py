@@ -2,21 +2,45 @@ from collections.abc import AsyncIterator
 
 from aiocache import BaseCache
 from aiohttp import ClientSession
-from dishka import Provider, Scope, provide
+from dishka import AsyncContainer, Provider, Scope, provide
+from redis.asyncio import Redis
 
 from library.adapters.open_library.cached import CachedOpenLibraryClient
 from library.adapters.open_library.client import OpenLibraryClient
 from library.adapters.open_library.config import OpenLibraryConfig
+from library.adapters.open_library.hedged import HedgedOpenLibraryClient
+from library.adapters.open_library.limited import LimitedOpenLibraryClient
 from library.adapters.open_library.reduced import ReducedOpenLibraryClient
+from library.adapters.open_library.resilient import ResilientOpenLibraryClient
+from library.adapters.open_library.session import create_session, prewarm
+from library.adapters.redis.rate_limit import RedisTokenBucket
+from library.application.cache_writer import CacheWriter
+from library.application.cached import ICacheTags
+from library.application.circuit_breaker import CircuitBreaker
+from library.application.hedged import Hedger
+from library.application.rate_limit import IRateLimiter, TokenBucket
+from library.application.reduced import ISingleFlight
+from library.application.retry import RetryBudget
 from library.domains.interfaces.clients.open_library import IOpenLibraryClient
 
 
+async def prewarm_session(container: AsyncContainer) -> None:
+    config = await container.get(OpenLibraryConfig)
+    session = await container.get(ClientSession)
+    if config.prewarm_connections:
+        await prewarm(session, config.url, config.prewarm_connections)
+
+
 class OpenLibraryProvider(Provider):
     scope = Scope.APP
 
+    def __init__(self, *, pool_name: str = "open_library") -> None:
+        super().__init__()
+        self._pool_name = pool_name
+
     @provide()
-    async def session(self) -> AsyncIterator[ClientSession]:
-        async with ClientSession() as session:
+    async def session(self, config: OpenLibraryConfig) -> AsyncIterator[ClientSession]:
+        async with create_session(config, self._pool_name) as session:
             yield session
 
     @provide()
@@ -31,14 +55,78 @@ class OpenLibraryProvider(Provider):
             client_name="open_library",
         )
 
+    @provide()
+    def limited_open_library_client(
+        self,
+        config: OpenLibraryConfig,
+        open_library_client: OpenLibraryClient,
+        redis: Redis,
+    ) -> LimitedOpenLibraryClient:
+        rate_limiter: IRateLimiter
+        if config.rate_limit_shared:
+            rate_limiter = RedisTokenBucket(
+                redis,
+                key="open_library",
+                rate=config.rate_limit,
+                capacity=config.rate_limit_burst,
+            )
+        else:
+            rate_limiter = TokenBucket(
+                rate=config.rate_limit, capacity=config.rate_limit_burst
+            )
+        return LimitedOpenLibraryClient(
+            client=open_library_client,
+            max_concurrency=config.max_concurrency,
+            rate_limiter=rate_limiter,
+        )
+
+    @provide()
+    def resilient_open_library_client(
+        self,
+        config: OpenLibraryConfig,
+        limited_open_library_client: LimitedOpenLibraryClient,
+    ) -> ResilientOpenLibraryClient:
+        client: IOpenLibraryClient = limited_open_library_client
+        if config.hedge:
+            client = HedgedOpenLibraryClient(
+                client,
+                hedger=Hedger(
+                    name="open_library",
+                    percentile=config.hedge_percentile,
+                    max_ratio=config.hedge_max_ratio,
+                ),
+            )
+        return ResilientOpenLibraryClient(
+            client=client,
+            breaker=CircuitBreaker(
+                name="open_library",
+                failure_rate=config.breaker_failure_rate,
+                slow_call_duration=config.breaker_slow_call_duration,
+                open_duration=config.breaker_open_duration,
+            ),
+            retry_budget=RetryBudget(ratio=config.retry_budget_ratio),
+            max_attempts=config.max_attempts,
+        )
+
     @provide()
     def reduced_open_library_client(
-        self, open_library_client: OpenLibraryClient
+        self, resilient_open_library_client: ResilientOpenLibraryClient
     ) -> ReducedOpenLibraryClient:
-        return ReducedOpenLibraryClient(client=open_library_client)
+        return ReducedOpenLibraryClient(client=resilient_open_library_client)
 
     @provide()
     def cached_open_library_client(
-        self, reduced_open_library_client: ReducedOpenLibraryClient, cache: BaseCache
+        self,
+        reduced_open_library_client: ReducedOpenLibraryClient,
+        cache: BaseCache,
+        single_flight: ISingleFlight,
+        cache_writer: CacheWriter,
+        cache_tags: ICacheTags,
     ) -> IOpenLibraryClient:
-        return CachedOpenLibraryClient(client=reduced_open_library_client, cache=cache)
+        return CachedOpenLibraryClient(
+            client=reduced_open_library_client,
+            cache=cache,
+            single_flight=single_flight,
+            cache_writer=cache_writer,
+            cache_tags=cache_tags,
+        )
@@ -0,0 +1,16 @@
+from library.application.hedged import Hedger
+from library.domains.entities.open_library import OpenLibrarySearchResult
+from library.domains.interfaces.clients.open_library import IOpenLibraryClient
+
+
+class HedgedOpenLibraryClient:
+    def __init__(self, client: IOpenLibraryClient, *, hedger: Hedger) -> None:
+        self._client = client
+        self._hedger = hedger
+
+    async def search(
+        self, query: str, limit: int, offset: int
+    ) -> OpenLibrarySearchResult:
+        return await self._hedger(
+            lambda: self._client.search(query=query, limit=limit, offset=offset)
+        )
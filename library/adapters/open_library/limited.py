@@ -0,0 +1,34 @@
+import asyncio
+import time
+
+from library.application.metrics import CLIENT_QUEUE_SECONDS
+from library.application.rate_limit import IRateLimiter
+from library.domains.entities.open_library import OpenLibrarySearchResult
+from library.domains.interfaces.clients.open_library import IOpenLibraryClient
+
+
+class LimitedOpenLibraryClient:
+    def __init__(
+        self,
+        client: IOpenLibraryClient,
+        *,
+        max_concurrency: int,
+        rate_limiter: IRateLimiter | None = None,
+        name: str = "open_library",
+    ) -> None:
+        self._client = client
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = rate_limiter
+        self._name = name
+
+    async def search(
+        self, query: str, limit: int, offset: int
+    ) -> OpenLibrarySearchResult:
+        started_at = time.perf_counter()
+        async with self._semaphore:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            CLIENT_QUEUE_SECONDS.labels(self._name).observe(
+                time.perf_counter() - started_at
+            )
+            return await self._client.search(query=query, limit=limit, offset=offset)
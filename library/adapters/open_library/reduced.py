@@ -6,9 +6,9 @@ from library.domains.interfaces.clients.open_library import IOpenLibraryClient
 class ReducedOpenLibraryClient(IReduced):
     def __init__(self, client: IOpenLibraryClient):
         self._client = client
-        self._reducer = AsyncReducer()
+        self._reducer = AsyncReducer(grace_period=0.5)
 
-    @reduced()
+    @reduced(linger=1.0)
     async def search(
         self, query: str, limit: int, offset: int
     ) -> OpenLibrarySearchResult:
@@ -0,0 +1,79 @@
+import asyncio
+from http import HTTPStatus
+from typing import Final
+
+from aiohttp import ClientError
+from asyncly.client.handlers.exceptions import UnhandledStatusException
+
+from library.application.circuit_breaker import CircuitBreaker
+from library.application.metrics import CLIENT_RETRIES, CLIENT_RETRIES_DENIED
+from library.application.retry import RetryBudget, backoff_delay
+from library.domains.entities.open_library import OpenLibrarySearchResult
+from library.domains.interfaces.clients.open_library import IOpenLibraryClient
+
+RETRYABLE_STATUSES: Final[frozenset[int]] = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+
+def is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, UnhandledStatusException):
+        return exc.status in RETRYABLE_STATUSES
+    return isinstance(exc, ClientError | asyncio.TimeoutError)
+
+
+class ResilientOpenLibraryClient:
+    def __init__(
+        self,
+        client: IOpenLibraryClient,
+        *,
+        breaker: CircuitBreaker,
+        retry_budget: RetryBudget,
+        max_attempts: int = 3,
+        backoff_base: float = 0.1,
+        backoff_cap: float = 2.0,
+        name: str = "open_library",
+    ) -> None:
+        self._client = client
+        self._breaker = breaker
+        self._retry_budget = retry_budget
+        self._max_attempts = max_attempts
+        self._backoff_base = backoff_base
+        self._backoff_cap = backoff_cap
+        self._name = name
+
+    async def search(
+        self, query: str, limit: int, offset: int
+    ) -> OpenLibrarySearchResult:
+        self._retry_budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return await self._breaker.call(
+                    lambda: self._client.search(
+                        query=query, limit=limit, offset=offset
+                    ),
+                    is_failure=is_retryable,
+                )
+            except Exception as e:
+                if not self._should_retry(e, attempt):
+                    raise
+            await asyncio.sleep(
+                backoff_delay(attempt, base=self._backoff_base, cap=self._backoff_cap)
+            )
+            attempt += 1
+
+    def _should_retry(self, exc: Exception, attempt: int) -> bool:
+        if attempt + 1 >= self._max_attempts or not is_retryable(exc):
+            return False
+        if not self._retry_budget.withdraw():
+            CLIENT_RETRIES_DENIED.labels(self._name).inc()
+            return False
+        CLIENT_RETRIES.labels(self._name).inc()
+        return True
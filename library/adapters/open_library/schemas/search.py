@@ -1,16 +1,23 @@
-from collections.abc import Sequence
+from typing import Final
 
 from msgspec import Struct
+from msgspec.json import Decoder
 
 
-class OpenLibraryDocStruct(Struct):
-    title: str
+class OpenLibraryDocStruct(Struct, gc=False, rename={"authors": "author_name"}):
     key: str
-    author_name: Sequence[str] | None = None
+    title: str
+    authors: list[str] | None = None
 
 
-class OpenLibrarySearchStruct(Struct):
-    num_found: int
+class OpenLibrarySearchStruct(Struct, gc=False, rename={"total": "num_found"}):
+    total: int
     start: int
     offset: int
-    docs: Sequence[OpenLibraryDocStruct]
+    docs: list[OpenLibraryDocStruct]
+
+
+SEARCH_FIELDS: Final[str] = "key,title,author_name"
+SEARCH_DECODER: Final[Decoder[OpenLibrarySearchStruct]] = Decoder(
+    OpenLibrarySearchStruct
+)
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+import math
+from collections.abc import Mapping, Sized
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from library.adapters.open_library.config import OpenLibraryConfig
+from library.application.metrics import CLIENT_POOL_CONNECTIONS, CLIENT_POOL_LIMIT
+
+log = logging.getLogger(__name__)
+
+
+def create_session(config: OpenLibraryConfig, name: str) -> ClientSession:
+    connector = TCPConnector(
+        limit=config.connector_limit,
+        limit_per_host=config.connector_limit_per_host,
+        keepalive_timeout=config.keepalive_timeout,
+        ttl_dns_cache=config.dns_cache_ttl,
+    )
+    timeout = ClientTimeout(
+        total=config.total_timeout,
+        sock_connect=config.connect_timeout,
+        sock_read=config.read_timeout,
+    )
+    observe_pool(connector, name)
+    return ClientSession(connector=connector, timeout=timeout)
+
+
+async def prewarm(session: ClientSession, url: str, connections: int) -> None:
+    async def open_connection() -> None:
+        async with session.head(url, allow_redirects=False) as response:
+            await response.read()
+
+    results = await asyncio.gather(
+        *(open_connection() for _ in range(connections)), return_exceptions=True
+    )
+    failed = sum(isinstance(result, BaseException) for result in results)
+    if failed:
+        log.warning("Failed to pre-warm %s of %s connections", failed, connections)
+
+
+def observe_pool(connector: TCPConnector, name: str) -> None:
+    CLIENT_POOL_LIMIT.labels(name).set(connector.limit)
+    CLIENT_POOL_CONNECTIONS.labels(name, "acquired").set_function(
+        lambda: _acquired_connections(connector)
+    )
+    CLIENT_POOL_CONNECTIONS.labels(name, "idle").set_function(
+        lambda: _idle_connections(connector)
+    )
+
+
+# aiohttp exposes no public pool statistics: report NaN rather than fail
+# the scrape if a release renames these attributes
+def _acquired_connections(connector: TCPConnector) -> float:
+    acquired = getattr(connector, "_acquired", None)
+    if not isinstance(acquired, Sized):
+        return math.nan
+    return len(acquired)
+
+
+def _idle_connections(connector: TCPConnector) -> float:
+    conns = getattr(connector, "_conns", None)
+    if not isinstance(conns, Mapping):
+        return math.nan
+    return sum(len(idle) for idle in conns.values())
@@ -1,13 +1,109 @@
+from collections.abc import Callable, Sequence
+from typing import Any, Final
+
 from aiocache import RedisCache
-from aiocache.serializers import PickleSerializer
+
+from library.adapters.redis.compression import Compressor
+from library.adapters.redis.serializers import MsgspecSerializer
+from library.application.reduced import Fence
+
+# Writes the value only if the fence lock is still held by the caller's token
+_FENCED_SET_SCRIPT: Final[str] = """
+if redis.call("get", KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call("set", KEYS[2], ARGV[2], "ex", ARGV[3])
+return 1
+"""
+
+
+class CompressedRedisCache(RedisCache):
+    def __init__(self, *, compressor: Compressor, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._compressor = compressor
+        self._fenced_set = self.client.register_script(_FENCED_SET_SCRIPT)
+
+    async def _get(
+        self, key: str, encoding: str | None = None, _conn: Any = None
+    ) -> Any:
+        value = await super()._get(key, encoding=None, _conn=_conn)
+        return self._decode(self._compressor.decompress(value), encoding)
+
+    async def _multi_get(
+        self, keys: Sequence[str], encoding: str | None = None, _conn: Any = None
+    ) -> list[Any]:
+        values = await super()._multi_get(keys, encoding=None, _conn=_conn)
+        return [
+            self._decode(self._compressor.decompress(value), encoding)
+            for value in values
+        ]
+
+    async def _set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | float | None = None,
+        _cas_token: Any = None,
+        _conn: Any = None,
+    ) -> Any:
+        return await super()._set(
+            key, self._encode(value), ttl=ttl, _cas_token=_cas_token, _conn=_conn
+        )
+
+    async def _multi_set(
+        self,
+        pairs: Sequence[tuple[str, Any]],
+        ttl: int | float | None = None,
+        _conn: Any = None,
+    ) -> Any:
+        return await super()._multi_set(
+            [(key, self._encode(value)) for key, value in pairs],
+            ttl=ttl,
+            _conn=_conn,
+        )
+
+    async def _add(
+        self, key: str, value: Any, ttl: int | float | None = None, _conn: Any = None
+    ) -> Any:
+        return await super()._add(key, self._encode(value), ttl=ttl, _conn=_conn)
+
+    async def set_fenced(
+        self,
+        key: str,
+        value: Any,
+        *,
+        ttl: int,
+        fence: Fence,
+        dumps_fn: Callable[[Any], bytes] | None = None,
+    ) -> bool:
+        dumps = dumps_fn or self.serializer.dumps
+        return bool(
+            await self._fenced_set(
+                keys=[fence.key, self.build_key(key)],
+                args=[fence.token, self._encode(dumps(value)), ttl],
+            )
+        )
+
+    def _encode(self, value: Any) -> Any:
+        if isinstance(value, bytes):
+            return self._compressor.compress(value)
+        return value
+
+    @staticmethod
+    def _decode(value: bytes | None, encoding: str | None) -> Any:
+        if encoding is None or value is None:
+            return value
+        return value.decode(encoding)
 
 
 def get_redis_cache(
     host: str,
     port: int,
+    compressor: Compressor | None = None,
 ) -> RedisCache:
-    return RedisCache(
+    return CompressedRedisCache(
         endpoint=host,
         port=port,
-        serializer=PickleSerializer(),
+        serializer=MsgspecSerializer(),
+        compressor=compressor or Compressor(),
     )
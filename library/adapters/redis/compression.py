@@ -0,0 +1,110 @@
+import logging
+import time
+import zlib
+from collections.abc import Callable
+from enum import StrEnum, unique
+from typing import Final
+
+from library.application.metrics import (
+    CACHE_COMPRESSION_RATIO,
+    CACHE_COMPRESSION_SECONDS,
+)
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover
+    lz4_frame = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+log = logging.getLogger(__name__)
+
+# 0xc1 is never used by msgpack, so a value starting with it can only be
+# a compressed payload; everything else is stored as is
+MARKER: Final[bytes] = b"\xc1"
+
+
+@unique
+class CompressionCodec(StrEnum):
+    NONE = "none"
+    ZLIB = "zlib"
+    LZ4 = "lz4"
+    ZSTD = "zstd"
+
+
+_CODEC_IDS: Final[dict[CompressionCodec, bytes]] = {
+    CompressionCodec.ZLIB: b"\x01",
+    CompressionCodec.LZ4: b"\x02",
+    CompressionCodec.ZSTD: b"\x03",
+}
+
+
+def _compress_func(codec: CompressionCodec, level: int) -> Callable[[bytes], bytes]:
+    if codec == CompressionCodec.LZ4 and lz4_frame is not None:
+        return lambda data: lz4_frame.compress(data, compression_level=level)
+    if codec == CompressionCodec.ZSTD and zstandard is not None:
+        return zstandard.ZstdCompressor(level=level).compress
+    return lambda data: zlib.compress(data, level)
+
+
+def _decompress_funcs() -> dict[bytes, Callable[[bytes], bytes]]:
+    funcs: dict[bytes, Callable[[bytes], bytes]] = {
+        _CODEC_IDS[CompressionCodec.ZLIB]: zlib.decompress,
+    }
+    if lz4_frame is not None:
+        funcs[_CODEC_IDS[CompressionCodec.LZ4]] = lz4_frame.decompress
+    if zstandard is not None:
+        funcs[_CODEC_IDS[CompressionCodec.ZSTD]] = (
+            zstandard.ZstdDecompressor().decompress
+        )
+    return funcs
+
+
+def _available(codec: CompressionCodec) -> CompressionCodec:
+    if (codec == CompressionCodec.LZ4 and lz4_frame is None) or (
+        codec == CompressionCodec.ZSTD and zstandard is None
+    ):
+        log.warning("Compression codec %s is not installed, using zlib", codec)
+        return CompressionCodec.ZLIB
+    return codec
+
+
+class Compressor:
+    def __init__(
+        self,
+        codec: CompressionCodec = CompressionCodec.ZLIB,
+        min_size: int = 1024,
+        level: int = 1,
+    ) -> None:
+        self._codec = _available(codec)
+        self._min_size = min_size
+        self._compress = _compress_func(self._codec, level)
+        self._decompress = _decompress_funcs()
+
+    def compress(self, data: bytes) -> bytes:
+        if self._codec == CompressionCodec.NONE or len(data) < self._min_size:
+            return data
+        started_at = time.perf_counter()
+        compressed = MARKER + _CODEC_IDS[self._codec] + self._compress(data)
+        CACHE_COMPRESSION_SECONDS.labels("compress").observe(
+            time.perf_counter() - started_at
+        )
+        CACHE_COMPRESSION_RATIO.observe(len(compressed) / len(data))
+        return compressed
+
+    def decompress(self, data: bytes | None) -> bytes | None:
+        if data is None or not data.startswith(MARKER):
+            return data
+        decompress = self._decompress.get(data[1:2])
+        if decompress is None:
+            log.warning("Unsupported compression codec id %r", data[1:2])
+            return None
+        started_at = time.perf_counter()
+        decompressed = decompress(data[2:])
+        CACHE_COMPRESSION_SECONDS.labels("decompress").observe(
+            time.perf_counter() - started_at
+        )
+        return decompressed
@@ -1,11 +1,47 @@
 import os
 from dataclasses import dataclass, field
 
+from library.adapters.redis.compression import CompressionCodec
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class RedisConfig:
     host: str = field(default_factory=lambda: os.environ["APP_REDIS_HOST"])
     port: int = field(default_factory=lambda: int(os.environ["APP_REDIS_PORT"]))
+    compression_codec: CompressionCodec = field(
+        default_factory=lambda: CompressionCodec(
+            os.environ.get("APP_REDIS_COMPRESSION_CODEC", CompressionCodec.ZLIB).lower()
+        )
+    )
+    compression_min_size: int = field(
+        default_factory=lambda: int(
+            os.environ.get("APP_REDIS_COMPRESSION_MIN_SIZE", 1024)
+        )
+    )
+    compression_level: int = field(
+        default_factory=lambda: int(os.environ.get("APP_REDIS_COMPRESSION_LEVEL", 1))
+    )
+    single_flight_lock_ttl: float = field(
+        default_factory=lambda: float(
+            os.environ.get("APP_REDIS_SINGLE_FLIGHT_LOCK_TTL", 10.0)
+        )
+    )
+    single_flight_wait_timeout: float = field(
+        default_factory=lambda: float(
+            os.environ.get("APP_REDIS_SINGLE_FLIGHT_WAIT_TIMEOUT", 5.0)
+        )
+    )
+    single_flight_poll_interval: float = field(
+        default_factory=lambda: float(
+            os.environ.get("APP_REDIS_SINGLE_FLIGHT_POLL_INTERVAL", 0.1)
+        )
+    )
+    write_queue_size: int = field(
+        default_factory=lambda: int(os.environ.get("APP_REDIS_WRITE_QUEUE_SIZE", 1024))
+    )
+    write_batch_size: int = field(
+        default_factory=lambda: int(os.environ.get("APP_REDIS_WRITE_BATCH_SIZE", 100))
+    )
 
     @property
     def dsn(self) -> str:
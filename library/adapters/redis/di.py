@@ -2,9 +2,16 @@ from collections.abc import AsyncIterator
 
 from aiocache import BaseCache
 from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
 
 from library.adapters.redis.cache import get_redis_cache
+from library.adapters.redis.compression import Compressor
 from library.adapters.redis.config import RedisConfig
+from library.adapters.redis.single_flight import RedisSingleFlight
+from library.adapters.redis.tags import RedisCacheTags
+from library.application.cache_writer import CacheWriter
+from library.application.cached import ICacheTags
+from library.application.reduced import ISingleFlight
 
 
 class RedisProvider(Provider):
@@ -15,6 +22,44 @@ class RedisProvider(Provider):
         redis_cache = get_redis_cache(
             host=config.host,
             port=config.port,
+            compressor=Compressor(
+                codec=config.compression_codec,
+                min_size=config.compression_min_size,
+                level=config.compression_level,
+            ),
         )
         yield redis_cache
         await redis_cache.close()
+
+    @provide()
+    async def redis(self, config: RedisConfig) -> AsyncIterator[Redis]:
+        redis = Redis.from_url(config.dsn)
+        yield redis
+        await redis.aclose()
+
+    @provide()
+    def single_flight(self, redis: Redis, config: RedisConfig) -> ISingleFlight:
+        return RedisSingleFlight(
+            redis,
+            lock_ttl=config.single_flight_lock_ttl,
+            wait_timeout=config.single_flight_wait_timeout,
+            poll_interval=config.single_flight_poll_interval,
+        )
+
+    @provide()
+    async def cache_writer(
+        self, cache: BaseCache, cache_tags: ICacheTags, config: RedisConfig
+    ) -> AsyncIterator[CacheWriter]:
+        cache_writer = CacheWriter(
+            cache,
+            tags=cache_tags,
+            max_size=config.write_queue_size,
+            batch_size=config.write_batch_size,
+        )
+        cache_writer.start()
+        yield cache_writer
+        await cache_writer.close()
+
+    @provide()
+    def cache_tags(self, redis: Redis) -> ICacheTags:
+        return RedisCacheTags(redis)
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Final
+
+from redis.asyncio import Redis
+
+# Returns how long to wait before retrying, or 0 if a token was taken
+_ACQUIRE_SCRIPT: Final[str] = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "updated_at")
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "updated_at", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisTokenBucket:
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        key: str,
+        rate: float,
+        capacity: float,
+        prefix: str = "rate-limit",
+    ) -> None:
+        self._key = f"{prefix}:{key}"
+        self._rate = rate
+        self._capacity = capacity
+        self._acquire = redis.register_script(_ACQUIRE_SCRIPT)
+
+    async def acquire(self) -> None:
+        while (wait := await self._take()) > 0:
+            await asyncio.sleep(wait)
+
+    async def _take(self) -> float:
+        wait = await self._acquire(keys=[self._key], args=[self._rate, self._capacity])
+        return float(wait)
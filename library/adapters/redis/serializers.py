@@ -0,0 +1,21 @@
+from typing import Any
+
+import msgspec
+from aiocache.serializers import BaseSerializer
+
+
+class MsgspecSerializer(BaseSerializer):
+    DEFAULT_ENCODING = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder()
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def loads(self, value: bytes | None) -> Any:
+        if value is None:
+            return None
+        return self._decoder.decode(value)
@@ -0,0 +1,114 @@
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Final, TypeVar
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from library.application.reduced import Fence, StoreResult
+
+RT = TypeVar("RT")
+
+log = logging.getLogger(__name__)
+
+# Published instead of the fencing token when the leader's result was not
+# stored, so that waiters stop polling the cache and compute right away
+NO_VALUE: Final[bytes] = b"no-value"
+
+# Deletes the lock only if it is still held by the caller's fencing token
+_RELEASE_SCRIPT: Final[str] = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisSingleFlight:
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        lock_ttl: float = 10.0,
+        wait_timeout: float = 5.0,
+        poll_interval: float = 0.1,
+        prefix: str = "single-flight",
+    ) -> None:
+        self._redis = redis
+        self._lock_ttl_ms = int(lock_ttl * 1000)
+        self._wait_timeout = wait_timeout
+        self._poll_interval = poll_interval
+        self._prefix = prefix
+        self._release = redis.register_script(_RELEASE_SCRIPT)
+
+    async def __call__(
+        self,
+        ident: str,
+        *,
+        compute: Callable[[], Awaitable[RT]],
+        store: Callable[[RT, Fence], Awaitable[StoreResult]],
+        read: Callable[[], Awaitable[RT | None]],
+    ) -> RT:
+        fence = Fence(
+            key=f"{self._prefix}:lock:{ident}",
+            token=str(await self._redis.incr(f"{self._prefix}:fence")),
+        )
+        channel = f"{self._prefix}:done:{ident}"
+        if await self._acquire(fence):
+            return await self._lead(fence, channel, compute, store, read)
+
+        deadline = time.monotonic() + self._wait_timeout
+        async with self._redis.pubsub() as pubsub:
+            await pubsub.subscribe(channel)
+            while (remaining := deadline - time.monotonic()) > 0:
+                value = await read()
+                if value is not None:
+                    return value
+                # The leader is gone without a result: compete for the lock
+                # again instead of letting every waiter compute at once
+                if await self._acquire(fence):
+                    return await self._lead(fence, channel, compute, store, read)
+                if await self._wait(pubsub, min(self._poll_interval, remaining)):
+                    log.debug("Single-flight leader for %s stored nothing", ident)
+                    return await compute()
+
+        log.warning("Single-flight wait for %s timed out, computing locally", ident)
+        return await compute()
+
+    async def _acquire(self, fence: Fence) -> bool:
+        return bool(
+            await self._redis.set(fence.key, fence.token, nx=True, px=self._lock_ttl_ms)
+        )
+
+    async def _lead(
+        self,
+        fence: Fence,
+        channel: str,
+        compute: Callable[[], Awaitable[RT]],
+        store: Callable[[RT, Fence], Awaitable[StoreResult]],
+        read: Callable[[], Awaitable[RT | None]],
+    ) -> RT:
+        result: StoreResult | None = None
+        try:
+            value = await read()
+            if value is not None:
+                return value
+            value = await compute()
+            result = await store(value, fence)
+            if result is StoreResult.FENCED_OUT:
+                log.warning("Single-flight lock %s expired before store", fence.key)
+            elif result is StoreResult.SKIPPED:
+                log.debug("Single-flight result for %s was not stored", fence.key)
+            return value
+        finally:
+            await self._release(keys=[fence.key], args=[fence.token])
+            message = NO_VALUE if result is StoreResult.SKIPPED else fence.token
+            await self._redis.publish(channel, message)
+
+    @staticmethod
+    async def _wait(pubsub: PubSub, timeout: float) -> bool:
+        message = await pubsub.get_message(
+            ignore_subscribe_messages=True, timeout=timeout
+        )
+        return message is not None and message["data"] == NO_VALUE
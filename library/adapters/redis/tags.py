@@ -0,0 +1,36 @@
+from collections.abc import Sequence
+from typing import Final
+
+from redis.asyncio import Redis
+
+# Members are unlinked in chunks to stay below Lua's unpack() limit
+_INVALIDATE_SCRIPT: Final[str] = """
+local keys = redis.call("SMEMBERS", KEYS[1])
+for i = 1, #keys, 1000 do
+    redis.call("UNLINK", unpack(keys, i, math.min(i + 999, #keys)))
+end
+redis.call("UNLINK", KEYS[1])
+return #keys
+"""
+
+
+class RedisCacheTags:
+    def __init__(self, redis: Redis, *, prefix: str = "cache-tag") -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._invalidate = redis.register_script(_INVALIDATE_SCRIPT)
+
+    async def tag(self, key: str, tags: Sequence[str], ttl: int) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, key)
+                pipe.expire(tag_key, ttl, nx=True)
+                pipe.expire(tag_key, ttl, gt=True)
+            await pipe.execute()
+
+    async def invalidate_tag(self, tag: str) -> int:
+        return int(await self._invalidate(keys=[self._tag_key(tag)]))
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._prefix}:{tag}"
@@ -0,0 +1,59 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping, Sequence
+
+from library.application.metrics import BATCH_LOADER_BATCH_SIZE
+
+
+class BatchLoader[Key: Hashable, Value]:
+    def __init__(
+        self,
+        load: Callable[[Sequence[Key]], Awaitable[Mapping[Key, Value]]],
+        *,
+        name: str = "default",
+        max_batch_size: int = 100,
+        delay: float = 0.002,
+    ) -> None:
+        self._load = load
+        self._name = name
+        self._max_batch_size = max_batch_size
+        self._delay = delay
+        self._pending: dict[Key, asyncio.Future[Value | None]] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: Key) -> Value | None:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+            elif self._handle is None:
+                self._handle = loop.call_later(self._delay, self._dispatch)
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, {}
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[Key, asyncio.Future[Value | None]]) -> None:
+        BATCH_LOADER_BATCH_SIZE.labels(self._name).observe(len(batch))
+        try:
+            values = await self._load(list(batch))
+        except Exception as e:  # noqa: BLE001
+            for future in batch.values():
+                future.set_exception(e)
+                # Callers may have gone away: don't log it as never retrieved
+                future.exception()
+        else:
+            for key, future in batch.items():
+                future.set_result(values.get(key))
+        finally:
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
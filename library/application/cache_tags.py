@@ -0,0 +1,21 @@
+import logging
+from collections.abc import Sequence
+from typing import Protocol
+
+from library.application.metrics import CACHE_ERRORS, CacheOperation
+
+log = logging.getLogger(__name__)
+
+
+class ICacheTags(Protocol):
+    async def tag(self, key: str, tags: Sequence[str], ttl: int) -> None: ...
+
+    async def invalidate_tag(self, tag: str) -> int: ...
+
+
+async def invalidate_tag(cache_tags: ICacheTags, tag: str) -> None:
+    try:
+        await cache_tags.invalidate_tag(tag)
+    except Exception:
+        CACHE_ERRORS.labels(tag, CacheOperation.INVALIDATE).inc()
+        log.warning("Failed to invalidate cache tag %s", tag, exc_info=True)
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import NamedTuple
+
+from aiocache import BaseCache
+
+from library.application.cache_tags import ICacheTags
+from library.application.metrics import CACHE_WRITES_DROPPED
+
+log = logging.getLogger(__name__)
+
+
+class _Write(NamedTuple):
+    key: str
+    value: bytes
+    ttl: int
+    tags: Sequence[str]
+
+
+def _identity(value: bytes) -> bytes:
+    return value
+
+
+class CacheWriter:
+    def __init__(
+        self,
+        cache: BaseCache,
+        *,
+        tags: ICacheTags | None = None,
+        max_size: int = 1024,
+        batch_size: int = 100,
+    ) -> None:
+        self._cache = cache
+        self._tags = tags
+        self._queue: asyncio.Queue[_Write | None] = asyncio.Queue(maxsize=max_size)
+        self._batch_size = batch_size
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def put(
+        self, key: str, value: bytes, ttl: int, *, tags: Sequence[str] = ()
+    ) -> bool:
+        try:
+            self._queue.put_nowait(_Write(key=key, value=value, ttl=ttl, tags=tags))
+        except asyncio.QueueFull:
+            CACHE_WRITES_DROPPED.inc()
+            return False
+        return True
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            write = await self._queue.get()
+            batch: list[_Write] = []
+            while write is not None:
+                batch.append(write)
+                if len(batch) >= self._batch_size or self._queue.empty():
+                    break
+                write = self._queue.get_nowait()
+            await self._write(batch)
+            if write is None:
+                return
+
+    async def _write(self, batch: list[_Write]) -> None:
+        pairs_by_ttl: defaultdict[int, list[tuple[str, bytes]]] = defaultdict(list)
+        for write in batch:
+            if not await self._tag(write):
+                continue
+            pairs_by_ttl[write.ttl].append((write.key, write.value))
+        for ttl, pairs in pairs_by_ttl.items():
+            try:
+                await self._cache.multi_set(pairs, ttl=ttl, dumps_fn=_identity)
+            except Exception:
+                log.exception("Failed to write %d cache entries", len(pairs))
+
+    async def _tag(self, write: _Write) -> bool:
+        if not write.tags or self._tags is None:
+            return True
+        try:
+            await self._tags.tag(write.key, write.tags, write.ttl)
+        except Exception:
+            log.exception("Failed to tag cache entry %s", write.key)
+            return False
+        return True
@@ -1,37 +1,451 @@
 import abc
-from collections.abc import Awaitable, Callable
-from functools import wraps
-from typing import Concatenate, ParamSpec, TypeVar
+import logging
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence, Sized
+from dataclasses import dataclass, field
+from functools import cached_property, wraps
+from types import MappingProxyType
+from typing import (
+    Any,
+    Concatenate,
+    ParamSpec,
+    Protocol,
+    TypeVar,
+    cast,
+    get_type_hints,
+)
 
 from aiocache import BaseCache
 
+from library.application.cache_tags import ICacheTags
+from library.application.cache_writer import CacheWriter
+from library.application.exceptions import LibraryException
+from library.application.local_cache import LocalCache, LocalCacheConfig
+from library.application.metrics import (
+    CACHE_ERRORS,
+    CACHE_HITS,
+    CACHE_MISSES,
+    CACHE_OPERATION_SECONDS,
+    CACHE_REFRESHES,
+    CACHE_STALE_SERVED,
+    CacheOperation,
+    CacheTier,
+)
+from library.application.reduced import (
+    AsyncReducer,
+    Fence,
+    ISingleFlight,
+    StoreResult,
+)
+from library.application.serializers import CacheCodec, get_codec
+
 P = ParamSpec("P")
 RT = TypeVar("RT")
 
+log = logging.getLogger(__name__)
+
+
+def is_empty_sized(value: Any) -> bool:
+    return isinstance(value, Sized) and not value
+
+
+ErrorFactory = Callable[..., LibraryException]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CachedError:
+    name: str
+    message: str
+
+    @classmethod
+    def from_exception(cls, exc: LibraryException) -> "CachedError":
+        return cls(name=exc.__class__.__name__, message=exc.message)
+
+    def restore(
+        self,
+        factories: Mapping[type[LibraryException], ErrorFactory],
+        *args: Any,
+        **kwargs: Any,
+    ) -> LibraryException:
+        for exc_type, factory in factories.items():
+            if exc_type.__name__ == self.name:
+                return factory(*args, **kwargs)
+        return LibraryException(self.message)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CacheEntry[T]:
+    value: T | None = None
+    error: CachedError | None = None
+    fresh_until: float
+    stale_until: float
+    delta: float = 0.0
+
+    def is_servable(self, now: float) -> bool:
+        return now < self.stale_until
+
+    def should_refresh(self, now: float, beta: float) -> bool:
+        if beta > 0 and self.delta > 0:
+            # XFetch: refresh ahead of time with a probability that grows
+            # as expiry approaches and with the cost of the recomputation
+            now -= self.delta * beta * math.log(1.0 - random.random())
+        return now >= self.fresh_until
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CachePolicy:
+    key_func: Callable[..., str] | None = None
+    ttl: int = 60 * 60
+    local: LocalCacheConfig | None = None
+    stale_ttl: int | None = None
+    xfetch_beta: float = 0.0
+    codec: CacheCodec | None = None
+    distributed: bool = False
+    write_behind: bool = False
+    tags: Callable[..., Sequence[str]] | None = None
+    negative_ttl: int | None = None
+    negative_exceptions: Mapping[type[LibraryException], ErrorFactory] = field(
+        default_factory=dict
+    )
+    empty_ttl: int | None = None
+    is_empty: Callable[[Any], bool] = is_empty_sized
+    stale_if_error: int | None = None
+    stale_if_error_exceptions: tuple[type[Exception], ...] = ()
+
+    @property
+    def hard_ttl(self) -> int:
+        return self.ttl + (self.stale_ttl or 0)
+
+    def ttls(self, value: Any) -> tuple[int, int] | None:
+        if value is None:
+            if self.negative_ttl is None:
+                return None
+            return self.negative_ttl, self.negative_ttl
+        if self.empty_ttl is not None and self.is_empty(value):
+            return self.empty_ttl, self.empty_ttl
+        return self.ttl, self.hard_ttl
+
+
+class IFencedCache(Protocol):
+    async def set_fenced(
+        self,
+        key: str,
+        value: Any,
+        *,
+        ttl: int,
+        fence: Fence,
+        dumps_fn: Callable[[Any], bytes] | None = None,
+    ) -> bool: ...
+
 
 class ICached(abc.ABC):
     _cache: BaseCache
+    _single_flight: ISingleFlight | None = None
+    _cache_writer: CacheWriter | None = None
+    _cache_tags: ICacheTags | None = None
+
+    @cached_property
+    def _local_caches(self) -> dict[str, LocalCache]:
+        return {}
+
+    @cached_property
+    def _refresher(self) -> AsyncReducer:
+        return AsyncReducer()
+
+    def _get_local_cache(self, name: str, config: LocalCacheConfig) -> LocalCache:
+        local_cache = self._local_caches.get(name)
+        if local_cache is None:
+            local_cache = self._local_caches[name] = LocalCache(config)
+        return local_cache
+
+
+class CachedMethod[**Params, Result]:
+    def __init__(
+        self,
+        func: Callable[Concatenate[ICached, Params], Awaitable[Result]],
+        policy: CachePolicy,
+    ) -> None:
+        self._func = func
+        self._policy = policy
+        self._codec = policy.codec
+
+    @property
+    def codec(self) -> CacheCodec:
+        if self._codec is None:
+            return_type = get_type_hints(self._func)["return"]
+            self._codec = get_codec(CacheEntry[return_type])  # type: ignore[valid-type]
+        return self._codec
 
+    def key(self, owner: ICached, *args: Params.args, **kwargs: Params.kwargs) -> str:
+        if self._policy.key_func is not None:
+            return self._policy.key_func(*args, **kwargs)
+        return f"{owner.__class__.__name__}:{self._func.__name__}:{args}:{kwargs}"
+
+    def tags(self, *args: Params.args, **kwargs: Params.kwargs) -> Sequence[str]:
+        if self._policy.tags is None:
+            return ()
+        return self._policy.tags(*args, **kwargs)
+
+    def name(self, owner: ICached) -> str:
+        return f"{owner.__class__.__name__}.{self._func.__name__}"
+
+    def local_cache(self, owner: ICached) -> LocalCache | None:
+        if self._policy.local is None:
+            return None
+        return owner._get_local_cache(self._func.__name__, self._policy.local)
+
+    async def __call__(
+        self, owner: ICached, *args: Params.args, **kwargs: Params.kwargs
+    ) -> Result:
+        key = self.key(owner, *args, **kwargs)
+        entry = await self._read(owner, key)
+        if entry is None:
+            entry = await self._fill_or_stale(owner, key, *args, **kwargs)
+        elif entry.should_refresh(time.time(), self._policy.xfetch_beta):
+            owner._refresher.schedule(
+                self._refresh(owner, key, *args, **kwargs),
+                ident=key,
+                name=self.name(owner),
+            )
+        if entry.error is not None:
+            raise entry.error.restore(self._policy.negative_exceptions, *args, **kwargs)
+        return cast(Result, entry.value)
+
+    async def _read(self, owner: ICached, key: str) -> CacheEntry[Result] | None:
+        now = time.time()
+        name = self.name(owner)
+        local_cache = self.local_cache(owner)
+        if local_cache is not None:
+            entry = local_cache.get(key)
+            if entry is not None and entry.is_servable(now):
+                CACHE_HITS.labels(name, CacheTier.LOCAL).inc()
+                return entry
+            CACHE_MISSES.labels(name, CacheTier.LOCAL).inc()
+
+        entry = await self._get(owner, key)
+        if entry is None or not entry.is_servable(now):
+            CACHE_MISSES.labels(name, CacheTier.REDIS).inc()
+            return None
+        CACHE_HITS.labels(name, CacheTier.REDIS).inc()
+        if local_cache is not None:
+            local_cache.set(key, entry)
+        return entry
+
+    async def _peek(self, owner: ICached, key: str) -> CacheEntry[Result] | None:
+        entry = await self._get(owner, key)
+        if entry is None or not entry.is_servable(time.time()):
+            return None
+        return entry
+
+    async def _fill_or_stale(
+        self, owner: ICached, key: str, *args: Params.args, **kwargs: Params.kwargs
+    ) -> CacheEntry[Result]:
+        try:
+            return await self._fill(owner, key, *args, **kwargs)
+        except self._policy.stale_if_error_exceptions:
+            entry = await self._get(owner, key)
+            if entry is None:
+                raise
+            CACHE_STALE_SERVED.labels(self.name(owner)).inc()
+            log.warning("Serving expired cache entry %s", key, exc_info=True)
+            return entry
+
+    async def _fill(
+        self, owner: ICached, key: str, *args: Params.args, **kwargs: Params.kwargs
+    ) -> CacheEntry[Result]:
+        tags = self.tags(*args, **kwargs)
+        if self._policy.distributed and owner._single_flight is not None:
+            return await owner._single_flight(
+                key,
+                compute=lambda: self._execute(owner, *args, **kwargs),
+                store=lambda entry, fence: self._store(
+                    owner, key, entry, tags, write_behind=False, fence=fence
+                ),
+                read=lambda: self._peek(owner, key),
+            )
+        entry = await self._execute(owner, *args, **kwargs)
+        await self._store(owner, key, entry, tags)
+        return entry
+
+    async def _execute(
+        self, owner: ICached, *args: Params.args, **kwargs: Params.kwargs
+    ) -> CacheEntry[Result]:
+        started_at = time.monotonic()
+        result: Result | None = None
+        error: CachedError | None = None
+        try:
+            result = await self._func(owner, *args, **kwargs)
+        except tuple(self._policy.negative_exceptions) as e:
+            if self._policy.negative_ttl is None:
+                raise
+            error = CachedError.from_exception(e)
+        now = time.time()
+        fresh_ttl, hard_ttl = self._policy.ttls(result) or (0, 0)
+        return CacheEntry(
+            value=result,
+            error=error,
+            fresh_until=now + fresh_ttl,
+            stale_until=now + hard_ttl,
+            delta=time.monotonic() - started_at,
+        )
+
+    async def _store(
+        self,
+        owner: ICached,
+        key: str,
+        entry: CacheEntry[Result],
+        tags: Sequence[str],
+        *,
+        write_behind: bool = True,
+        fence: Fence | None = None,
+    ) -> StoreResult:
+        ttl = math.ceil(entry.stale_until - time.time())
+        if ttl <= 0:
+            return StoreResult.SKIPPED
+        ttl += self._policy.stale_if_error or 0
+        cache_tags = owner._cache_tags if tags else None
+        writer = owner._cache_writer if self._policy.write_behind else None
+        if write_behind and writer is not None:
+            writer.put(key, self.codec.dumps(entry), ttl, tags=tags)
+        else:
+            if cache_tags is not None and not await self._tag(
+                owner, cache_tags, key, tags, ttl
+            ):
+                return StoreResult.SKIPPED
+            result = await self._set(owner, key, entry, ttl, fence=fence)
+            if result is not StoreResult.STORED:
+                return result
+        local_cache = self.local_cache(owner)
+        if local_cache is not None:
+            local_cache.set(key, entry)
+        return StoreResult.STORED
+
+    async def _get(self, owner: ICached, key: str) -> CacheEntry[Result] | None:
+        name = self.name(owner)
+        started_at = time.perf_counter()
+        try:
+            return await owner._cache.get(key, loads_fn=self.codec.loads)
+        except Exception:
+            CACHE_ERRORS.labels(name, CacheOperation.GET).inc()
+            log.warning("Failed to read cache entry for %s", name, exc_info=True)
+            return None
+        finally:
+            CACHE_OPERATION_SECONDS.labels(name, CacheOperation.GET).observe(
+                time.perf_counter() - started_at
+            )
+
+    async def _tag(
+        self,
+        owner: ICached,
+        cache_tags: ICacheTags,
+        key: str,
+        tags: Sequence[str],
+        ttl: int,
+    ) -> bool:
+        try:
+            await cache_tags.tag(key, tags, ttl)
+        except Exception:
+            name = self.name(owner)
+            CACHE_ERRORS.labels(name, CacheOperation.TAG).inc()
+            log.warning("Failed to tag cache entry for %s", name, exc_info=True)
+            return False
+        return True
+
+    async def _set(
+        self,
+        owner: ICached,
+        key: str,
+        entry: CacheEntry[Result],
+        ttl: int,
+        *,
+        fence: Fence | None = None,
+    ) -> StoreResult:
+        name = self.name(owner)
+        started_at = time.perf_counter()
+        try:
+            if fence is None:
+                await owner._cache.set(key, entry, ttl=ttl, dumps_fn=self.codec.dumps)
+            elif not await cast(IFencedCache, owner._cache).set_fenced(
+                key, entry, ttl=ttl, fence=fence, dumps_fn=self.codec.dumps
+            ):
+                return StoreResult.FENCED_OUT
+            return StoreResult.STORED
+        except Exception:
+            CACHE_ERRORS.labels(name, CacheOperation.SET).inc()
+            log.warning("Failed to write cache entry for %s", name, exc_info=True)
+            return StoreResult.SKIPPED
+        finally:
+            CACHE_OPERATION_SECONDS.labels(name, CacheOperation.SET).observe(
+                time.perf_counter() - started_at
+            )
+
+    async def _refresh(
+        self, owner: ICached, key: str, *args: Params.args, **kwargs: Params.kwargs
+    ) -> None:
+        CACHE_REFRESHES.labels(self.name(owner)).inc()
+        try:
+            entry = await self._execute(owner, *args, **kwargs)
+            await self._store(owner, key, entry, self.tags(*args, **kwargs))
+        except Exception:
+            log.exception("Failed to refresh cache entry %s", key)
+
+
+def cached(
+    key_func: Callable[..., str] | None = None,
+    ttl: int = 60 * 60,
+    local: LocalCacheConfig | None = None,
+    stale_ttl: int | None = None,
+    xfetch_beta: float = 0.0,
+    codec: CacheCodec | None = None,
+    distributed: bool = False,
+    write_behind: bool = False,
+    tags: Callable[..., Sequence[str]] | None = None,
+    negative_ttl: int | None = None,
+    negative_exceptions: Mapping[type[LibraryException], ErrorFactory] = (
+        MappingProxyType({})
+    ),
+    empty_ttl: int | None = None,
+    is_empty: Callable[[Any], bool] = is_empty_sized,
+    stale_if_error: int | None = None,
+    stale_if_error_exceptions: tuple[type[Exception], ...] = (),
+) -> Callable:
+    policy = CachePolicy(
+        key_func=key_func,
+        ttl=ttl,
+        local=local,
+        stale_ttl=stale_ttl,
+        xfetch_beta=xfetch_beta,
+        codec=codec,
+        distributed=distributed,
+        write_behind=write_behind,
+        tags=tags,
+        negative_ttl=negative_ttl,
+        negative_exceptions=negative_exceptions,
+        empty_ttl=empty_ttl,
+        is_empty=is_empty,
+        stale_if_error=stale_if_error,
+        stale_if_error_exceptions=stale_if_error_exceptions,
+    )
 
-def cached(key_func: Callable[..., str] | None = None, ttl: int = 60 * 60) -> Callable:
     def decorator(
         func: Callable[Concatenate[ICached, P], Awaitable[RT]],
     ) -> Callable[Concatenate[ICached, P], Awaitable[RT]]:
+        method = CachedMethod(func, policy)
+
         @wraps(func)
         async def wrapped(self: ICached, *args: P.args, **kwargs: P.kwargs) -> RT:
-            key = (
-                key_func(*args, **kwargs)
-                if key_func
-                else f"{self.__class__.__name__}:{func.__name__}:{args}:{kwargs}"
-            )
-
-            cached_result = await self._cache.get(key)
-            if cached_result is not None:
-                return cached_result
-            result = await func(self, *args, **kwargs)
-            await self._cache.set(key, result, ttl=ttl)
-            return result
+            return await method(self, *args, **kwargs)
 
         return wrapped
 
     return decorator
+
+
+async def evict(cache: BaseCache, key: str, *, name: str) -> None:
+    try:
+        await cache.delete(key)
+    except Exception:
+        CACHE_ERRORS.labels(name, CacheOperation.DELETE).inc()
+        log.warning("Failed to evict cache entry %s", key, exc_info=True)
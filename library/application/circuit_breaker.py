@@ -0,0 +1,122 @@
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from enum import IntEnum, unique
+from typing import TypeVar
+
+from library.application.exceptions import CircuitOpenException
+from library.application.metrics import (
+    CIRCUIT_BREAKER_REJECTED,
+    CIRCUIT_BREAKER_STATE,
+)
+
+RT = TypeVar("RT")
+
+
+@unique
+class CircuitState(IntEnum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        *,
+        name: str,
+        failure_rate: float = 0.5,
+        slow_call_rate: float = 0.5,
+        slow_call_duration: float = 5.0,
+        min_calls: int = 20,
+        window: float = 30.0,
+        open_duration: float = 10.0,
+        half_open_calls: int = 1,
+    ) -> None:
+        self._name = name
+        self._failure_rate = failure_rate
+        self._slow_call_rate = slow_call_rate
+        self._slow_call_duration = slow_call_duration
+        self._min_calls = min_calls
+        self._window = window
+        self._open_duration = open_duration
+        self._half_open_calls = half_open_calls
+        self._outcomes: deque[tuple[float, bool, bool]] = deque()
+        self._opened_at = 0.0
+        self._probes = 0
+        self._set_state(CircuitState.CLOSED)
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self._open_duration
+        ):
+            self._set_state(CircuitState.HALF_OPEN)
+        return self._state
+
+    async def call(
+        self,
+        func: Callable[[], Awaitable[RT]],
+        *,
+        is_failure: Callable[[Exception], bool] = lambda e: True,
+    ) -> RT:
+        probe = self._acquire()
+        started_at = time.monotonic()
+        try:
+            result = await func()
+        except Exception as e:
+            self._record(time.monotonic() - started_at, is_failure(e), probe)
+            raise
+        except BaseException:
+            if probe:
+                self._probes -= 1
+            raise
+        self._record(time.monotonic() - started_at, False, probe)
+        return result
+
+    def _acquire(self) -> bool:
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return False
+        if state == CircuitState.HALF_OPEN and self._probes < self._half_open_calls:
+            self._probes += 1
+            return True
+        CIRCUIT_BREAKER_REJECTED.labels(self._name).inc()
+        raise CircuitOpenException(f"Circuit {self._name} is open")
+
+    def _record(self, duration: float, failed: bool, probe: bool) -> None:
+        slow = duration >= self._slow_call_duration
+        if probe:
+            self._probes -= 1
+            if failed or slow:
+                self._open()
+            elif self._state == CircuitState.HALF_OPEN:
+                self._set_state(CircuitState.CLOSED)
+            return
+        now = time.monotonic()
+        self._outcomes.append((now, failed, slow))
+        while self._outcomes and self._outcomes[0][0] <= now - self._window:
+            self._outcomes.popleft()
+        if self._state == CircuitState.CLOSED and self._is_unhealthy():
+            self._open()
+
+    def _is_unhealthy(self) -> bool:
+        total = len(self._outcomes)
+        if total < self._min_calls:
+            return False
+        failures = sum(failed for _, failed, _ in self._outcomes)
+        slow_calls = sum(slow for _, _, slow in self._outcomes)
+        return (
+            failures / total >= self._failure_rate
+            or slow_calls / total >= self._slow_call_rate
+        )
+
+    def _open(self) -> None:
+        self._outcomes.clear()
+        self._opened_at = time.monotonic()
+        self._set_state(CircuitState.OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        self._state = state
+        CIRCUIT_BREAKER_STATE.labels(self._name).set(state)
@@ -14,6 +14,12 @@ class AppConfig:
     debug: bool = field(
         default_factory=lambda: environ.get("APP_DEBUG", "False").lower() == "true"
     )
+    upload_concurrency: int = field(
+        default_factory=lambda: int(environ.get("APP_UPLOAD_CONCURRENCY", 10))
+    )
+    upload_write_batch_size: int = field(
+        default_factory=lambda: int(environ.get("APP_UPLOAD_WRITE_BATCH_SIZE", 1_000))
+    )
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -16,3 +16,6 @@ class EmptyPayloadException(LibraryException): ...
 
 
 class EntityAlreadyExistsException(LibraryException): ...
+
+
+class CircuitOpenException(LibraryException): ...
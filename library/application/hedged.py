@@ -0,0 +1,108 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from library.application.metrics import (
+    CLIENT_HEDGE_DELAY_SECONDS,
+    CLIENT_HEDGE_WINS,
+    CLIENT_HEDGED_CALLS,
+    CLIENT_HEDGES,
+)
+from library.application.retry import RetryBudget
+
+RT = TypeVar("RT")
+
+
+class LatencyTracker:
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        size: int = 1000,
+        min_samples: int = 100,
+        refresh_every: int = 50,
+    ) -> None:
+        self._percentile = percentile
+        self._samples: deque[float] = deque(maxlen=size)
+        self._min_samples = min_samples
+        self._refresh_every = refresh_every
+        self._recorded = 0
+        self._value: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        return self._value
+
+    def record(self, latency: float) -> None:
+        self._samples.append(latency)
+        self._recorded += 1
+        if len(self._samples) < self._min_samples:
+            return
+        if self._value is None or self._recorded % self._refresh_every == 0:
+            ordered = sorted(self._samples)
+            index = min(len(ordered) - 1, int(self._percentile * len(ordered)))
+            self._value = ordered[index]
+
+
+class Hedger:
+    def __init__(
+        self,
+        *,
+        name: str,
+        percentile: float = 0.95,
+        max_ratio: float = 0.05,
+        min_samples: int = 100,
+    ) -> None:
+        self._name = name
+        self._tracker = LatencyTracker(percentile=percentile, min_samples=min_samples)
+        self._budget = RetryBudget(ratio=max_ratio, min_per_second=0, capacity=1)
+
+    async def __call__(self, func: Callable[[], Awaitable[RT]]) -> RT:
+        CLIENT_HEDGED_CALLS.labels(self._name).inc()
+        self._budget.deposit()
+        started_at = time.monotonic()
+        primary = asyncio.ensure_future(self._timed(func))
+        tasks: set[asyncio.Future[RT]] = {primary}
+        try:
+            delay = self._tracker.value
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._budget.withdraw():
+                    CLIENT_HEDGES.labels(self._name).inc()
+                    tasks.add(asyncio.ensure_future(self._timed(func)))
+            result = await self._first_success(primary, tasks)
+            if not primary.done():
+                self._record(time.monotonic() - started_at)
+            return result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _first_success(
+        self, primary: asyncio.Future[RT], tasks: set[asyncio.Future[RT]]
+    ) -> RT:
+        pending = set(tasks)
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    if task is not primary:
+                        CLIENT_HEDGE_WINS.labels(self._name).inc()
+                    return task.result()
+            if not pending:
+                return primary.result()
+
+    async def _timed(self, func: Callable[[], Awaitable[RT]]) -> RT:
+        started_at = time.monotonic()
+        result = await func()
+        self._record(time.monotonic() - started_at)
+        return result
+
+    def _record(self, latency: float) -> None:
+        self._tracker.record(latency)
+        if self._tracker.value is not None:
+            CLIENT_HEDGE_DELAY_SECONDS.labels(self._name).set(self._tracker.value)
@@ -0,0 +1,76 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+import msgspec
+
+
+def encoded_size(value: Any) -> int:
+    return len(msgspec.msgpack.encode(value))
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class LocalCacheConfig:
+    ttl: float = 60
+    max_entries: int = 1024
+    max_bytes: int = 16 * 1024 * 1024
+    sizeof: Callable[[Any], int] = encoded_size
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    size: int
+    value: Any
+
+
+class LocalCache:
+    def __init__(self, config: LocalCacheConfig) -> None:
+        self._config = config
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def set(self, key: str, value: Any) -> None:
+        self.delete(key)
+        size = self._config.sizeof(value)
+        if size > self._config.max_bytes:
+            return
+        self._entries[key] = _Entry(
+            expires_at=time.monotonic() + self._config.ttl,
+            size=size,
+            value=value,
+        )
+        self._size += size
+        while (
+            len(self._entries) > self._config.max_entries
+            or self._size > self._config.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
@@ -0,0 +1,143 @@
+from enum import StrEnum, unique
+
+from prometheus_client import Counter, Gauge, Histogram
+
+
+@unique
+class CacheTier(StrEnum):
+    LOCAL = "local"
+    REDIS = "redis"
+
+
+@unique
+class CacheOperation(StrEnum):
+    GET = "get"
+    SET = "set"
+    DELETE = "delete"
+    TAG = "tag"
+    INVALIDATE = "invalidate"
+
+
+CACHE_HITS = Counter(
+    "library_cache_hits_total",
+    "Number of cache hits",
+    ["cache", "tier"],
+)
+CACHE_MISSES = Counter(
+    "library_cache_misses_total",
+    "Number of cache misses",
+    ["cache", "tier"],
+)
+CACHE_REFRESHES = Counter(
+    "library_cache_refreshes_total",
+    "Number of background cache refreshes",
+    ["cache"],
+)
+CACHE_COMPRESSION_RATIO = Histogram(
+    "library_cache_compression_ratio",
+    "Compressed to original size ratio of cache values",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0),
+)
+CACHE_COMPRESSION_SECONDS = Histogram(
+    "library_cache_compression_seconds",
+    "Time spent compressing and decompressing cache values",
+    ["operation"],
+    buckets=(0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01),
+)
+CACHE_WRITES_DROPPED = Counter(
+    "library_cache_writes_dropped_total",
+    "Number of background cache writes dropped because the queue was full",
+)
+CACHE_ERRORS = Counter(
+    "library_cache_errors_total",
+    "Number of failed cache backend operations",
+    ["cache", "operation"],
+)
+CACHE_OPERATION_SECONDS = Histogram(
+    "library_cache_operation_seconds",
+    "Latency of cache backend operations",
+    ["cache", "operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+REDUCER_COALESCED = Counter(
+    "library_reducer_coalesced_total",
+    "Number of calls that joined an already running call",
+    ["reducer"],
+)
+REDUCER_CANCELLED = Counter(
+    "library_reducer_cancelled_total",
+    "Number of running calls cancelled after all their waiters left",
+    ["reducer"],
+)
+REDUCER_IN_FLIGHT = Gauge(
+    "library_reducer_in_flight",
+    "Number of keys with a running call",
+    ["reducer"],
+)
+BATCH_LOADER_BATCH_SIZE = Histogram(
+    "library_batch_loader_batch_size",
+    "Number of keys resolved by a single batch load",
+    ["loader"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200),
+)
+CLIENT_QUEUE_SECONDS = Histogram(
+    "library_client_queue_seconds",
+    "Time outbound requests wait for a concurrency slot and rate limit token",
+    ["client"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+CIRCUIT_BREAKER_STATE = Gauge(
+    "library_circuit_breaker_state",
+    "Circuit breaker state: 0 closed, 1 half-open, 2 open",
+    ["circuit"],
+)
+CIRCUIT_BREAKER_REJECTED = Counter(
+    "library_circuit_breaker_rejected_total",
+    "Number of calls rejected by an open circuit breaker",
+    ["circuit"],
+)
+CLIENT_RETRIES = Counter(
+    "library_client_retries_total",
+    "Number of retried outbound requests",
+    ["client"],
+)
+CLIENT_RETRIES_DENIED = Counter(
+    "library_client_retries_denied_total",
+    "Number of retries skipped because the retry budget was exhausted",
+    ["client"],
+)
+CACHE_STALE_SERVED = Counter(
+    "library_cache_stale_served_total",
+    "Number of expired cache entries served because the source failed",
+    ["cache"],
+)
+CLIENT_HEDGED_CALLS = Counter(
+    "library_client_hedged_calls_total",
+    "Number of calls made through a hedging client",
+    ["client"],
+)
+CLIENT_HEDGES = Counter(
+    "library_client_hedges_total",
+    "Number of hedge requests sent after the primary exceeded the threshold",
+    ["client"],
+)
+CLIENT_HEDGE_WINS = Counter(
+    "library_client_hedge_wins_total",
+    "Number of calls answered by the hedge request",
+    ["client"],
+)
+CLIENT_HEDGE_DELAY_SECONDS = Gauge(
+    "library_client_hedge_delay_seconds",
+    "Current latency threshold after which a hedge request is sent",
+    ["client"],
+)
+CLIENT_POOL_CONNECTIONS = Gauge(
+    "library_client_pool_connections",
+    "Number of pooled connections by state",
+    ["client", "state"],
+)
+CLIENT_POOL_LIMIT = Gauge(
+    "library_client_pool_limit",
+    "Maximum number of connections in the pool",
+    ["client"],
+)
@@ -0,0 +1,32 @@
+import asyncio
+import time
+from typing import Protocol
+
+
+class IRateLimiter(Protocol):
+    async def acquire(self) -> None: ...
+
+
+class TokenBucket:
+    def __init__(self, *, rate: float, capacity: float) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while (wait := self._take()) > 0:
+                await asyncio.sleep(wait)
+
+    def _take(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self._rate
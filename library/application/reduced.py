@@ -1,56 +1,162 @@
 import abc
 import asyncio
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from enum import StrEnum, unique
 from functools import partial, wraps
-from typing import Any, Concatenate, ParamSpec, TypeVar
+from typing import Any, Concatenate, ParamSpec, Protocol, TypeVar
+
+from library.application.metrics import (
+    REDUCER_CANCELLED,
+    REDUCER_COALESCED,
+    REDUCER_IN_FLIGHT,
+)
 
 RT = TypeVar("RT")
 
 
+@dataclass(slots=True)
+class _Flight:
+    ident: str
+    future: asyncio.Future
+    task: asyncio.Task | None = None
+    linger: float = 0.0
+    waiters: int = 0
+    cancel_handle: asyncio.TimerHandle | None = None
+
+
 class AsyncReducer:
-    def __init__(self) -> None:
-        self._running: dict[str, asyncio.Future] = {}
+    def __init__(
+        self,
+        *,
+        cancel_orphaned: bool = True,
+        grace_period: float = 0.0,
+        max_lingering: int = 1024,
+    ) -> None:
+        self._running: dict[str, _Flight] = {}
+        self._lingering: OrderedDict[str, tuple[float, asyncio.Future]] = OrderedDict()
         self._tasks: set[asyncio.Task] = set()
+        self._cancel_orphaned = cancel_orphaned
+        self._grace_period = grace_period
+        self._max_lingering = max_lingering
 
-    def __call__(self, coro: Coroutine[Any, Any, RT], *, ident: str) -> Awaitable[RT]:
-        future, created = self._get_or_create_future(ident)
+    def __call__(
+        self,
+        coro: Coroutine[Any, Any, RT],
+        *,
+        ident: str,
+        name: str = "default",
+        linger: float = 0.0,
+    ) -> Awaitable[RT]:
+        future = self._get_lingering(ident)
+        if future is not None:
+            REDUCER_COALESCED.labels(name).inc()
+            coro.close()
+            return self._waiter(future)
+        self.schedule(coro, ident=ident, name=name, linger=linger)
+        return self._wait(self._running[ident], name)
 
-        if created:
-            self._running[ident] = future
-            coro_runner = self._runner(ident, coro, future)
+    def schedule(
+        self,
+        coro: Coroutine[Any, Any, RT],
+        *,
+        ident: str,
+        name: str = "default",
+        linger: float = 0.0,
+    ) -> asyncio.Future:
+        flight = self._running.get(ident)
+
+        if flight is None:
+            flight = self._running[ident] = _Flight(
+                ident=ident, future=asyncio.Future(), linger=linger
+            )
+            REDUCER_IN_FLIGHT.labels(name).inc()
 
-            task = asyncio.create_task(coro_runner)
+            task = asyncio.create_task(self._runner(flight, coro, name))
+            flight.task = task
             self._tasks.add(task)
             task.add_done_callback(self._tasks.discard)
         else:
+            REDUCER_COALESCED.labels(name).inc()
             coro.close()
             del coro
 
-        return self._waiter(future)
-
-    def _get_or_create_future(self, ident: str) -> tuple[asyncio.Future, bool]:
-        f = self._running.get(ident, None)
-        if f is not None:
-            return f, False
-        else:
-            f = asyncio.Future()
-            self._running[ident] = f
-            return f, True
+        return flight.future
 
     async def _runner(
         self,
-        ident: str,
+        flight: _Flight,
         coro: Coroutine[Any, Any, RT],
-        future: asyncio.Future,
+        name: str,
     ) -> None:
         try:
             result = await coro
         except (Exception, asyncio.CancelledError) as e:  # noqa: BLE001
-            future.set_exception(e)
+            if not flight.future.done():
+                flight.future.set_exception(e)
         else:
-            future.set_result(result)
+            flight.future.set_result(result)
+            if flight.linger > 0:
+                self._retain(flight)
+        finally:
+            self._forget(flight)
+            REDUCER_IN_FLIGHT.labels(name).dec()
+
+    async def _wait(self, flight: _Flight, name: str) -> RT:
+        flight.waiters += 1
+        if flight.cancel_handle is not None:
+            flight.cancel_handle.cancel()
+            flight.cancel_handle = None
+        try:
+            return await self._waiter(flight.future)
         finally:
-            del self._running[ident]
+            flight.waiters -= 1
+            if self._cancel_orphaned and not flight.waiters:
+                self._schedule_cancel(flight, name)
+
+    def _schedule_cancel(self, flight: _Flight, name: str) -> None:
+        if flight.future.done():
+            return
+        if self._grace_period > 0:
+            flight.cancel_handle = asyncio.get_running_loop().call_later(
+                self._grace_period, self._cancel, flight, name
+            )
+        else:
+            self._cancel(flight, name)
+
+    def _cancel(self, flight: _Flight, name: str) -> None:
+        flight.cancel_handle = None
+        if flight.waiters or flight.future.done() or flight.task is None:
+            return
+        self._forget(flight)
+        flight.future.cancel()
+        flight.task.cancel()
+        REDUCER_CANCELLED.labels(name).inc()
+
+    def _get_lingering(self, ident: str) -> asyncio.Future | None:
+        lingering = self._lingering.get(ident)
+        if lingering is None:
+            return None
+        expires_at, future = lingering
+        if expires_at <= time.monotonic():
+            del self._lingering[ident]
+            return None
+        return future
+
+    def _retain(self, flight: _Flight) -> None:
+        self._lingering[flight.ident] = (
+            time.monotonic() + flight.linger,
+            flight.future,
+        )
+        self._lingering.move_to_end(flight.ident)
+        while len(self._lingering) > self._max_lingering:
+            self._lingering.popitem(last=False)
+
+    def _forget(self, flight: _Flight) -> None:
+        if self._running.get(flight.ident) is flight:
+            del self._running[flight.ident]
 
     @classmethod
     async def _waiter(cls, future: asyncio.Future) -> RT:
@@ -79,6 +185,30 @@ class AsyncReducer:
         set_func(result)
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Fence:
+    key: str
+    token: str
+
+
+@unique
+class StoreResult(StrEnum):
+    STORED = "stored"
+    SKIPPED = "skipped"
+    FENCED_OUT = "fenced_out"
+
+
+class ISingleFlight(Protocol):
+    async def __call__(
+        self,
+        ident: str,
+        *,
+        compute: Callable[[], Awaitable[RT]],
+        store: Callable[[RT, Fence], Awaitable[StoreResult]],
+        read: Callable[[], Awaitable[RT | None]],
+    ) -> RT: ...
+
+
 class IReduced(abc.ABC):
     _reducer: AsyncReducer
 
@@ -88,6 +218,7 @@ P = ParamSpec("P")
 
 def reduced(
     key_func: Callable[..., str] | None = None,
+    linger: float = 0.0,
 ) -> Callable:
     def decorator(
         func: Callable[Concatenate[IReduced, P], Coroutine[Any, Any, RT]],
@@ -99,7 +230,12 @@ def reduced(
                 if key_func
                 else f"{self.__class__.__name__}:{func.__name__}:{args}:{kwargs}"
             )
-            return await self._reducer(func(self, *args, **kwargs), ident=key)
+            return await self._reducer(
+                func(self, *args, **kwargs),
+                ident=key,
+                name=f"{self.__class__.__name__}.{func.__name__}",
+                linger=linger,
+            )
 
         return wrapped
 
@@ -0,0 +1,40 @@
+import random
+import time
+
+
+def backoff_delay(attempt: int, *, base: float, cap: float) -> float:
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+class RetryBudget:
+    def __init__(
+        self,
+        *,
+        ratio: float = 0.1,
+        min_per_second: float = 1.0,
+        capacity: float = 10.0,
+    ) -> None:
+        self._ratio = ratio
+        self._min_per_second = min_per_second
+        self._capacity = capacity
+        self._balance = capacity
+        self._updated_at = time.monotonic()
+
+    def deposit(self) -> None:
+        self._refill()
+        self._balance = min(self._capacity, self._balance + self._ratio)
+
+    def withdraw(self) -> bool:
+        self._refill()
+        if self._balance < 1:
+            return False
+        self._balance -= 1
+        return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._balance = min(
+            self._capacity,
+            self._balance + (now - self._updated_at) * self._min_per_second,
+        )
+        self._updated_at = now
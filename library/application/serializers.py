@@ -0,0 +1,83 @@
+import dataclasses
+import hashlib
+import types
+from collections.abc import Mapping, MutableSequence, Sequence
+from typing import Any, TypeVar, Union, get_args, get_origin, get_type_hints
+
+import msgspec
+
+_HEADER_DECODER = msgspec.msgpack.Decoder(tuple[str, msgspec.Raw])
+_SEQUENCES = (Sequence, MutableSequence, list)
+
+
+def schema_version(tp: Any) -> str:
+    schema = msgspec.json.encode(msgspec.json.schema(tp), order="sorted")
+    return hashlib.blake2b(schema, digest_size=4).hexdigest()
+
+
+def array_like(tp: Any, params: Mapping[Any, Any] | None = None) -> Any:
+    # Mirrors dataclasses as array_like structs so that field names are not
+    # repeated in every encoded item
+    params = params or {}
+    if isinstance(tp, TypeVar):
+        return array_like(params[tp])
+    origin, args = get_origin(tp), get_args(tp)
+    if origin is None and dataclasses.is_dataclass(tp):
+        origin = tp
+    if isinstance(origin, type) and dataclasses.is_dataclass(origin):
+        hints = get_type_hints(origin)
+        bound = dict(zip(getattr(origin, "__parameters__", ()), args, strict=False))
+        return msgspec.defstruct(
+            origin.__name__,
+            [
+                (field.name, array_like(hints[field.name], bound))
+                for field in dataclasses.fields(origin)
+            ],
+            array_like=True,
+        )
+    if origin in _SEQUENCES:
+        return list[array_like(args[0], params)]  # type: ignore[misc]
+    if origin in (Union, types.UnionType):
+        return Union[tuple(array_like(arg, params) for arg in args)]  # noqa: UP007
+    if origin is not None:
+        return origin[tuple(array_like(arg, params) for arg in args)]
+    return tp
+
+
+class CacheCodec:
+    def __init__(self, tp: Any, version: str | None = None) -> None:
+        self._tp = tp
+        self._wire_tp = array_like(tp)
+        self.version = version or schema_version(self._wire_tp)
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder(self._wire_tp)
+
+    def dumps(self, value: Any) -> bytes:
+        wire = msgspec.convert(value, self._wire_tp, from_attributes=True)
+        return self._encoder.encode((self.version, wire))
+
+    def loads(self, data: bytes | None) -> Any | None:
+        if data is None:
+            return None
+        try:
+            version, raw = _HEADER_DECODER.decode(data)
+            if version != self.version:
+                return None
+            wire = self._decoder.decode(raw)
+            return msgspec.convert(wire, self._tp, from_attributes=True)
+        except msgspec.DecodeError:
+            return None
+
+
+_CODECS: dict[Any, CacheCodec] = {}
+
+
+def register_codec(tp: Any, codec: CacheCodec) -> None:
+    _CODECS[tp] = codec
+
+
+def get_codec(tp: Any) -> CacheCodec:
+    codec = _CODECS.get(tp)
+    if codec is None:
+        codec = _CODECS[tp] = CacheCodec(tp)
+    return codec
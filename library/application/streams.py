@@ -0,0 +1,25 @@
+from collections.abc import AsyncIterable, AsyncIterator, Hashable, Sequence
+
+
+async def aunique[T: Hashable](
+    items: AsyncIterable[T], *, max_size: int = 10_000
+) -> AsyncIterator[T]:
+    seen: dict[T, None] = {}
+    async for item in items:
+        if item in seen:
+            continue
+        seen[item] = None
+        if len(seen) > max_size:
+            del seen[next(iter(seen))]
+        yield item
+
+
+async def abatched[T](items: AsyncIterable[T], size: int) -> AsyncIterator[Sequence[T]]:
+    batch: list[T] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
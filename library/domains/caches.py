@@ -0,0 +1,18 @@
+from typing import Final
+
+from library.domains.entities.book import BookId, BookPaginationParams
+from library.domains.entities.user import UserId
+
+BOOK_LIST_TAG: Final[str] = "books"
+
+
+def book_cache_key(book_id: BookId) -> str:
+    return f"book:{book_id}"
+
+
+def book_list_cache_key(params: BookPaginationParams) -> str:
+    return f"books:{params.limit}:{params.offset}"
+
+
+def user_cache_key(user_id: UserId) -> str:
+    return f"user:{user_id}"
@@ -1,9 +1,14 @@
+from aiocache import BaseCache
 from dishka import Provider, Scope, provide
 
+from library.application.cached import ICacheTags
+from library.application.config import AppConfig
 from library.domains.interfaces.clients.open_library import IOpenLibraryClient
-from library.domains.interfaces.storages.book import IBookStorage
-from library.domains.interfaces.storages.user import IUserStorage
+from library.domains.interfaces.storages.book import IBookLoader, IBookStorage
+from library.domains.interfaces.storages.upload import IUploadCheckpointStorage
+from library.domains.interfaces.storages.user import IUserLoader, IUserStorage
 from library.domains.services.book import BookService
+from library.domains.services.upload import UploadService
 from library.domains.services.user import UserService
 from library.domains.uow import AbstractUow
 from library.domains.use_cases.commands.book.create_book import CreateBookCommand
@@ -35,35 +40,61 @@ class DomainProvider(Provider):
     def book_service(self, book_storage: IBookStorage) -> BookService:
         return BookService(book_storage=book_storage)
 
+    @provide()
+    def upload_service(
+        self, checkpoint_storage: IUploadCheckpointStorage
+    ) -> UploadService:
+        return UploadService(checkpoint_storage=checkpoint_storage)
+
     @provide()
     def fetch_book_by_id(
-        self, uow: AbstractUow, book_service: BookService
+        self, book_loader: IBookLoader, cache: BaseCache
     ) -> FetchBookByIdQuery:
-        return FetchBookByIdQuery(uow=uow, book_service=book_service)
+        return FetchBookByIdQuery(book_loader=book_loader, cache=cache)
 
     @provide()
     def fetch_book_list(
-        self, uow: AbstractUow, book_service: BookService
+        self,
+        uow: AbstractUow,
+        book_service: BookService,
+        cache: BaseCache,
+        cache_tags: ICacheTags,
     ) -> FetchBookListQuery:
-        return FetchBookListQuery(uow=uow, book_service=book_service)
+        return FetchBookListQuery(
+            uow=uow, book_service=book_service, cache=cache, cache_tags=cache_tags
+        )
 
     @provide()
     def create_book_command(
-        self, uow: AbstractUow, book_service: BookService
+        self, uow: AbstractUow, book_service: BookService, cache_tags: ICacheTags
     ) -> CreateBookCommand:
-        return CreateBookCommand(uow=uow, book_service=book_service)
+        return CreateBookCommand(
+            uow=uow, book_service=book_service, cache_tags=cache_tags
+        )
 
     @provide()
     def delete_book_by_id_command(
-        self, uow: AbstractUow, book_service: BookService
+        self,
+        uow: AbstractUow,
+        book_service: BookService,
+        cache: BaseCache,
+        cache_tags: ICacheTags,
     ) -> DeleteBookByIdCommand:
-        return DeleteBookByIdCommand(uow=uow, book_service=book_service)
+        return DeleteBookByIdCommand(
+            uow=uow, book_service=book_service, cache=cache, cache_tags=cache_tags
+        )
 
     @provide()
     def update_book_by_id_command(
-        self, uow: AbstractUow, book_service: BookService
+        self,
+        uow: AbstractUow,
+        book_service: BookService,
+        cache: BaseCache,
+        cache_tags: ICacheTags,
     ) -> UpdateBookByIdCommand:
-        return UpdateBookByIdCommand(uow=uow, book_service=book_service)
+        return UpdateBookByIdCommand(
+            uow=uow, book_service=book_service, cache=cache, cache_tags=cache_tags
+        )
 
     @provide()
     def user_service(self, user_storage: IUserStorage) -> UserService:
@@ -71,9 +102,9 @@ class DomainProvider(Provider):
 
     @provide()
     def fetch_user_by_id(
-        self, uow: AbstractUow, user_service: UserService
+        self, user_loader: IUserLoader, cache: BaseCache
     ) -> FetchUserByIdQuery:
-        return FetchUserByIdQuery(uow=uow, user_service=user_service)
+        return FetchUserByIdQuery(user_loader=user_loader, cache=cache)
 
     @provide()
     def fetch_user_list(
@@ -89,27 +120,34 @@ class DomainProvider(Provider):
 
     @provide()
     def delete_user_by_id_command(
-        self, uow: AbstractUow, user_service: UserService
+        self, uow: AbstractUow, user_service: UserService, cache: BaseCache
     ) -> DeleteUserByIdCommand:
-        return DeleteUserByIdCommand(uow=uow, user_service=user_service)
+        return DeleteUserByIdCommand(uow=uow, user_service=user_service, cache=cache)
 
     @provide()
     def update_user_by_id_command(
-        self, uow: AbstractUow, user_service: UserService
+        self, uow: AbstractUow, user_service: UserService, cache: BaseCache
     ) -> UpdateUserByIdCommand:
-        return UpdateUserByIdCommand(uow=uow, user_service=user_service)
+        return UpdateUserByIdCommand(uow=uow, user_service=user_service, cache=cache)
 
     @provide()
     def upload_books_command(
         self,
         uow: AbstractUow,
         book_service: BookService,
+        upload_service: UploadService,
         open_library_client: IOpenLibraryClient,
+        cache_tags: ICacheTags,
+        app_config: AppConfig,
     ) -> UploadBooksCommand:
         return UploadBooksCommand(
             uow=uow,
             book_service=book_service,
+            upload_service=upload_service,
             open_library_client=open_library_client,
+            cache_tags=cache_tags,
+            concurrency=app_config.upload_concurrency,
+            write_batch_size=app_config.upload_write_batch_size,
         )
 
     @provide()
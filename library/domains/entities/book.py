@@ -7,6 +7,7 @@ from uuid import UUID
 from library.application.entities import UNSET
 
 BookId = NewType("BookId", UUID)
+UploadId = NewType("UploadId", UUID)
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -59,3 +60,12 @@ class UpdateBook:
 @dataclass(frozen=True, kw_only=True, slots=True)
 class UploadBooks:
     queries: Sequence[str]
+    upload_id: UploadId | None = None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class UploadCheckpoint:
+    upload_id: UploadId
+    query: str
+    offset: int
+    total: int
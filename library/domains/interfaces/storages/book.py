@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Protocol
 
 from library.domains.entities.book import (
@@ -25,6 +25,14 @@ class IBookStorage(Protocol):
 
     async def update_book_by_id(self, *, update_book: UpdateBook) -> Book: ...
 
+    async def fetch_books_by_ids(
+        self, *, book_ids: Sequence[BookId]
+    ) -> Mapping[BookId, Book]: ...
+
     async def exists_book_by_id(self, *, book_id: BookId) -> bool: ...
 
     async def save_bulk_books(self, *, books: Sequence[CreateBook]) -> None: ...
+
+
+class IBookLoader(Protocol):
+    async def load(self, key: BookId) -> Book | None: ...
@@ -0,0 +1,12 @@
+from collections.abc import Mapping
+from typing import Protocol
+
+from library.domains.entities.book import UploadCheckpoint, UploadId
+
+
+class IUploadCheckpointStorage(Protocol):
+    async def fetch_upload_checkpoints(
+        self, *, upload_id: UploadId
+    ) -> Mapping[str, UploadCheckpoint]: ...
+
+    async def save_upload_checkpoint(self, *, checkpoint: UploadCheckpoint) -> None: ...
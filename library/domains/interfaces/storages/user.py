@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Protocol
 
 from library.domains.entities.user import (
@@ -21,8 +21,18 @@ class IUserStorage(Protocol):
 
     async def create_user(self, *, user: CreateUser) -> User: ...
 
+    async def create_users(self, *, users: Sequence[CreateUser]) -> Sequence[User]: ...
+
     async def delete_user_by_id(self, *, user_id: UserId) -> None: ...
 
     async def update_user_by_id(self, *, update_user: UpdateUser) -> User: ...
 
+    async def fetch_users_by_ids(
+        self, *, user_ids: Sequence[UserId]
+    ) -> Mapping[UserId, User]: ...
+
     async def exists_user_by_id(self, *, user_id: UserId) -> bool: ...
+
+
+class IUserLoader(Protocol):
+    async def load(self, key: UserId) -> User | None: ...
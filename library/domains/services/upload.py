@@ -0,0 +1,21 @@
+from collections.abc import Mapping
+
+from library.domains.entities.book import UploadCheckpoint, UploadId
+from library.domains.interfaces.storages.upload import IUploadCheckpointStorage
+
+
+class UploadService:
+    __checkpoint_storage: IUploadCheckpointStorage
+
+    def __init__(self, checkpoint_storage: IUploadCheckpointStorage) -> None:
+        self.__checkpoint_storage = checkpoint_storage
+
+    async def fetch_checkpoints(
+        self, *, upload_id: UploadId
+    ) -> Mapping[str, UploadCheckpoint]:
+        return await self.__checkpoint_storage.fetch_upload_checkpoints(
+            upload_id=upload_id
+        )
+
+    async def save_checkpoint(self, *, checkpoint: UploadCheckpoint) -> None:
+        await self.__checkpoint_storage.save_upload_checkpoint(checkpoint=checkpoint)
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from library.application.exceptions import EntityNotFoundException
 from library.domains.entities.user import (
     CreateUser,
@@ -16,12 +18,6 @@ class UserService:
     def __init__(self, user_storage: IUserStorage) -> None:
         self.__user_storage = user_storage
 
-    async def fetch_user_by_id(self, *, user_id: UserId) -> User:
-        user = await self.__user_storage.fetch_user_by_id(user_id=user_id)
-        if user is None:
-            raise EntityNotFoundException(entity=User, entity_id=user_id)
-        return user
-
     async def fetch_user_list(self, *, params: UserPaginationParams) -> UserPagination:
         total = await self.__user_storage.count_users(params=params)
         items = await self.__user_storage.fetch_user_list(params=params)
@@ -30,6 +26,9 @@ class UserService:
     async def create_user(self, *, user: CreateUser) -> User:
         return await self.__user_storage.create_user(user=user)
 
+    async def create_users(self, *, users: Sequence[CreateUser]) -> Sequence[User]:
+        return await self.__user_storage.create_users(users=users)
+
     async def delete_user_by_id(self, *, user_id: UserId) -> None:
         if not await self.__user_storage.exists_user_by_id(user_id=user_id):
             raise EntityNotFoundException(entity=User, entity_id=user_id)
@@ -1,4 +1,6 @@
+from library.application.cache_tags import ICacheTags, invalidate_tag
 from library.application.use_case import ICommand
+from library.domains.caches import BOOK_LIST_TAG
 from library.domains.entities.book import Book, CreateBook
 from library.domains.services.book import BookService
 from library.domains.uow import AbstractUow
@@ -7,16 +9,21 @@ from library.domains.uow import AbstractUow
 class CreateBookCommand(ICommand[CreateBook, Book]):
     _uow: AbstractUow
     _book_service: BookService
+    _cache_tags: ICacheTags
 
     def __init__(
         self,
         *,
         uow: AbstractUow,
         book_service: BookService,
+        cache_tags: ICacheTags,
     ) -> None:
         self._uow = uow
         self._book_service = book_service
+        self._cache_tags = cache_tags
 
     async def execute(self, *, input_dto: CreateBook) -> Book:
         async with self._uow:
-            return await self._book_service.create_book(book=input_dto)
+            book = await self._book_service.create_book(book=input_dto)
+        await invalidate_tag(self._cache_tags, BOOK_LIST_TAG)
+        return book
@@ -1,4 +1,9 @@
+from aiocache import BaseCache
+
+from library.application.cache_tags import ICacheTags, invalidate_tag
+from library.application.cached import evict
 from library.application.use_case import ICommand
+from library.domains.caches import BOOK_LIST_TAG, book_cache_key
 from library.domains.entities.book import BookId
 from library.domains.services.book import BookService
 from library.domains.uow import AbstractUow
@@ -7,16 +12,24 @@ from library.domains.uow import AbstractUow
 class DeleteBookByIdCommand(ICommand[BookId, None]):
     _uow: AbstractUow
     _book_service: BookService
+    _cache: BaseCache
+    _cache_tags: ICacheTags
 
     def __init__(
         self,
         *,
         uow: AbstractUow,
         book_service: BookService,
+        cache: BaseCache,
+        cache_tags: ICacheTags,
     ) -> None:
         self._uow = uow
         self._book_service = book_service
+        self._cache = cache
+        self._cache_tags = cache_tags
 
     async def execute(self, *, input_dto: BookId) -> None:
         async with self._uow:
             await self._book_service.delete_book_by_id(book_id=input_dto)
+        await evict(self._cache, book_cache_key(input_dto), name="book")
+        await invalidate_tag(self._cache_tags, BOOK_LIST_TAG)
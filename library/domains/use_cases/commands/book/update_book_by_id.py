@@ -1,4 +1,9 @@
+from aiocache import BaseCache
+
+from library.application.cache_tags import ICacheTags, invalidate_tag
+from library.application.cached import evict
 from library.application.use_case import ICommand
+from library.domains.caches import BOOK_LIST_TAG, book_cache_key
 from library.domains.entities.book import Book, UpdateBook
 from library.domains.services.book import BookService
 from library.domains.uow import AbstractUow
@@ -7,11 +12,25 @@ from library.domains.uow import AbstractUow
 class UpdateBookByIdCommand(ICommand[UpdateBook, Book]):
     _uow: AbstractUow
     _book_service: BookService
+    _cache: BaseCache
+    _cache_tags: ICacheTags
 
-    def __init__(self, *, uow: AbstractUow, book_service: BookService) -> None:
+    def __init__(
+        self,
+        *,
+        uow: AbstractUow,
+        book_service: BookService,
+        cache: BaseCache,
+        cache_tags: ICacheTags,
+    ) -> None:
         self._uow = uow
         self._book_service = book_service
+        self._cache = cache
+        self._cache_tags = cache_tags
 
     async def execute(self, *, input_dto: UpdateBook) -> Book:
         async with self._uow:
-            return await self._book_service.update_book_by_id(update_book=input_dto)
+            book = await self._book_service.update_book_by_id(update_book=input_dto)
+        await evict(self._cache, book_cache_key(input_dto.id), name="book")
+        await invalidate_tag(self._cache_tags, BOOK_LIST_TAG)
+        return book
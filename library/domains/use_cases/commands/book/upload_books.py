@@ -1,13 +1,39 @@
-from collections.abc import Sequence
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Mapping, Sequence
+from contextlib import aclosing
+from dataclasses import dataclass
 from typing import Final
 
+from library.application.cache_tags import ICacheTags, invalidate_tag
+from library.application.streams import abatched, aunique
 from library.application.use_case import ICommand
-from library.domains.entities.book import CreateBook, UploadBooks
+from library.domains.caches import BOOK_LIST_TAG
+from library.domains.entities.book import (
+    CreateBook,
+    UploadBooks,
+    UploadCheckpoint,
+    UploadId,
+)
+from library.domains.entities.open_library import OpenLibrarySearchResult
 from library.domains.interfaces.clients.open_library import IOpenLibraryClient
 from library.domains.services.book import BookService
+from library.domains.services.upload import UploadService
 from library.domains.uow import AbstractUow
 
 BUCKET_SIZE: Final[int] = 100
+WRITE_QUEUE_SIZE: Final[int] = 2
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class FetchedPage:
+    query: str
+    offset: int
+    result: OpenLibrarySearchResult
+
+
+PageQueue = asyncio.Queue[FetchedPage | None]
+BucketQueue = asyncio.Queue[Sequence[CreateBook] | None]
 
 
 class UploadBooksCommand(ICommand[UploadBooks, None]):
@@ -16,43 +42,143 @@ class UploadBooksCommand(ICommand[UploadBooks, None]):
         *,
         uow: AbstractUow,
         book_service: BookService,
+        upload_service: UploadService,
         open_library_client: IOpenLibraryClient,
+        cache_tags: ICacheTags,
+        concurrency: int = 10,
+        write_batch_size: int = BUCKET_SIZE,
     ) -> None:
         self._uow = uow
         self._book_service = book_service
+        self._upload_service = upload_service
         self._open_library_client = open_library_client
+        self._cache_tags = cache_tags
+        self._concurrency = concurrency
+        self._write_batch_size = write_batch_size
+        self._semaphore = asyncio.Semaphore(concurrency)
 
     async def execute(self, *, input_dto: UploadBooks) -> None:
-        books: list[CreateBook] = []
-        for query in input_dto.queries:
-            books.extend(await self._get_all_books_by_query(query=query))
-        book_buckets = [
-            books[i : i + BUCKET_SIZE] for i in range(0, len(books), BUCKET_SIZE)
-        ]
+        checkpoints = await self._fetch_checkpoints(upload_id=input_dto.upload_id)
+        pages: PageQueue = asyncio.Queue(maxsize=self._concurrency)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(
+                    self._fetch(
+                        queries=input_dto.queries, checkpoints=checkpoints, pages=pages
+                    )
+                )
+                if input_dto.upload_id is None:
+                    buckets: BucketQueue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+                    tg.create_task(self._assemble(pages=pages, buckets=buckets))
+                    await self._write(buckets=buckets)
+                else:
+                    await self._write_pages(upload_id=input_dto.upload_id, pages=pages)
+        except* Exception as eg:  # noqa: BLE001
+            raise _first_error(eg) from None
+        await invalidate_tag(self._cache_tags, BOOK_LIST_TAG)
+
+    async def _fetch_checkpoints(
+        self, *, upload_id: UploadId | None
+    ) -> Mapping[str, UploadCheckpoint]:
+        if upload_id is None:
+            return {}
         async with self._uow:
-            for book_bucket in book_buckets:
-                await self._book_service.save_bulk_books(books=book_bucket)
+            return await self._upload_service.fetch_checkpoints(upload_id=upload_id)
+
+    async def _fetch(
+        self,
+        *,
+        queries: Sequence[str],
+        checkpoints: Mapping[str, UploadCheckpoint],
+        pages: PageQueue,
+    ) -> None:
+        async with asyncio.TaskGroup() as tg:
+            for query in queries:
+                checkpoint = checkpoints.get(query)
+                if checkpoint is None:
+                    start = 0
+                elif checkpoint.offset < checkpoint.total:
+                    start = checkpoint.offset
+                else:
+                    continue
+                tg.create_task(self._fetch_query(query=query, start=start, pages=pages))
+        await pages.put(None)
+
+    async def _fetch_query(self, *, query: str, start: int, pages: PageQueue) -> None:
+        async with aclosing(self._pages(query=query, start=start)) as query_pages:
+            async for page in query_pages:
+                await pages.put(page)
 
-    async def _get_all_books_by_query(self, *, query: str) -> Sequence[CreateBook]:
-        books: list[CreateBook] = []
-        offset = 0
-        while True:
+    async def _pages(
+        self, *, query: str, start: int
+    ) -> AsyncGenerator[FetchedPage, None]:
+        first_page = await self._search(query=query, offset=start)
+        yield first_page
+        pending: deque[asyncio.Task[FetchedPage]] = deque()
+        try:
+            offsets = range(start + BUCKET_SIZE, first_page.result.total, BUCKET_SIZE)
+            for offset in offsets:
+                pending.append(
+                    asyncio.create_task(self._search(query=query, offset=offset))
+                )
+                if len(pending) >= self._concurrency:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _assemble(self, *, pages: PageQueue, buckets: BucketQueue) -> None:
+        books = aunique(self._books(pages=pages))
+        async for bucket in abatched(books, self._write_batch_size):
+            await buckets.put(bucket)
+        await buckets.put(None)
+
+    async def _books(self, *, pages: PageQueue) -> AsyncIterator[CreateBook]:
+        while (page := await pages.get()) is not None:
+            for book in self._to_create_books(page):
+                yield book
+
+    async def _write(self, *, buckets: BucketQueue) -> None:
+        while (bucket := await buckets.get()) is not None:
+            async with self._uow:
+                await self._book_service.save_bulk_books(books=bucket)
+
+    async def _write_pages(self, *, upload_id: UploadId, pages: PageQueue) -> None:
+        while (page := await pages.get()) is not None:
+            books = self._to_create_books(page)
+            async with self._uow:
+                if books:
+                    await self._book_service.save_bulk_books(books=books)
+                await self._upload_service.save_checkpoint(
+                    checkpoint=UploadCheckpoint(
+                        upload_id=upload_id,
+                        query=page.query,
+                        offset=page.offset + BUCKET_SIZE,
+                        total=page.result.total,
+                    )
+                )
+
+    async def _search(self, *, query: str, offset: int) -> FetchedPage:
+        async with self._semaphore:
             result = await self._open_library_client.search(
                 query=query,
                 limit=BUCKET_SIZE,
                 offset=offset,
             )
-            books.extend(
-                [
-                    CreateBook(
-                        title=book.title,
-                        year=0,
-                        author=",".join(book.authors),
-                    )
-                    for book in result.books
-                ]
-            )
-            if len(result.books) < BUCKET_SIZE:
-                break
-            offset += BUCKET_SIZE
-        return books
+        return FetchedPage(query=query, offset=offset, result=result)
+
+    @staticmethod
+    def _to_create_books(page: FetchedPage) -> Sequence[CreateBook]:
+        return [
+            CreateBook(title=book.title, year=0, author=",".join(book.authors))
+            for book in page.result.books
+        ]
+
+
+def _first_error(group: BaseExceptionGroup[Exception]) -> Exception:
+    error = group.exceptions[0]
+    if isinstance(error, BaseExceptionGroup):
+        return _first_error(error)
+    return error
@@ -1,4 +1,8 @@
+from aiocache import BaseCache
+
+from library.application.cached import evict
 from library.application.use_case import ICommand
+from library.domains.caches import user_cache_key
 from library.domains.entities.user import UserId
 from library.domains.services.user import UserService
 from library.domains.uow import AbstractUow
@@ -7,16 +11,20 @@ from library.domains.uow import AbstractUow
 class DeleteUserByIdCommand(ICommand[UserId, None]):
     _uow: AbstractUow
     _user_service: UserService
+    _cache: BaseCache
 
     def __init__(
         self,
         *,
         uow: AbstractUow,
         user_service: UserService,
+        cache: BaseCache,
     ) -> None:
         self._uow = uow
         self._user_service = user_service
+        self._cache = cache
 
     async def execute(self, *, input_dto: UserId) -> None:
         async with self._uow:
             await self._user_service.delete_user_by_id(user_id=input_dto)
+        await evict(self._cache, user_cache_key(input_dto), name="user")
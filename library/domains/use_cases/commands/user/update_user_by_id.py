@@ -1,4 +1,8 @@
+from aiocache import BaseCache
+
+from library.application.cached import evict
 from library.application.use_case import ICommand
+from library.domains.caches import user_cache_key
 from library.domains.entities.user import UpdateUser, User
 from library.domains.services.user import UserService
 from library.domains.uow import AbstractUow
@@ -7,11 +11,17 @@ from library.domains.uow import AbstractUow
 class UpdateUserByIdCommand(ICommand[UpdateUser, User]):
     _uow: AbstractUow
     _user_service: UserService
+    _cache: BaseCache
 
-    def __init__(self, *, uow: AbstractUow, user_service: UserService) -> None:
+    def __init__(
+        self, *, uow: AbstractUow, user_service: UserService, cache: BaseCache
+    ) -> None:
         self._uow = uow
         self._user_service = user_service
+        self._cache = cache
 
     async def execute(self, *, input_dto: UpdateUser) -> User:
         async with self._uow:
-            return await self._user_service.update_user_by_id(update_user=input_dto)
+            user = await self._user_service.update_user_by_id(update_user=input_dto)
+        await evict(self._cache, user_cache_key(input_dto.id), name="user")
+        return user
@@ -1,22 +1,32 @@
+from aiocache import BaseCache
+
+from library.application.cached import ICached, cached
+from library.application.exceptions import EntityNotFoundException
 from library.application.use_case import IQuery
+from library.domains.caches import book_cache_key
 from library.domains.entities.book import Book, BookId
-from library.domains.services.book import BookService
-from library.domains.uow import AbstractUow
+from library.domains.interfaces.storages.book import IBookLoader
 
 
-class FetchBookByIdQuery(IQuery[BookId, Book]):
-    _uow: AbstractUow
-    _book_service: BookService
+class FetchBookByIdQuery(IQuery[BookId, Book], ICached):
+    _book_loader: IBookLoader
 
-    def __init__(
-        self,
-        *,
-        uow: AbstractUow,
-        book_service: BookService,
-    ) -> None:
-        self._uow = uow
-        self._book_service = book_service
+    def __init__(self, *, book_loader: IBookLoader, cache: BaseCache) -> None:
+        self._book_loader = book_loader
+        self._cache = cache
 
+    @cached(
+        key_func=lambda *, input_dto: book_cache_key(input_dto),
+        ttl=5 * 60,
+        negative_ttl=30,
+        negative_exceptions={
+            EntityNotFoundException: lambda *, input_dto: EntityNotFoundException(
+                entity=Book, entity_id=input_dto
+            ),
+        },
+    )
     async def execute(self, *, input_dto: BookId) -> Book:
-        async with self._uow:
-            return await self._book_service.fetch_book_by_id(book_id=input_dto)
+        book = await self._book_loader.load(input_dto)
+        if book is None:
+            raise EntityNotFoundException(entity=Book, entity_id=input_dto)
+        return book
@@ -1,10 +1,14 @@
+from aiocache import BaseCache
+
+from library.application.cached import ICached, ICacheTags, cached
 from library.application.use_case import IQuery
+from library.domains.caches import BOOK_LIST_TAG, book_list_cache_key
 from library.domains.entities.book import BookPagination, BookPaginationParams
 from library.domains.services.book import BookService
 from library.domains.uow import AbstractUow
 
 
-class FetchBookListQuery(IQuery[BookPaginationParams, BookPagination]):
+class FetchBookListQuery(IQuery[BookPaginationParams, BookPagination], ICached):
     _uow: AbstractUow
     _book_service: BookService
 
@@ -13,10 +17,19 @@ class FetchBookListQuery(IQuery[BookPaginationParams, BookPagination]):
         *,
         uow: AbstractUow,
         book_service: BookService,
+        cache: BaseCache,
+        cache_tags: ICacheTags,
     ) -> None:
         self._uow = uow
         self._book_service = book_service
+        self._cache = cache
+        self._cache_tags = cache_tags
 
+    @cached(
+        key_func=lambda *, input_dto: book_list_cache_key(input_dto),
+        tags=lambda *, input_dto: [BOOK_LIST_TAG],
+        ttl=5 * 60,
+    )
     async def execute(self, *, input_dto: BookPaginationParams) -> BookPagination:
         async with self._uow:
             return await self._book_service.fetch_book_list(params=input_dto)
@@ -1,17 +1,32 @@
+from aiocache import BaseCache
+
+from library.application.cached import ICached, cached
+from library.application.exceptions import EntityNotFoundException
 from library.application.use_case import IQuery
+from library.domains.caches import user_cache_key
 from library.domains.entities.user import User, UserId
-from library.domains.services.user import UserService
-from library.domains.uow import AbstractUow
+from library.domains.interfaces.storages.user import IUserLoader
 
 
-class FetchUserByIdQuery(IQuery[UserId, User]):
-    _uow: AbstractUow
-    _user_service: UserService
+class FetchUserByIdQuery(IQuery[UserId, User], ICached):
+    _user_loader: IUserLoader
 
-    def __init__(self, *, uow: AbstractUow, user_service: UserService) -> None:
-        self._uow = uow
-        self._user_service = user_service
+    def __init__(self, *, user_loader: IUserLoader, cache: BaseCache) -> None:
+        self._user_loader = user_loader
+        self._cache = cache
 
+    @cached(
+        key_func=lambda *, input_dto: user_cache_key(input_dto),
+        ttl=5 * 60,
+        negative_ttl=30,
+        negative_exceptions={
+            EntityNotFoundException: lambda *, input_dto: EntityNotFoundException(
+                entity=User, entity_id=input_dto
+            ),
+        },
+    )
     async def execute(self, *, input_dto: UserId) -> User:
-        async with self._uow:
-            return await self._user_service.fetch_user_by_id(user_id=input_dto)
+        user = await self._user_loader.load(input_dto)
+        if user is None:
+            raise EntityNotFoundException(entity=User, entity_id=input_dto)
+        return user
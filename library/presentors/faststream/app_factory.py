@@ -6,7 +6,7 @@ from library.adapters.database.config import DatabaseConfig
 from library.adapters.database.di import DatabaseProvider
 from library.adapters.nats.broker import create_broker
 from library.adapters.open_library.config import OpenLibraryConfig
-from library.adapters.open_library.di import OpenLibraryProvider
+from library.adapters.open_library.di import OpenLibraryProvider, prewarm_session
 from library.adapters.redis.config import RedisConfig
 from library.adapters.redis.di import RedisProvider
 from library.application.config import AppConfig
@@ -21,7 +21,7 @@ def get_faststream_app(config: Config) -> FastStream:
     container = make_async_container(
         DatabaseProvider(),
         DomainProvider(),
-        OpenLibraryProvider(),
+        OpenLibraryProvider(pool_name="open_library_faststream"),
         RedisProvider(),
         context={
             RedisConfig: config.redis,
@@ -31,5 +31,10 @@ def get_faststream_app(config: Config) -> FastStream:
         },
     )
     setup_dishka(container, faststream_app, auto_inject=True)
+
+    @faststream_app.on_startup
+    async def startup() -> None:
+        await prewarm_session(container)
+
     broker.include_router(router)
     return faststream_app
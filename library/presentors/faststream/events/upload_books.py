@@ -1,7 +1,9 @@
 from collections.abc import Sequence
+from uuid import UUID
 
 from pydantic import BaseModel
 
 
 class UploadBooksEvent(BaseModel):
     queries: Sequence[str]
+    upload_id: UUID | None = None
@@ -2,7 +2,7 @@ from dishka import FromDishka
 from faststream.nats import NatsRouter
 
 from library.adapters.nats.stream import STREAM
-from library.domains.entities.book import UploadBooks
+from library.domains.entities.book import UploadBooks, UploadId
 from library.domains.use_cases.commands.book.upload_books import UploadBooksCommand
 from library.presentors.faststream.events.upload_books import UploadBooksEvent
 from library.presentors.faststream.subjects import BooksSubjects
@@ -16,5 +16,8 @@ async def upload_open_library_books(
     upload_books_command: FromDishka[UploadBooksCommand],
 ) -> None:
     await upload_books_command.execute(
-        input_dto=UploadBooks(queries=event.queries),
+        input_dto=UploadBooks(
+            queries=event.queries,
+            upload_id=UploadId(event.upload_id) if event.upload_id else None,
+        ),
     )
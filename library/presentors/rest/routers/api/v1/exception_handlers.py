@@ -4,6 +4,7 @@ from litestar import MediaType, Request, Response
 from litestar.exceptions import HTTPException, ValidationException
 
 from library.application.exceptions import (
+    CircuitOpenException,
     EmptyPayloadException,
     EntityAlreadyExistsException,
     EntityNotFoundException,
@@ -71,6 +72,16 @@ def entity_already_exists_exception_handler(
     )
 
 
+def circuit_open_exception_handler(
+    request: Request,
+    exc: CircuitOpenException,
+) -> Response[StatusResponseSchema]:
+    return exception_json_response(
+        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        message=exc.message,
+    )
+
+
 def exception_json_response(
     status_code: int, message: str
 ) -> Response[StatusResponseSchema]:
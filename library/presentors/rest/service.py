@@ -16,11 +16,12 @@ from litestar.plugins.prometheus import PrometheusConfig, PrometheusController
 from library.adapters.database.config import DatabaseConfig
 from library.adapters.database.di import DatabaseProvider
 from library.adapters.open_library.config import OpenLibraryConfig
-from library.adapters.open_library.di import OpenLibraryProvider
+from library.adapters.open_library.di import OpenLibraryProvider, prewarm_session
 from library.adapters.redis.config import RedisConfig
 from library.adapters.redis.di import RedisProvider
 from library.application.config import AppConfig
 from library.application.exceptions import (
+    CircuitOpenException,
     EmptyPayloadException,
     EntityAlreadyExistsException,
     EntityNotFoundException,
@@ -33,6 +34,7 @@ from library.domains.di import DomainProvider
 from library.presentors.faststream.app_factory import get_faststream_app
 from library.presentors.rest.routers.api.router import router as api_router
 from library.presentors.rest.routers.api.v1.exception_handlers import (
+    circuit_open_exception_handler,
     empty_payload_exception_handler,
     entity_already_exists_exception_handler,
     entity_not_found_exception_handler,
@@ -57,6 +59,7 @@ def get_litestar_app(config: Config) -> Litestar:
 
     @asynccontextmanager
     async def lifespan(app: Litestar) -> AsyncIterator[None]:
+        await prewarm_session(app.state.dishka_container)
         await faststream_app.start()
         yield
         await faststream_app.stop()
@@ -87,6 +90,7 @@ def get_litestar_app(config: Config) -> Litestar:
             EntityNotFoundException: entity_not_found_exception_handler,
             EmptyPayloadException: empty_payload_exception_handler,
             EntityAlreadyExistsException: entity_already_exists_exception_handler,
+            CircuitOpenException: circuit_open_exception_handler,
         },
         openapi_config=OpenAPIConfig(
             title=config.app.title,
@@ -111,7 +115,7 @@ def get_litestar_app(config: Config) -> Litestar:
     container = make_async_container(
         DatabaseProvider(),
         DomainProvider(),
-        OpenLibraryProvider(),
+        OpenLibraryProvider(pool_name="open_library_rest"),
         RedisProvider(),
         context={
             AppConfig: config.app,
@@ -1,14 +1,20 @@
 from datetime import UTC, datetime
+from hashlib import md5
 from uuid import UUID
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from library.adapters.database.config import DatabaseConfig
 from library.adapters.database.storages.book import BookStorage
 from library.adapters.database.tables import BookTable
 from library.adapters.database.uow import SqlalchemyUow
-from library.application.exceptions import EntityNotFoundException
+from library.adapters.database.utils import create_engine, create_sessionmaker
+from library.application.exceptions import (
+    EntityAlreadyExistsException,
+    EntityNotFoundException,
+)
 from library.domains.entities.book import (
     Book,
     BookId,
@@ -52,6 +58,18 @@ async def test_fetch_book_by_id__ok(
     )
 
 
+async def test_fetch_books_by_ids__ok(
+    uow: SqlalchemyUow, book_storage: BookStorage, create_book
+):
+    await create_book(id=UUID_1)
+    await create_book(id=UUID_2, deleted_at=datetime.now(tz=UTC))
+    async with uow:
+        books = await book_storage.fetch_books_by_ids(
+            book_ids=[BookId(UUID_1), BookId(UUID_2), BookId(UUID(int=3))]
+        )
+    assert list(books) == [UUID_1]
+
+
 async def test_exists_book_by_id__not_found(
     uow: SqlalchemyUow, book_storage: BookStorage
 ):
@@ -175,6 +193,44 @@ async def test_create_book__ok(uow: SqlalchemyUow, book_storage: BookStorage, se
     )
 
 
+async def test_create_book__duplicate(
+    uow: SqlalchemyUow, book_storage: BookStorage, create_book
+):
+    await create_book(title="title", year=2020, author="author")
+    with pytest.raises(EntityAlreadyExistsException):
+        async with uow:
+            await book_storage.create_book(
+                book=CreateBook(title="title", year=2020, author="author")
+            )
+
+
+async def test_create_book__duplicate_of_deleted(
+    uow: SqlalchemyUow, book_storage: BookStorage, create_book
+):
+    await create_book(
+        title="title", year=2020, author="author", deleted_at=datetime.now(tz=UTC)
+    )
+    async with uow:
+        book = await book_storage.create_book(
+            book=CreateBook(title="title", year=2020, author="author")
+        )
+
+    assert book.title == "title"
+
+
+async def test_create_book__fingerprint(
+    uow: SqlalchemyUow, book_storage: BookStorage, session: AsyncSession
+):
+    async with uow:
+        book = await book_storage.create_book(
+            book=CreateBook(title="title", year=2020, author="author")
+        )
+
+    stmt = select(BookTable.fingerprint).where(BookTable.id == book.id)
+    fingerprint = await session.scalar(stmt)
+    assert fingerprint == md5(b"title\x1f2020\x1fauthor").digest()
+
+
 async def test_delete_book_by_id__ok(
     uow: SqlalchemyUow, book_storage: BookStorage, create_book, session: AsyncSession
 ):
@@ -242,3 +298,84 @@ async def test_save_bulk_books__ok(
         ("Book 1", 1, "Author 1"),
         ("Book 2", 2, "Author 2"),
     ]
+
+
+@pytest.mark.parametrize("size", [1, 3, 10])
+async def test_save_bulk_books__batch_sizes(
+    uow: SqlalchemyUow, book_storage: BookStorage, session: AsyncSession, size: int
+):
+    books = [
+        CreateBook(title=f"Book {i}", year=i, author=f"Author {i}") for i in range(size)
+    ]
+    async with uow:
+        await book_storage.save_bulk_books(books=books)
+        await book_storage.save_bulk_books(books=books)
+
+    result = await session.execute(select(func.count()).select_from(BookTable))
+    assert result.scalar_one() == size
+
+
+async def test_save_bulk_books__copy(
+    uow: SqlalchemyUow, session: AsyncSession, create_book
+):
+    await create_book(title="Book 1", year=1, author="Author 1")
+    book_storage = BookStorage(uow=uow, copy_threshold=1)
+    async with uow:
+        await book_storage.save_bulk_books(
+            books=[
+                CreateBook(title="Book 1", year=1, author="Author 1"),
+                CreateBook(title="Book 2", year=2, author="Author 2"),
+                CreateBook(title="Book 2", year=2, author="Author 2"),
+            ]
+        )
+        await book_storage.save_bulk_books(
+            books=[CreateBook(title="Book 3", year=3, author="Author 3")]
+        )
+
+    stmt = select(BookTable.title, BookTable.year, BookTable.author).order_by(
+        BookTable.title
+    )
+    result = await session.execute(stmt)
+    assert result.all() == [
+        ("Book 1", 1, "Author 1"),
+        ("Book 2", 2, "Author 2"),
+        ("Book 3", 3, "Author 3"),
+    ]
+
+
+async def test_save_bulk_books__copy_reuses_pooled_connection(
+    engine, db_config: DatabaseConfig
+):
+    async with create_engine(
+        dsn=db_config.dsn,
+        pool_size=1,
+        pool_timeout=db_config.pool_timeout,
+        max_overflow=0,
+        debug=True,
+    ) as single_engine:
+        session_factory = create_sessionmaker(engine=single_engine)
+        uow = SqlalchemyUow(session_factory=session_factory)
+        book_storage = BookStorage(uow=uow, copy_threshold=1)
+
+        async with uow:
+            await book_storage.save_bulk_books(
+                books=[CreateBook(title="Book 1", year=1, author="Author 1")]
+            )
+        with pytest.raises(RuntimeError):
+            async with uow:
+                await book_storage.save_bulk_books(
+                    books=[CreateBook(title="Book 2", year=2, author="Author 2")]
+                )
+                raise RuntimeError
+        async with uow:
+            await book_storage.save_bulk_books(
+                books=[CreateBook(title="Book 3", year=3, author="Author 3")]
+            )
+
+        async with session_factory() as session:
+            result = await session.execute(
+                select(BookTable.title).order_by(BookTable.title)
+            )
+            assert result.scalars().all() == ["Book 1", "Book 3"]
+            staged = await session.execute(text("SELECT count(*) FROM books_staging"))
+            assert staged.scalar_one() == 0
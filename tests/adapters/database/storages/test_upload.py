@@ -0,0 +1,67 @@
+from uuid import UUID
+
+from library.adapters.database.storages.upload import UploadCheckpointStorage
+from library.adapters.database.uow import SqlalchemyUow
+from library.domains.entities.book import UploadCheckpoint, UploadId
+
+UPLOAD_ID_1 = UploadId(UUID(int=1))
+UPLOAD_ID_2 = UploadId(UUID(int=2))
+
+
+async def test_fetch_upload_checkpoints__empty(
+    uow: SqlalchemyUow, upload_checkpoint_storage: UploadCheckpointStorage
+):
+    async with uow:
+        result = await upload_checkpoint_storage.fetch_upload_checkpoints(
+            upload_id=UPLOAD_ID_1
+        )
+    assert result == {}
+
+
+async def test_save_upload_checkpoint__upsert(
+    uow: SqlalchemyUow, upload_checkpoint_storage: UploadCheckpointStorage
+):
+    async with uow:
+        for offset in (100, 200):
+            await upload_checkpoint_storage.save_upload_checkpoint(
+                checkpoint=UploadCheckpoint(
+                    upload_id=UPLOAD_ID_1, query="test", offset=offset, total=250
+                )
+            )
+        await upload_checkpoint_storage.save_upload_checkpoint(
+            checkpoint=UploadCheckpoint(
+                upload_id=UPLOAD_ID_2, query="test", offset=100, total=250
+            )
+        )
+
+    async with uow:
+        result = await upload_checkpoint_storage.fetch_upload_checkpoints(
+            upload_id=UPLOAD_ID_1
+        )
+    assert result == {
+        "test": UploadCheckpoint(
+            upload_id=UPLOAD_ID_1, query="test", offset=200, total=250
+        )
+    }
+
+
+async def test_save_upload_checkpoint__never_moves_backwards(
+    uow: SqlalchemyUow, upload_checkpoint_storage: UploadCheckpointStorage
+):
+    async with uow:
+        for offset, total in ((200, 250), (100, 240)):
+            await upload_checkpoint_storage.save_upload_checkpoint(
+                checkpoint=UploadCheckpoint(
+                    upload_id=UPLOAD_ID_1, query="test", offset=offset, total=total
+                )
+            )
+
+    async with uow:
+        result = await upload_checkpoint_storage.fetch_upload_checkpoints(
+            upload_id=UPLOAD_ID_1
+        )
+    assert result == {
+        "test": UploadCheckpoint(
+            upload_id=UPLOAD_ID_1, query="test", offset=200, total=250
+        )
+    }
@@ -54,6 +54,18 @@ async def test_fetch_user_by_id__ok(
     )
 
 
+async def test_fetch_users_by_ids__ok(
+    uow: SqlalchemyUow, user_storage: UserStorage, create_db_user_factory
+):
+    await create_db_user_factory(id=UUID_1)
+    await create_db_user_factory(id=UUID_2, deleted_at=datetime.now(tz=UTC))
+    async with uow:
+        users = await user_storage.fetch_users_by_ids(
+            user_ids=[UserId(UUID_1), UserId(UUID_2), UserId(UUID(int=3))]
+        )
+    assert list(users) == [UUID_1]
+
+
 async def test_exists_user_by_id__not_found(
     uow: SqlalchemyUow, user_storage: UserStorage
 ):
@@ -202,6 +214,44 @@ async def test_create_user__duplicate_email(
             )
 
 
+async def test_create_users__ok(
+    uow: SqlalchemyUow, user_storage: UserStorage, session: AsyncSession
+):
+    async with uow:
+        users = await user_storage.create_users(
+            users=[
+                CreateUser(username="user1", email="user1@example.com"),
+                CreateUser(username="user2", email="user2@example.com"),
+            ]
+        )
+
+    db_users = (await session.scalars(select(UserTable))).all()
+    assert sorted(users, key=lambda user: user.username) == [
+        User(
+            id=UserId(db_user.id),
+            username=db_user.username,
+            email=db_user.email,
+            created_at=db_user.created_at,
+            updated_at=db_user.updated_at,
+        )
+        for db_user in sorted(db_users, key=lambda user: user.username)
+    ]
+
+
+async def test_create_users__duplicate_email(
+    uow: SqlalchemyUow, user_storage: UserStorage, create_db_user_factory
+):
+    await create_db_user_factory(id=UUID_1, email="user2@example.com")
+    with pytest.raises(EntityAlreadyExistsException):
+        async with uow:
+            await user_storage.create_users(
+                users=[
+                    CreateUser(username="user1", email="user1@example.com"),
+                    CreateUser(username="user2", email="user2@example.com"),
+                ]
+            )
+
+
 async def test_delete_user_by_id__ok(
     uow: SqlalchemyUow,
     user_storage: UserStorage,
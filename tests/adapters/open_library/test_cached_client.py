@@ -1,7 +1,12 @@
+from aiocache import BaseCache
 from asyncly.srvmocker import MockService
+from prometheus_client import REGISTRY
 
 from library.adapters.open_library.cached import CachedOpenLibraryClient
-from tests.plugins.instances.open_library import OpenLibrarySearchResponse
+from tests.plugins.instances.open_library import (
+    OpenLibraryDocDict,
+    OpenLibrarySearchResponse,
+)
 
 
 async def test_cached_open_library_client_search__cache_hit(
@@ -24,3 +29,113 @@ async def test_cached_open_library_client_search__cache_miss(
     await cached_open_library_client.search(query="test2", limit=10, offset=0)
 
     assert len(open_library_service.history_map["search"]) == 2
+
+
+async def test_cached_open_library_client_search__local_cache_hit(
+    open_library_service: MockService,
+    cached_open_library_client: CachedOpenLibraryClient,
+    redis_cache: BaseCache,
+):
+    open_library_service.register("search", OpenLibrarySearchResponse(books=[]))
+    await cached_open_library_client.search(query="test", limit=10, offset=0)
+    await redis_cache.clear()
+    await cached_open_library_client.search(query="test", limit=10, offset=0)
+
+    assert len(open_library_service.history_map["search"]) == 1
+
+
+async def test_cached_open_library_client_search__tier_metrics(
+    open_library_service: MockService,
+    cached_open_library_client: CachedOpenLibraryClient,
+):
+    def sample(name: str, tier: str) -> float:
+        value = REGISTRY.get_sample_value(
+            name,
+            {"cache": "CachedOpenLibraryClient._search_window", "tier": tier},
+        )
+        return value or 0.0
+
+    local_hits = sample("library_cache_hits_total", "local")
+    redis_misses = sample("library_cache_misses_total", "redis")
+
+    open_library_service.register("search", OpenLibrarySearchResponse(books=[]))
+    await cached_open_library_client.search(query="metrics", limit=10, offset=0)
+    await cached_open_library_client.search(query="metrics", limit=10, offset=0)
+
+    assert sample("library_cache_hits_total", "local") == local_hits + 1
+    assert sample("library_cache_misses_total", "redis") == redis_misses + 1
+
+
+async def test_cached_open_library_client_search__pages_share_window(
+    open_library_service: MockService,
+    cached_open_library_client: CachedOpenLibraryClient,
+):
+    books = [
+        OpenLibraryDocDict(key=f"/works/{i}", title=f"Book {i}", author_name=["A"])
+        for i in range(150)
+    ]
+    open_library_service.register("search", OpenLibrarySearchResponse(books=books))
+
+    first = await cached_open_library_client.search(query="test", limit=10, offset=0)
+    second = await cached_open_library_client.search(query="test", limit=10, offset=10)
+    wide = await cached_open_library_client.search(query="test", limit=20, offset=0)
+
+    assert [book.title for book in first.books] == [f"Book {i}" for i in range(10)]
+    assert [book.title for book in second.books] == [f"Book {i}" for i in range(10, 20)]
+    assert wide.books == [*first.books, *second.books]
+    assert second.offset == 10
+    assert len(open_library_service.history_map["search"]) == 1
+
+
+async def test_cached_open_library_client_search__spans_windows(
+    open_library_service: MockService,
+    cached_open_library_client: CachedOpenLibraryClient,
+):
+    books = [
+        OpenLibraryDocDict(key=f"/works/{i}", title=f"Book {i}", author_name=["A"])
+        for i in range(150)
+    ]
+    open_library_service.register("search", OpenLibrarySearchResponse(books=books))
+
+    result = await cached_open_library_client.search(query="test", limit=10, offset=95)
+
+    assert [book.title for book in result.books] == [
+        f"Book {i}" for i in range(95, 105)
+    ]
+    assert len(open_library_service.history_map["search"]) == 2
+
+
+async def test_cached_open_library_client_search__pages_align_with_upstream(
+    open_library_service: MockService,
+    cached_open_library_client: CachedOpenLibraryClient,
+):
+    books = [
+        OpenLibraryDocDict(
+            key=f"/works/{i}", title=f"Book {i}", author_name=["A"] if i > 2 else []
+        )
+        for i in range(150)
+    ]
+    open_library_service.register("search", OpenLibrarySearchResponse(books=books))
+
+    first = await cached_open_library_client.search(query="test", limit=20, offset=90)
+    second = await cached_open_library_client.search(query="test", limit=20, offset=100)
+    head = await cached_open_library_client.search(query="test", limit=10, offset=0)
+
+    assert [book.title for book in first.books] == [f"Book {i}" for i in range(90, 110)]
+    assert [book.title for book in second.books] == [
+        f"Book {i}" for i in range(100, 120)
+    ]
+    assert [book.title for book in head.books] == [f"Book {i}" for i in range(3, 10)]
+
+
+async def test_cached_open_library_client_search__normalized_query(
+    open_library_service: MockService,
+    cached_open_library_client: CachedOpenLibraryClient,
+):
+    open_library_service.register("search", OpenLibrarySearchResponse(books=[]))
+    await cached_open_library_client.search(query="Dune  Messiah", limit=10, offset=0)
+    await cached_open_library_client.search(
+        query=" ｄｕｎｅ messiah", limit=10, offset=0
+    )
+
+    assert len(open_library_service.history_map["search"]) == 1
@@ -1,3 +1,4 @@
+from aiohttp.web import Request, Response
 from asyncly.srvmocker import MockService
 
 from library.adapters.open_library.client import OpenLibraryClient
@@ -8,6 +9,14 @@ from library.domains.entities.open_library import (
 from tests.plugins.instances.open_library import OpenLibrarySearchResponse
 
 
+class RecordingSearchResponse(OpenLibrarySearchResponse):
+    query: dict[str, str]
+
+    async def response(self, request: Request) -> Response:
+        self.query = dict(request.query)
+        return await super().response(request)
+
+
 async def test_open_library_client_search__empty(
     open_library_service: MockService,
     open_library_client: OpenLibraryClient,
@@ -53,3 +62,35 @@ async def test_open_library_client_search__ok(
         start=0,
         offset=0,
     )
+
+
+async def test_open_library_client_search__keeps_docs_without_authors(
+    open_library_service: MockService,
+    open_library_client: OpenLibraryClient,
+):
+    open_library_service.register(
+        "search",
+        OpenLibrarySearchResponse(
+            books=[
+                {"author_name": ["Test author"], "title": "With", "key": "with"},
+                {"author_name": [], "title": "Empty", "key": "empty"},
+                {"title": "Without", "key": "without"},  # type: ignore[typeddict-item]
+            ]
+        ),
+    )
+
+    result = await open_library_client.search(query="test", limit=10, offset=0)
+    assert [book.authors for book in result.books] == [["Test author"], [], []]
+    assert result.total == 3
+
+
+async def test_open_library_client_search__requests_used_fields(
+    open_library_service: MockService,
+    open_library_client: OpenLibraryClient,
+):
+    response = RecordingSearchResponse(books=[])
+    open_library_service.register("search", response)
+
+    await open_library_client.search(query="test", limit=10, offset=0)
+
+    assert response.query["fields"] == "key,title,author_name"
@@ -0,0 +1,55 @@
+import asyncio
+
+from prometheus_client import REGISTRY
+
+from library.adapters.open_library.limited import LimitedOpenLibraryClient
+from library.application.rate_limit import TokenBucket
+from library.domains.entities.open_library import OpenLibrarySearchResult
+
+
+class SlowClient:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+    async def search(
+        self, query: str, limit: int, offset: int
+    ) -> OpenLibrarySearchResult:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.05)
+        self.active -= 1
+        return OpenLibrarySearchResult(books=[], total=0, start=offset, offset=offset)
+
+
+async def test_limited_client__bounds_concurrency():
+    client = SlowClient()
+    limited = LimitedOpenLibraryClient(client, max_concurrency=2)
+
+    await asyncio.gather(
+        *(limited.search(query="test", limit=10, offset=i) for i in range(6))
+    )
+
+    assert client.max_active == 2
+
+
+async def test_limited_client__observes_queue_time():
+    def count() -> float:
+        value = REGISTRY.get_sample_value(
+            "library_client_queue_seconds_count", {"client": "test"}
+        )
+        return value or 0.0
+
+    before = count()
+    limited = LimitedOpenLibraryClient(
+        SlowClient(),
+        max_concurrency=1,
+        rate_limiter=TokenBucket(rate=100, capacity=1),
+        name="test",
+    )
+
+    await asyncio.gather(
+        *(limited.search(query="test", limit=10, offset=i) for i in range(3))
+    )
+
+    assert count() - before == 3
@@ -2,6 +2,7 @@ from asyncio import gather
 
 from asyncly.srvmocker import MockService
 from asyncly.srvmocker.responses.timeout import LatencyResponse
+from prometheus_client import REGISTRY
 
 from library.adapters.open_library.cached import CachedOpenLibraryClient
 from tests.plugins.instances.open_library import OpenLibrarySearchResponse
@@ -24,3 +25,32 @@ async def test_reduce_open_library_client_search__ok(
     )
 
     assert len(open_library_service.history_map["search"]) == 1
+
+
+async def test_reduce_open_library_client_search__metrics(
+    open_library_service: MockService,
+    reduced_open_library_client: CachedOpenLibraryClient,
+):
+    def sample(name: str) -> float:
+        value = REGISTRY.get_sample_value(
+            name, {"reducer": "ReducedOpenLibraryClient.search"}
+        )
+        return value or 0.0
+
+    coalesced = sample("library_reducer_coalesced_total")
+    open_library_service.register(
+        "search",
+        LatencyResponse(
+            wrapped=OpenLibrarySearchResponse(books=[]),
+            latency=0.2,
+        ),
+    )
+    await gather(
+        *(
+            reduced_open_library_client.search(query="test", limit=10, offset=0)
+            for _ in range(3)
+        )
+    )
+
+    assert sample("library_reducer_coalesced_total") == coalesced + 2
+    assert sample("library_reducer_in_flight") == 0
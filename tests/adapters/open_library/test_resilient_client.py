@@ -0,0 +1,73 @@
+import pytest
+from aiohttp import ClientConnectionError
+
+from library.adapters.open_library.resilient import ResilientOpenLibraryClient
+from library.application.circuit_breaker import CircuitBreaker
+from library.application.exceptions import CircuitOpenException
+from library.application.retry import RetryBudget
+from library.domains.entities.open_library import OpenLibrarySearchResult
+
+
+class FlakyClient:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    async def search(
+        self, query: str, limit: int, offset: int
+    ) -> OpenLibrarySearchResult:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ClientConnectionError
+        return OpenLibrarySearchResult(books=[], total=0, start=offset, offset=offset)
+
+
+def make_client(
+    client: FlakyClient, *, budget: RetryBudget | None = None, min_calls: int = 20
+) -> ResilientOpenLibraryClient:
+    return ResilientOpenLibraryClient(
+        client,
+        breaker=CircuitBreaker(name="test", min_calls=min_calls),
+        retry_budget=budget or RetryBudget(),
+        backoff_base=0.001,
+        name="test",
+    )
+
+
+async def test_resilient_client__retries_transient_errors():
+    client = FlakyClient(failures=2)
+
+    result = await make_client(client).search(query="test", limit=10, offset=0)
+
+    assert result.total == 0
+    assert client.calls == 3
+
+
+async def test_resilient_client__gives_up_after_max_attempts():
+    client = FlakyClient(failures=5)
+
+    with pytest.raises(ClientConnectionError):
+        await make_client(client).search(query="test", limit=10, offset=0)
+    assert client.calls == 3
+
+
+async def test_resilient_client__retry_budget_exhausted():
+    client = FlakyClient(failures=5)
+    budget = RetryBudget(ratio=0, min_per_second=0, capacity=1)
+
+    with pytest.raises(ClientConnectionError):
+        await make_client(client, budget=budget).search(
+            query="test", limit=10, offset=0
+        )
+    assert client.calls == 2
+
+
+async def test_resilient_client__open_circuit_fails_fast():
+    client = FlakyClient(failures=5)
+    resilient = make_client(client, min_calls=2)
+
+    with pytest.raises(CircuitOpenException):
+        await resilient.search(query="test", limit=10, offset=0)
+    with pytest.raises(CircuitOpenException):
+        await resilient.search(query="test", limit=10, offset=0)
+    assert client.calls == 2
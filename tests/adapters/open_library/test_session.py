@@ -0,0 +1,51 @@
+import math
+
+from asyncly.srvmocker import MockService
+from prometheus_client import REGISTRY
+
+from library.adapters.open_library.config import OpenLibraryConfig
+from library.adapters.open_library.session import (
+    create_session,
+    observe_pool,
+    prewarm,
+)
+
+
+def pool_connections(state: str, client: str = "test") -> float | None:
+    return REGISTRY.get_sample_value(
+        "library_client_pool_connections", {"client": client, "state": state}
+    )
+
+
+async def test_create_session__configured(open_library_config: OpenLibraryConfig):
+    async with create_session(open_library_config, "test") as session:
+        assert session.connector.limit == open_library_config.connector_limit
+        assert (
+            session.timeout.sock_read == open_library_config.read_timeout
+            and session.timeout.sock_connect == open_library_config.connect_timeout
+            and session.timeout.total == open_library_config.total_timeout
+        )
+        assert (
+            REGISTRY.get_sample_value("library_client_pool_limit", {"client": "test"})
+            == open_library_config.connector_limit
+        )
+
+
+async def test_prewarm__keeps_connections_idle(
+    open_library_service: MockService, open_library_config: OpenLibraryConfig
+):
+    async with create_session(open_library_config, "test") as session:
+        await prewarm(session, open_library_config.url, 3)
+
+        assert pool_connections("idle") == 3
+        assert pool_connections("acquired") == 0
+
+
+def test_observe_pool__unknown_connector_internals():
+    class Connector:
+        limit = 10
+
+    observe_pool(Connector(), "unknown")  # type: ignore[arg-type]
+
+    assert math.isnan(pool_connections("acquired", client="unknown"))
+    assert math.isnan(pool_connections("idle", client="unknown"))
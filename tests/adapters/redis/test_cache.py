@@ -0,0 +1,57 @@
+from aiocache import BaseCache
+from redis.asyncio import Redis
+
+from library.adapters.redis.compression import MARKER
+from library.adapters.redis.config import RedisConfig
+from library.application.reduced import Fence
+
+
+async def test_redis_cache__large_value_compressed(
+    redis_cache: BaseCache, redis_config: RedisConfig
+):
+    value = ["open library"] * 1000
+    await redis_cache.set("key", value)
+
+    redis = Redis.from_url(redis_config.dsn)
+    raw = await redis.get("key")
+    await redis.aclose()
+
+    assert raw.startswith(MARKER)
+    assert await redis_cache.get("key") == value
+
+
+async def test_redis_cache__small_value_not_compressed(
+    redis_cache: BaseCache, redis_config: RedisConfig
+):
+    await redis_cache.set("key", ["open library"])
+
+    redis = Redis.from_url(redis_config.dsn)
+    raw = await redis.get("key")
+    await redis.aclose()
+
+    assert not raw.startswith(MARKER)
+    assert await redis_cache.get("key") == ["open library"]
+
+
+async def test_redis_cache__set_fenced_with_held_lock(
+    redis_cache: BaseCache, redis_config: RedisConfig
+):
+    redis = Redis.from_url(redis_config.dsn)
+    await redis.set("lock", "1")
+    await redis.aclose()
+
+    stored = await redis_cache.set_fenced(
+        "key", ["open library"], ttl=10, fence=Fence(key="lock", token="1")
+    )
+
+    assert stored
+    assert await redis_cache.get("key") == ["open library"]
+
+
+async def test_redis_cache__set_fenced_with_lost_lock(redis_cache: BaseCache):
+    stored = await redis_cache.set_fenced(
+        "key", ["open library"], ttl=10, fence=Fence(key="lock", token="1")
+    )
+
+    assert not stored
+    assert await redis_cache.get("key") is None
@@ -0,0 +1,32 @@
+import pytest
+
+from library.adapters.redis.compression import MARKER, CompressionCodec, Compressor
+
+PAYLOAD = b"open library " * 200
+
+
+@pytest.mark.parametrize("codec", list(CompressionCodec))
+def test_compressor__roundtrip(codec: CompressionCodec):
+    compressor = Compressor(codec=codec, min_size=16)
+    assert compressor.decompress(compressor.compress(PAYLOAD)) == PAYLOAD
+
+
+def test_compressor__small_value_stored_as_is():
+    compressor = Compressor(min_size=len(PAYLOAD) + 1)
+    assert compressor.compress(PAYLOAD) == PAYLOAD
+
+
+def test_compressor__marked_and_smaller():
+    compressed = Compressor(min_size=16).compress(PAYLOAD)
+    assert compressed.startswith(MARKER)
+    assert len(compressed) < len(PAYLOAD)
+
+
+def test_compressor__reads_uncompressed_values():
+    compressor = Compressor(min_size=16)
+    assert compressor.decompress(b"\x93\x01\x02\x03") == b"\x93\x01\x02\x03"
+
+
+def test_compressor__unknown_codec():
+    compressor = Compressor(min_size=16)
+    assert compressor.decompress(MARKER + b"\xff" + PAYLOAD) is None
@@ -0,0 +1,38 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+from redis.asyncio import Redis
+
+from library.adapters.redis.config import RedisConfig
+from library.adapters.redis.rate_limit import RedisTokenBucket
+
+
+@pytest.fixture
+async def redis(redis_config: RedisConfig, clear_redis_cache) -> AsyncIterator[Redis]:
+    redis = Redis.from_url(redis_config.dsn)
+    yield redis
+    await redis.aclose()
+
+
+async def test_redis_token_bucket__shared_between_instances(redis: Redis):
+    buckets = [
+        RedisTokenBucket(redis, key="test", rate=20, capacity=1) for _ in range(3)
+    ]
+
+    started_at = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for bucket in buckets))
+
+    assert time.monotonic() - started_at >= 0.09
+    assert await redis.exists("rate-limit:test")
+
+
+async def test_redis_token_bucket__burst_is_not_delayed(redis: Redis):
+    bucket = RedisTokenBucket(redis, key="test", rate=1, capacity=3)
+
+    started_at = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+
+    assert time.monotonic() - started_at < 0.5
@@ -0,0 +1,122 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+from redis.asyncio import Redis
+
+from library.adapters.redis.config import RedisConfig
+from library.adapters.redis.single_flight import RedisSingleFlight
+from library.application.reduced import Fence, StoreResult
+
+
+@pytest.fixture
+async def redis(redis_config: RedisConfig, clear_redis_cache) -> AsyncIterator[Redis]:
+    redis = Redis.from_url(redis_config.dsn)
+    yield redis
+    await redis.aclose()
+
+
+class Source:
+    def __init__(
+        self, redis: Redis, *, failures: int = 0, cacheable: bool = True
+    ) -> None:
+        self.redis = redis
+        self.calls = 0
+        self.failures = failures
+        self.cacheable = cacheable
+        self.stored: dict[str, int] = {}
+
+    async def compute(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(0.2)
+        if self.calls <= self.failures:
+            raise ConnectionError
+        return 42
+
+    async def store(self, value: int, fence: Fence) -> StoreResult:
+        if not self.cacheable:
+            return StoreResult.SKIPPED
+        if await self.redis.get(fence.key) != fence.token.encode():
+            return StoreResult.FENCED_OUT
+        self.stored["key"] = value
+        return StoreResult.STORED
+
+    async def read(self) -> int | None:
+        return self.stored.get("key")
+
+
+async def test_single_flight__concurrent_callers_compute_once(redis: Redis):
+    source = Source(redis)
+    flights = [RedisSingleFlight(redis, poll_interval=0.01) for _ in range(5)]
+
+    results = await asyncio.gather(
+        *(
+            flight("key", compute=source.compute, store=source.store, read=source.read)
+            for flight in flights
+        )
+    )
+
+    assert results == [42] * 5
+    assert source.calls == 1
+    assert not await redis.exists("single-flight:lock:key")
+
+
+async def test_single_flight__leader_failure_hands_over_lock(redis: Redis):
+    source = Source(redis, failures=1)
+    flights = [RedisSingleFlight(redis, poll_interval=0.01) for _ in range(5)]
+
+    results = await asyncio.gather(
+        *(
+            flight("key", compute=source.compute, store=source.store, read=source.read)
+            for flight in flights
+        ),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(result, ConnectionError) for result in results) == 1
+    assert results.count(42) == 4
+    assert source.calls == 2
+
+
+async def test_single_flight__uncacheable_result_releases_waiters(redis: Redis):
+    source = Source(redis, cacheable=False)
+    flights = [RedisSingleFlight(redis, poll_interval=1.0) for _ in range(5)]
+    started_at = time.monotonic()
+
+    results = await asyncio.gather(
+        *(
+            flight("key", compute=source.compute, store=source.store, read=source.read)
+            for flight in flights
+        )
+    )
+
+    assert results == [42] * 5
+    assert source.calls == 5
+    assert time.monotonic() - started_at < 0.7
+
+
+async def test_single_flight__wait_timeout_computes_without_store(redis: Redis):
+    source = Source(redis)
+    await redis.set("single-flight:lock:key", "foreign")
+    flight = RedisSingleFlight(redis, wait_timeout=0.05, poll_interval=0.01)
+
+    result = await flight(
+        "key", compute=source.compute, store=source.store, read=source.read
+    )
+
+    assert result == 42
+    assert source.calls == 1
+    assert source.stored == {}
+
+
+async def test_single_flight__expired_lock_skips_store(redis: Redis):
+    source = Source(redis)
+    flight = RedisSingleFlight(redis, lock_ttl=0.05)
+
+    result = await flight(
+        "key", compute=source.compute, store=source.store, read=source.read
+    )
+
+    assert result == 42
+    assert source.stored == {}
@@ -0,0 +1,38 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from redis.asyncio import Redis
+
+from library.adapters.redis.config import RedisConfig
+from library.adapters.redis.tags import RedisCacheTags
+
+
+@pytest.fixture
+async def redis(redis_config: RedisConfig, clear_redis_cache) -> AsyncIterator[Redis]:
+    redis = Redis.from_url(redis_config.dsn)
+    yield redis
+    await redis.aclose()
+
+
+async def test_cache_tags__invalidate_tag(redis: Redis):
+    tags = RedisCacheTags(redis)
+    await redis.mset({"key1": "1", "key2": "2", "key3": "3"})
+    await tags.tag("key1", ["books"], ttl=10)
+    await tags.tag("key2", ["books", "users"], ttl=10)
+    await tags.tag("key3", ["users"], ttl=10)
+
+    assert await tags.invalidate_tag("books") == 2
+    assert await redis.exists("key1", "key2", "key3") == 1
+    assert not await redis.exists("cache-tag:books")
+
+
+async def test_cache_tags__expiry_extended(redis: Redis):
+    tags = RedisCacheTags(redis)
+    await tags.tag("key1", ["books"], ttl=100)
+    await tags.tag("key2", ["books"], ttl=10)
+
+    assert await redis.ttl("cache-tag:books") > 10
+
+    await tags.tag("key3", ["books"], ttl=1000)
+
+    assert await redis.ttl("cache-tag:books") > 100
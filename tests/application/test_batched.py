@@ -0,0 +1,86 @@
+import asyncio
+import gc
+from collections.abc import Mapping, Sequence
+
+import pytest
+
+from library.application.batched import BatchLoader
+
+
+class Source:
+    def __init__(self) -> None:
+        self.batches: list[list[int]] = []
+
+    async def load(self, keys: Sequence[int]) -> Mapping[int, str]:
+        self.batches.append(sorted(keys))
+        return {key: str(key) for key in keys if key > 0}
+
+
+async def test_batch_loader__merges_concurrent_loads():
+    source = Source()
+    loader = BatchLoader(source.load)
+
+    results = await asyncio.gather(*(loader.load(key) for key in (1, 2, 2, 0)))
+
+    assert results == ["1", "2", "2", None]
+    assert source.batches == [[0, 1, 2]]
+
+
+async def test_batch_loader__max_batch_size():
+    source = Source()
+    loader = BatchLoader(source.load, max_batch_size=2)
+
+    await asyncio.gather(*(loader.load(key) for key in (1, 2, 3)))
+
+    assert source.batches == [[1, 2], [3]]
+
+
+async def test_batch_loader__error_propagates():
+    async def load(keys: Sequence[int]) -> Mapping[int, str]:
+        raise ConnectionError
+
+    loader = BatchLoader(load)
+
+    with pytest.raises(ConnectionError):
+        await asyncio.gather(loader.load(1), loader.load(2))
+
+
+async def test_batch_loader__cancelled_load_releases_callers():
+    started = asyncio.Event()
+
+    async def load(keys: Sequence[int]) -> Mapping[int, str]:
+        started.set()
+        await asyncio.sleep(10)
+        return {}
+
+    loader = BatchLoader(load)
+    callers = asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    await started.wait()
+    for task in list(loader._tasks):
+        task.cancel()
+
+    results = await asyncio.wait_for(callers, timeout=1)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+async def test_batch_loader__error_without_callers_retrieved():
+    started = asyncio.Event()
+
+    async def load(keys: Sequence[int]) -> Mapping[int, str]:
+        started.set()
+        await asyncio.sleep(0.01)
+        raise ConnectionError
+
+    loop = asyncio.get_running_loop()
+    errors: list[dict] = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+    loader = BatchLoader(load)
+    caller = asyncio.create_task(loader.load(1))
+    await started.wait()
+    caller.cancel()
+    await asyncio.gather(*loader._tasks)
+    del caller
+    gc.collect()
+
+    assert errors == []
@@ -0,0 +1,26 @@
+from prometheus_client import REGISTRY
+
+from library.application.cache_tags import invalidate_tag
+
+
+class BrokenCacheTags:
+    async def tag(self, key, tags, ttl):
+        raise ConnectionError
+
+    async def invalidate_tag(self, tag):
+        raise ConnectionError
+
+
+def errors() -> float:
+    value = REGISTRY.get_sample_value(
+        "library_cache_errors_total", {"cache": "books", "operation": "invalidate"}
+    )
+    return value or 0.0
+
+
+async def test_invalidate_tag__errors_are_counted():
+    before = errors()
+
+    await invalidate_tag(BrokenCacheTags(), "books")
+
+    assert errors() == before + 1
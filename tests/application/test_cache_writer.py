@@ -0,0 +1,31 @@
+from aiocache import SimpleMemoryCache
+from prometheus_client import REGISTRY
+
+from library.application.cache_writer import CacheWriter
+
+
+def dropped() -> float:
+    return REGISTRY.get_sample_value("library_cache_writes_dropped_total") or 0.0
+
+
+async def test_cache_writer__flushes_on_close():
+    cache = SimpleMemoryCache()
+    writer = CacheWriter(cache, batch_size=2)
+    writer.start()
+
+    for i in range(5):
+        writer.put(f"key{i}", f"value{i}".encode(), ttl=10)
+    await writer.close()
+
+    assert await cache.multi_get(
+        [f"key{i}" for i in range(5)], loads_fn=lambda value: value
+    ) == [f"value{i}".encode() for i in range(5)]
+
+
+async def test_cache_writer__drops_when_full():
+    before = dropped()
+    writer = CacheWriter(SimpleMemoryCache(), max_size=1)
+
+    assert writer.put("key1", b"value", ttl=10)
+    assert not writer.put("key2", b"value", ttl=10)
+    assert dropped() == before + 1
@@ -0,0 +1,351 @@
+import asyncio
+import time
+
+import pytest
+from aiocache import BaseCache, SimpleMemoryCache
+from prometheus_client import REGISTRY
+
+from library.application.cache_writer import CacheWriter
+from library.application.cached import ICached, cached, evict
+from library.application.exceptions import EntityNotFoundException
+from library.application.reduced import Fence, StoreResult
+
+
+class NotFound(EntityNotFoundException):
+    def __init__(self, entity: type, entity_id: str) -> None:
+        super().__init__(entity=entity, entity_id=entity_id)
+        self.entity_id = entity_id
+
+
+class Counter(ICached):
+    def __init__(self, cache: BaseCache) -> None:
+        self._cache = cache
+        self.calls = 0
+
+    @cached(ttl=10)
+    async def fetch(self, value: str) -> str:
+        self.calls += 1
+        return f"{value}:{self.calls}"
+
+    @cached(ttl=10, stale_ttl=100)
+    async def fetch_stale(self, value: str) -> str:
+        self.calls += 1
+        return f"{value}:{self.calls}"
+
+    @cached(ttl=10, distributed=True)
+    async def fetch_distributed(self, value: str) -> str:
+        self.calls += 1
+        return f"{value}:{self.calls}"
+
+    @cached(ttl=10, distributed=True)
+    async def fetch_none_distributed(self, value: str) -> str | None:
+        self.calls += 1
+        return None
+
+    @cached(ttl=10, write_behind=True)
+    async def fetch_write_behind(self, value: str) -> str:
+        self.calls += 1
+        return f"{value}:{self.calls}"
+
+    @cached(ttl=10, tags=lambda value: [f"tag:{value}"])
+    async def fetch_tagged(self, value: str) -> str:
+        self.calls += 1
+        return f"{value}:{self.calls}"
+
+    @cached(ttl=10, tags=lambda value: [f"tag:{value}"], write_behind=True)
+    async def fetch_tagged_write_behind(self, value: str) -> str:
+        self.calls += 1
+        return f"{value}:{self.calls}"
+
+    @cached(ttl=10)
+    async def fetch_none(self, value: str) -> str | None:
+        self.calls += 1
+        return None
+
+    @cached(ttl=10, negative_ttl=1)
+    async def fetch_missing(self, value: str) -> str | None:
+        self.calls += 1
+        return None
+
+    @cached(ttl=10, empty_ttl=1)
+    async def fetch_empty(self, value: str) -> list[str]:
+        self.calls += 1
+        return []
+
+    @cached(
+        ttl=10,
+        negative_ttl=1,
+        negative_exceptions={
+            NotFound: lambda value: NotFound(entity=str, entity_id=value),
+        },
+    )
+    async def fetch_not_found(self, value: str) -> str:
+        self.calls += 1
+        raise NotFound(entity=str, entity_id=value)
+
+    @cached(ttl=10, stale_if_error=60, stale_if_error_exceptions=(ConnectionError,))
+    async def fetch_flaky(self, value: str) -> str:
+        self.calls += 1
+        if self.calls > 1:
+            raise ConnectionError
+        return f"{value}:{self.calls}"
+
+
+class BrokenCache(SimpleMemoryCache):
+    async def _get(self, *args, **kwargs):
+        raise ConnectionError
+
+    async def _set(self, *args, **kwargs):
+        raise ConnectionError
+
+    async def _delete(self, *args, **kwargs):
+        raise ConnectionError
+
+
+class RecordingCacheTags:
+    def __init__(self, *, broken: bool = False) -> None:
+        self.tagged: list[tuple[str, list[str]]] = []
+        self.broken = broken
+
+    async def tag(self, key, tags, ttl):
+        if self.broken:
+            raise ConnectionError
+        self.tagged.append((key, list(tags)))
+
+    async def invalidate_tag(self, tag):
+        return 0
+
+
+class FencedMemoryCache(SimpleMemoryCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.fences: list[Fence] = []
+
+    async def set_fenced(self, key, value, *, ttl, fence, dumps_fn=None):
+        self.fences.append(fence)
+        await self.set(key, value, ttl=ttl, dumps_fn=dumps_fn)
+        return True
+
+
+class RecordingSingleFlight:
+    def __init__(self, polls: int = 0) -> None:
+        self.idents: list[str] = []
+        self.results: list[StoreResult] = []
+        self.polls = polls
+
+    async def __call__(self, ident, *, compute, store, read):
+        self.idents.append(ident)
+        for _ in range(self.polls):
+            await read()
+        value = await compute()
+        self.results.append(await store(value, Fence(key=f"lock:{ident}", token="1")))
+        return value
+
+
+@pytest.fixture
+def counter() -> Counter:
+    return Counter(cache=SimpleMemoryCache())
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    class Clock:
+        now = time.time()
+
+        def shift(self, seconds: float) -> None:
+            self.now += seconds
+
+    clock = Clock()
+    monkeypatch.setattr(time, "time", lambda: clock.now)
+    return clock
+
+
+async def test_cached__hit(counter: Counter):
+    assert await counter.fetch("a") == "a:1"
+    assert await counter.fetch("a") == "a:1"
+    assert counter.calls == 1
+
+
+async def test_cached__expired_without_stale_ttl(counter: Counter, clock):
+    await counter.fetch("a")
+    clock.shift(11)
+    assert await counter.fetch("a") == "a:2"
+
+
+async def test_cached__stale_while_revalidate(counter: Counter, clock):
+    await counter.fetch_stale("a")
+    clock.shift(11)
+
+    assert await counter.fetch_stale("a") == "a:1"
+    assert await counter.fetch_stale("a") == "a:1"
+    await asyncio.sleep(0.01)
+
+    assert counter.calls == 2
+    assert await counter.fetch_stale("a") == "a:2"
+
+
+async def test_cached__hard_ttl_expired(counter: Counter, clock):
+    await counter.fetch_stale("a")
+    clock.shift(111)
+    assert await counter.fetch_stale("a") == "a:2"
+
+
+async def test_cached__distributed_miss_uses_single_flight():
+    cache = FencedMemoryCache()
+    counter = Counter(cache=cache)
+    single_flight = RecordingSingleFlight()
+    counter._single_flight = single_flight
+
+    assert await counter.fetch_distributed("a") == "a:1"
+    assert await counter.fetch_distributed("a") == "a:1"
+    assert len(single_flight.idents) == 1
+    assert cache.fences == [Fence(key=f"lock:{single_flight.idents[0]}", token="1")]
+    assert single_flight.results == [StoreResult.STORED]
+
+
+async def test_cached__uncacheable_result_skipped():
+    counter = Counter(cache=FencedMemoryCache())
+    single_flight = RecordingSingleFlight()
+    counter._single_flight = single_flight
+
+    await counter.fetch_none_distributed("a")
+
+    assert single_flight.results == [StoreResult.SKIPPED]
+
+
+async def test_cached__single_flight_polls_not_counted_as_misses():
+    def misses() -> float:
+        value = REGISTRY.get_sample_value(
+            "library_cache_misses_total",
+            {"cache": "Counter.fetch_distributed", "tier": "redis"},
+        )
+        return value or 0.0
+
+    before = misses()
+    counter = Counter(cache=FencedMemoryCache())
+    counter._single_flight = RecordingSingleFlight(polls=5)
+
+    await counter.fetch_distributed("a")
+
+    assert misses() - before == 1
+
+
+async def test_cached__none_not_cached_by_default(counter: Counter):
+    await counter.fetch_none("a")
+    await counter.fetch_none("a")
+    assert counter.calls == 2
+
+
+async def test_cached__negative_ttl(counter: Counter, clock):
+    assert await counter.fetch_missing("a") is None
+    assert await counter.fetch_missing("a") is None
+    assert counter.calls == 1
+
+    clock.shift(2)
+    await counter.fetch_missing("a")
+    assert counter.calls == 2
+
+
+async def test_cached__empty_ttl(counter: Counter, clock):
+    assert await counter.fetch_empty("a") == []
+    assert await counter.fetch_empty("a") == []
+    assert counter.calls == 1
+
+    clock.shift(2)
+    await counter.fetch_empty("a")
+    assert counter.calls == 2
+
+
+async def test_cached__negative_exception(counter: Counter):
+    for _ in range(2):
+        with pytest.raises(NotFound, match="str with id a not found") as exc_info:
+            await counter.fetch_not_found("a")
+        assert exc_info.value.entity_id == "a"
+    assert counter.calls == 1
+
+
+async def test_cached__write_behind(counter: Counter):
+    counter._cache_writer = CacheWriter(counter._cache)
+
+    assert await counter.fetch_write_behind("a") == "a:1"
+    assert not await counter._cache.raw("keys")
+
+    counter._cache_writer.start()
+    await counter._cache_writer.close()
+    assert await counter.fetch_write_behind("a") == "a:1"
+    assert counter.calls == 1
+
+
+async def test_cached__tags(counter: Counter):
+    cache_tags = RecordingCacheTags()
+    counter._cache_tags = cache_tags
+
+    await counter.fetch_tagged("a")
+    await counter.fetch_tagged("a")
+
+    assert [tags for _, tags in cache_tags.tagged] == [["tag:a"]]
+
+
+async def test_cached__tag_errors_skip_store(counter: Counter):
+    counter._cache_tags = RecordingCacheTags(broken=True)
+
+    assert await counter.fetch_tagged("a") == "a:1"
+    assert await counter.fetch_tagged("a") == "a:2"
+
+
+async def test_cached__write_behind_tags(counter: Counter):
+    cache_tags = RecordingCacheTags()
+    counter._cache_tags = cache_tags
+    counter._cache_writer = CacheWriter(counter._cache, tags=cache_tags)
+
+    await counter.fetch_tagged_write_behind("a")
+    assert not cache_tags.tagged
+
+    counter._cache_writer.start()
+    await counter._cache_writer.close()
+    assert [tags for _, tags in cache_tags.tagged] == [["tag:a"]]
+
+
+async def test_cached__backend_errors_fail_open():
+    def errors(operation: str) -> float:
+        value = REGISTRY.get_sample_value(
+            "library_cache_errors_total",
+            {"cache": "Counter.fetch", "operation": operation},
+        )
+        return value or 0.0
+
+    get_errors, set_errors = errors("get"), errors("set")
+    counter = Counter(cache=BrokenCache())
+
+    assert await counter.fetch("a") == "a:1"
+    assert errors("get") == get_errors + 1
+    assert errors("set") == set_errors + 1
+
+
+async def test_evict__errors_are_counted():
+    def errors() -> float:
+        value = REGISTRY.get_sample_value(
+            "library_cache_errors_total", {"cache": "book", "operation": "delete"}
+        )
+        return value or 0.0
+
+    before = errors()
+
+    await evict(BrokenCache(), "book:1", name="book")
+
+    assert errors() == before + 1
+
+
+async def test_cached__stale_if_error(counter: Counter, clock):
+    await counter.fetch_flaky("a")
+    clock.shift(11)
+
+    assert await counter.fetch_flaky("a") == "a:1"
+    assert counter.calls == 2
+
+
+async def test_cached__stale_if_error_without_entry(counter: Counter):
+    counter.calls = 1
+
+    with pytest.raises(ConnectionError):
+        await counter.fetch_flaky("a")
@@ -0,0 +1,78 @@
+import asyncio
+from contextlib import nullcontext
+
+import pytest
+
+from library.application.circuit_breaker import CircuitBreaker, CircuitState
+from library.application.exceptions import CircuitOpenException
+
+
+async def ok() -> str:
+    return "ok"
+
+
+async def fail() -> str:
+    raise ConnectionError
+
+
+async def slow() -> str:
+    await asyncio.sleep(0.02)
+    return "slow"
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    return CircuitBreaker(
+        name="test", min_calls=4, window=10, open_duration=0.05, **kwargs
+    )
+
+
+async def test_circuit_breaker__opens_on_failure_rate():
+    breaker = make_breaker()
+    for func in (ok, ok, fail, fail):
+        with pytest.raises(ConnectionError) if func is fail else nullcontext():
+            await breaker.call(func)
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenException):
+        await breaker.call(ok)
+
+
+async def test_circuit_breaker__opens_on_slow_calls():
+    breaker = make_breaker(slow_call_duration=0.01)
+    for _ in range(4):
+        await breaker.call(slow)
+
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_circuit_breaker__ignores_non_failures():
+    breaker = make_breaker()
+    for _ in range(4):
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail, is_failure=lambda e: False)
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_circuit_breaker__half_open_probe_closes():
+    breaker = make_breaker()
+    for _ in range(4):
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+    await asyncio.sleep(0.06)
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert await breaker.call(ok) == "ok"
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_circuit_breaker__half_open_probe_failure_reopens():
+    breaker = make_breaker()
+    for _ in range(4):
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+    await asyncio.sleep(0.06)
+
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+    assert breaker.state == CircuitState.OPEN
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from library.application.hedged import Hedger, LatencyTracker
+
+
+def sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name, {"client": "test"}) or 0.0
+
+
+class Source:
+    def __init__(self, delays: list[float]) -> None:
+        self.delays = delays
+        self.calls = 0
+        self.cancelled = 0
+
+    async def fetch(self) -> int:
+        call = self.calls
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delays[min(call, len(self.delays) - 1)])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return call
+
+
+def warm_hedger(**kwargs) -> Hedger:
+    hedger = Hedger(name="test", min_samples=10, **kwargs)
+    for _ in range(10):
+        hedger._tracker.record(0.01)
+    return hedger
+
+
+def test_latency_tracker__percentile():
+    tracker = LatencyTracker(percentile=0.9, min_samples=10, refresh_every=1)
+    for latency in range(1, 11):
+        tracker.record(latency / 10)
+
+    assert tracker.value == 1.0
+
+
+def test_latency_tracker__not_enough_samples():
+    tracker = LatencyTracker(min_samples=10)
+    tracker.record(0.1)
+
+    assert tracker.value is None
+
+
+async def test_hedger__fast_primary_is_not_hedged():
+    source = Source([0.001])
+    hedger = warm_hedger()
+
+    assert await hedger(source.fetch) == 0
+    assert source.calls == 1
+
+
+async def test_hedger__slow_primary_loses_to_hedge():
+    hedges, wins = (
+        sample("library_client_hedges_total"),
+        sample("library_client_hedge_wins_total"),
+    )
+    source = Source([1.0, 0.001])
+    hedger = warm_hedger()
+
+    assert await hedger(source.fetch) == 1
+    await asyncio.sleep(0)
+    assert source.cancelled == 1
+    assert sample("library_client_hedges_total") - hedges == 1
+    assert sample("library_client_hedge_wins_total") - wins == 1
+
+
+async def test_hedger__cancelled_primary_latency_recorded():
+    source = Source([1.0, 0.001])
+    hedger = warm_hedger()
+
+    await hedger(source.fetch)
+
+    samples = sorted(hedger._tracker._samples)
+    assert len(samples) == 12
+    assert samples[-1] > 0.01
+
+
+async def test_hedger__hedges_capped_by_ratio():
+    source = Source([0.05])
+    hedger = warm_hedger(max_ratio=0.1)
+
+    await asyncio.gather(*(hedger(source.fetch) for _ in range(5)))
+
+    assert source.calls == 6
+
+
+async def test_hedger__failed_hedge_waits_for_primary():
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise ConnectionError
+        await asyncio.sleep(0.05)
+        return "primary"
+
+    hedger = warm_hedger()
+
+    assert await hedger(fetch) == "primary"
+
+
+async def test_hedger__both_fail():
+    async def fetch() -> str:
+        await asyncio.sleep(0.02)
+        raise ConnectionError
+
+    hedger = warm_hedger()
+
+    with pytest.raises(ConnectionError):
+        await hedger(fetch)
@@ -0,0 +1,51 @@
+import time
+
+from library.application.local_cache import LocalCache, LocalCacheConfig
+
+
+def test_local_cache__get_missing():
+    cache = LocalCache(LocalCacheConfig())
+    assert cache.get("key") is None
+
+
+def test_local_cache__set_get():
+    cache = LocalCache(LocalCacheConfig())
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+
+def test_local_cache__expired(monkeypatch):
+    cache = LocalCache(LocalCacheConfig(ttl=10))
+    cache.set("key", "value")
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_local_cache__evict_by_entries():
+    cache = LocalCache(LocalCacheConfig(max_entries=2))
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_local_cache__evict_by_bytes():
+    cache = LocalCache(LocalCacheConfig(max_bytes=10, sizeof=len))
+    cache.set("a", "12345")
+    cache.set("b", "12345")
+    cache.set("c", "123")
+
+    assert cache.get("a") is None
+    assert cache.size == 8
+
+
+def test_local_cache__skip_too_large():
+    cache = LocalCache(LocalCacheConfig(max_bytes=4, sizeof=len))
+    cache.set("a", "12345")
+    assert len(cache) == 0
@@ -0,0 +1,23 @@
+import asyncio
+import time
+
+from library.application.rate_limit import TokenBucket
+
+
+async def test_token_bucket__burst_is_not_delayed():
+    bucket = TokenBucket(rate=1, capacity=5)
+
+    started_at = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert time.monotonic() - started_at < 0.05
+
+
+async def test_token_bucket__waits_for_refill():
+    bucket = TokenBucket(rate=20, capacity=1)
+
+    started_at = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+    assert time.monotonic() - started_at >= 0.09
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+import pytest
+
+from library.application.reduced import AsyncReducer
+
+
+class Source:
+    def __init__(self) -> None:
+        self.started = 0
+        self.finished = 0
+
+    async def fetch(self, delay: float = 0.05) -> int:
+        self.started += 1
+        await asyncio.sleep(delay)
+        self.finished += 1
+        return self.started
+
+
+async def test_reducer__coalesces_calls():
+    source = Source()
+    reducer = AsyncReducer()
+
+    results = await asyncio.gather(
+        reducer(source.fetch(), ident="key"),
+        reducer(source.fetch(), ident="key"),
+    )
+
+    assert results == [1, 1]
+    assert source.started == 1
+
+
+async def test_reducer__cancels_orphaned_call():
+    source = Source()
+    reducer = AsyncReducer()
+
+    waiter = asyncio.create_task(reducer(source.fetch(), ident="key"))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    await asyncio.sleep(0.1)
+
+    assert source.started == 1
+    assert source.finished == 0
+
+
+async def test_reducer__keeps_call_with_remaining_waiters():
+    source = Source()
+    reducer = AsyncReducer()
+
+    first = asyncio.create_task(reducer(source.fetch(), ident="key"))
+    second = asyncio.create_task(reducer(source.fetch(), ident="key"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == 1
+    assert source.finished == 1
+
+
+async def test_reducer__grace_period_allows_rejoin():
+    source = Source()
+    reducer = AsyncReducer(grace_period=0.05)
+
+    waiter = asyncio.create_task(reducer(source.fetch(0.1), ident="key"))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    await asyncio.sleep(0.01)
+
+    assert await reducer(source.fetch(0.1), ident="key") == 1
+    assert source.started == 1
+
+
+async def test_reducer__scheduled_call_not_cancelled():
+    source = Source()
+    reducer = AsyncReducer()
+
+    reducer.schedule(source.fetch(), ident="key")
+    await asyncio.sleep(0.1)
+
+    assert source.finished == 1
+
+
+async def test_reducer__linger_reuses_result():
+    source = Source()
+    reducer = AsyncReducer()
+
+    assert await reducer(source.fetch(0), ident="key", linger=10) == 1
+    assert await reducer(source.fetch(0), ident="key", linger=10) == 1
+    assert source.started == 1
+
+
+async def test_reducer__linger_expires(monkeypatch):
+    source = Source()
+    reducer = AsyncReducer()
+
+    await reducer(source.fetch(0), ident="key", linger=10)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+
+    assert await reducer(source.fetch(0), ident="key", linger=10) == 2
+
+
+async def test_reducer__linger_bounded():
+    source = Source()
+    reducer = AsyncReducer(max_lingering=1)
+
+    await reducer(source.fetch(0), ident="first", linger=10)
+    await reducer(source.fetch(0), ident="second", linger=10)
+
+    assert await reducer(source.fetch(0), ident="first", linger=10) == 3
+
+
+async def test_reducer__linger_skips_errors():
+    reducer = AsyncReducer()
+
+    async def fail() -> int:
+        raise ConnectionError
+
+    with pytest.raises(ConnectionError):
+        await reducer(fail(), ident="key", linger=10)
+
+    assert await reducer(Source().fetch(0), ident="key", linger=10) == 1
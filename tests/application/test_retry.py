@@ -0,0 +1,30 @@
+from library.application.retry import RetryBudget, backoff_delay
+
+
+def test_backoff_delay__capped():
+    delays = [backoff_delay(10, base=0.1, cap=1.0) for _ in range(100)]
+
+    assert all(0 <= delay <= 1.0 for delay in delays)
+
+
+def test_backoff_delay__first_attempt():
+    assert backoff_delay(0, base=0.1, cap=10.0) <= 0.1
+
+
+def test_retry_budget__exhausted():
+    budget = RetryBudget(ratio=0.1, min_per_second=0, capacity=2)
+
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_retry_budget__deposits_allow_retries():
+    budget = RetryBudget(ratio=0.5, min_per_second=0, capacity=2)
+    budget.withdraw()
+    budget.withdraw()
+
+    budget.deposit()
+    budget.deposit()
+
+    assert budget.withdraw()
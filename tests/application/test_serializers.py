@@ -0,0 +1,53 @@
+import pickle
+
+from library.application.serializers import CacheCodec, get_codec
+from library.domains.entities.open_library import (
+    OpenLibraryBook,
+    OpenLibrarySearchResult,
+)
+
+RESULT = OpenLibrarySearchResult(
+    books=[OpenLibraryBook(key="key", title="Title", authors=["Author"])],
+    total=1,
+    start=0,
+    offset=0,
+)
+
+
+def test_cache_codec__roundtrip():
+    codec = CacheCodec(OpenLibrarySearchResult)
+    assert codec.loads(codec.dumps(RESULT)) == RESULT
+
+
+def test_cache_codec__missing():
+    codec = CacheCodec(OpenLibrarySearchResult)
+    assert codec.loads(None) is None
+
+
+def test_cache_codec__version_mismatch():
+    old = CacheCodec(OpenLibrarySearchResult, version="old")
+    new = CacheCodec(OpenLibrarySearchResult)
+    assert new.loads(old.dumps(RESULT)) is None
+
+
+def test_cache_codec__legacy_pickle_payload():
+    codec = CacheCodec(OpenLibrarySearchResult)
+    assert codec.loads(pickle.dumps(RESULT)) is None
+
+
+def test_get_codec__registered_once():
+    assert get_codec(OpenLibrarySearchResult) is get_codec(OpenLibrarySearchResult)
+
+
+def test_cache_codec__smaller_than_pickle():
+    result = OpenLibrarySearchResult(
+        books=[
+            OpenLibraryBook(key=f"key{i}", title=f"Title {i}", authors=["Author"])
+            for i in range(100)
+        ],
+        total=100,
+        start=0,
+        offset=0,
+    )
+    codec = CacheCodec(OpenLibrarySearchResult)
+    assert len(codec.dumps(result)) < len(pickle.dumps(result, protocol=5))
@@ -0,0 +1,30 @@
+from collections.abc import AsyncIterator, Iterable
+
+from library.application.streams import abatched, aunique
+
+
+async def agen[T](items: Iterable[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
+
+
+async def test_aunique__drops_duplicates():
+    result = [item async for item in aunique(agen([1, 2, 1, 3, 2]))]
+
+    assert result == [1, 2, 3]
+
+
+async def test_aunique__forgets_oldest():
+    result = [item async for item in aunique(agen([1, 2, 3, 1]), max_size=2)]
+
+    assert result == [1, 2, 3, 1]
+
+
+async def test_abatched():
+    result = [batch async for batch in abatched(agen(range(5)), 2)]
+
+    assert result == [[0, 1], [2, 3], [4]]
+
+
+async def test_abatched__empty():
+    assert [batch async for batch in abatched(agen([]), 2)] == []
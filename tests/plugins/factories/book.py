@@ -1,6 +1,7 @@
 from collections.abc import Callable
 
 import pytest
+from polyfactory import Ignore
 from polyfactory.factories.sqlalchemy_factory import SQLAlchemyFactory
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,6 +9,8 @@ from library.adapters.database.tables import BookTable
 
 
 class BookTableFactory(SQLAlchemyFactory[BookTable]):
+    fingerprint = Ignore()
+
     @classmethod
     def deleted_at(cls) -> None:
         return None
@@ -1,9 +1,11 @@
 import pytest
 
 from library.adapters.database.storages.book import BookStorage
+from library.adapters.database.storages.upload import UploadCheckpointStorage
 from library.adapters.database.storages.user import UserStorage
 from library.adapters.database.uow import SqlalchemyUow
 from library.domains.interfaces.storages.book import IBookStorage
+from library.domains.interfaces.storages.upload import IUploadCheckpointStorage
 from library.domains.interfaces.storages.user import IUserStorage
 
 
@@ -15,3 +17,8 @@ def book_storage(uow: SqlalchemyUow) -> IBookStorage:
 @pytest.fixture
 def user_storage(uow: SqlalchemyUow) -> IUserStorage:
     return UserStorage(uow=uow)
+
+
+@pytest.fixture
+def upload_checkpoint_storage(uow: SqlalchemyUow) -> IUploadCheckpointStorage:
+    return UploadCheckpointStorage(uow=uow)
@@ -1,9 +1,11 @@
+from uuid import UUID
+
 from asyncly.srvmocker import MockService
 from faststream.nats import NatsBroker
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from library.adapters.database.tables import BookTable
+from library.adapters.database.tables import BookTable, UploadCheckpointTable
 from library.presentors.faststream.handlers.books import upload_open_library_books
 from tests.plugins.instances.open_library import OpenLibrarySearchResponse
 
@@ -34,3 +36,70 @@ async def test_upload_books(
 
     stmt = select(BookTable).where(BookTable.title == "Test title")
     assert (await session.scalars(stmt)).one()
+
+
+async def test_upload_books__all_pages(
+    faststream_client: NatsBroker,
+    session: AsyncSession,
+    open_library_service: MockService,
+):
+    open_library_service.register(
+        "search",
+        OpenLibrarySearchResponse(
+            books=[
+                {
+                    "author_name": ["Paged author"],
+                    "title": f"Paged title {i}",
+                    "key": f"paged-{i}",
+                }
+                for i in range(250)
+            ]
+        ),
+    )
+    await faststream_client.publish(
+        message={"queries": ["first", "second"]},
+        subject="books.upload_open_library",
+        stream="base_stream",
+    )
+    await upload_open_library_books.wait_call(timeout=3)
+
+    stmt = select(BookTable).where(BookTable.author == "Paged author")
+    assert len((await session.scalars(stmt)).all()) == 250
+    assert len(open_library_service.history_map["search"]) == 6
+
+
+async def test_upload_books__resumes_from_checkpoint(
+    faststream_client: NatsBroker,
+    session: AsyncSession,
+    open_library_service: MockService,
+):
+    upload_id = UUID(int=1)
+    session.add(
+        UploadCheckpointTable(upload_id=upload_id, query="test", offset=200, total=250)
+    )
+    await session.commit()
+    open_library_service.register(
+        "search",
+        OpenLibrarySearchResponse(
+            books=[
+                {
+                    "author_name": ["Resumed author"],
+                    "title": f"Resumed title {i}",
+                    "key": f"resumed-{i}",
+                }
+                for i in range(250)
+            ]
+        ),
+    )
+    await faststream_client.publish(
+        message={"queries": ["test"], "upload_id": str(upload_id)},
+        subject="books.upload_open_library",
+        stream="base_stream",
+    )
+    await upload_open_library_books.wait_call(timeout=3)
+
+    stmt = select(BookTable).where(BookTable.author == "Resumed author")
+    assert len((await session.scalars(stmt)).all()) == 50
+    checkpoint = await session.get(UploadCheckpointTable, (upload_id, "test"))
+    await session.refresh(checkpoint)
+    assert checkpoint.offset == 300
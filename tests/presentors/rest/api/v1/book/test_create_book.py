@@ -99,3 +99,19 @@ async def test_create_book__duplicate_conflict(client: AsyncClient):
         json=book_data,
     )
     assert response.status_code == HTTPStatus.CONFLICT
+
+
+async def test_create_book__invalidates_cached_book_list(client: AsyncClient):
+    await client.get(API_URL)
+
+    await client.post(
+        API_URL,
+        json={
+            "title": "Test book",
+            "author": "Test author",
+            "year": 2024,
+        },
+    )
+
+    response = await client.get(API_URL)
+    assert response.json()["total"] == 1
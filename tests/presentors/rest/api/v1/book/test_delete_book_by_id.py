@@ -42,3 +42,15 @@ async def test_delete_book_by_id__double_delete__not_found(
     await client.delete(api_url(book_id=UUID_1))
     response = await client.delete(api_url(book_id=UUID_1))
     assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+async def test_delete_book_by_id__invalidates_cached_book(
+    client: AsyncClient, create_book
+):
+    await create_book(id=UUID_1)
+    await client.get(api_url(book_id=UUID_1))
+
+    await client.delete(api_url(book_id=UUID_1))
+
+    response = await client.get(api_url(book_id=UUID_1))
+    assert response.status_code == HTTPStatus.NOT_FOUND
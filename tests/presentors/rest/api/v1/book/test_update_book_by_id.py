@@ -89,3 +89,13 @@ async def test_update_book__conflict(client: AsyncClient, create_book):
         },
     )
     assert response.status_code == HTTPStatus.CONFLICT
+
+
+async def test_update_book__invalidates_cached_book(client: AsyncClient, create_book):
+    book = await create_book()
+    await client.get(api_url(book.id))
+
+    await client.patch(api_url(book.id), json={"title": "Test book"})
+
+    response = await client.get(api_url(book.id))
+    assert response.json()["title"] == "Test book"
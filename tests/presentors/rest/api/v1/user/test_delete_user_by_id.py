@@ -42,3 +42,15 @@ async def test_delete_user_by_id__double_delete__not_found(
     await client.delete(api_url(user_id=UUID_1))
     response = await client.delete(api_url(user_id=UUID_1))
     assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+async def test_delete_user_by_id__invalidates_cached_user(
+    client: AsyncClient, create_db_user_factory
+):
+    await create_db_user_factory(id=UUID_1)
+    await client.get(api_url(user_id=UUID_1))
+
+    await client.delete(api_url(user_id=UUID_1))
+
+    response = await client.get(api_url(user_id=UUID_1))
+    assert response.status_code == HTTPStatus.NOT_FOUND
@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import (
 TABLES_FOR_TRUNCATE: Sequence[str] = (
     "books",
     "users",
+    "upload_checkpoints",
 )
 
 